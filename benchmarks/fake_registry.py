@@ -0,0 +1,295 @@
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+BASE_DATE = datetime(2015, 1, 1, tzinfo=timezone.utc)
+
+_INDEX = re.compile(r'(\d+)$')
+_SOLR_CLAUSE = re.compile(r'g:"([^"]+)" AND a:"([^"]+)"(?: AND v:"([^"]+)")?')
+
+
+class FakeRegistryData:
+    def __init__(self, versions: int = 50, padding: int = 0):
+        self.versions = versions
+        self.padding = padding
+
+    def package_index(self, name: str) -> Optional[int]:
+        match = _INDEX.search(name)
+        return int(match.group(1)) if match else None
+
+    def version_list(self, index: int) -> List[str]:
+        return [f"1.{minor}.0" for minor in range(self.versions)]
+
+    def release_date(self, index: int, version: str) -> datetime:
+        minor = int(version.split('.')[1])
+        return BASE_DATE + timedelta(days=minor * 14, minutes=index % 1440)
+
+    def filler(self) -> str:
+        return 'x' * self.padding
+
+
+class FakeRegistryServer:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, error_rate: float = 0.0, versions: int = 50,
+                 padding: int = 0, seed: int = 0):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.data = FakeRegistryData(versions, padding)
+        self.random = random.Random(seed)
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _FakeRegistryHandler)
+        self._server.daemon_threads = True
+        self._server.registry = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeRegistryServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-registry', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {}
+
+    def repositories(self) -> Dict[str, List[Dict]]:
+        return {
+            'maven': [{
+                'name': 'fake-maven',
+                'url': f"{self.url}/maven2",
+                'search_url': f"{self.url}/solrsearch/select"
+            }],
+            'npm': [{'name': 'fake-npm', 'url': f"{self.url}/npm"}],
+            'pypi': [{
+                'name': 'fake-pypi',
+                'url': f"{self.url}/pypi",
+                'simple_url': f"{self.url}/simple"
+            }],
+            'nuget': [{
+                'name': 'fake-nuget',
+                'url': f"{self.url}/nuget/flat",
+                'service_index': f"{self.url}/nuget/v3/index.json"
+            }]
+        }
+
+    def _record(self, ecosystem: str, size: int) -> None:
+        with self._lock:
+            stats = self.stats.setdefault(ecosystem, {'requests': 0, 'bytes': 0})
+            stats['requests'] += 1
+            stats['bytes'] += size
+
+    def _delay(self) -> float:
+        with self._lock:
+            return self.latency + self.random.uniform(0, self.jitter) if self.jitter else self.latency
+
+    def _should_fail(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self.random.random() < self.error_rate
+
+
+class _FakeRegistryHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        registry: FakeRegistryServer = self.server.registry
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.split('/') if part]
+        ecosystem = {'maven2': 'maven', 'solrsearch': 'maven', 'simple': 'pypi'}.get(parts[0], parts[0]) if parts else ''
+
+        delay = registry._delay()
+        if delay:
+            time.sleep(delay)
+
+        if registry._should_fail():
+            self._send(ecosystem, 503, b'{"error": "unavailable"}', extra_headers=(('Retry-After', '0'),))
+            return
+
+        handler = {
+            'npm': self._npm,
+            'pypi': self._pypi,
+            'simple': self._simple,
+            'maven2': self._maven_metadata,
+            'solrsearch': self._solr,
+            'nuget': self._nuget
+        }.get(parts[0] if parts else '')
+
+        response = handler(registry.data, parts[1:], parse_qs(url.query)) if handler else None
+        if response is None:
+            self._send(ecosystem, 404, b'{"error": "not found"}')
+            return
+
+        body, content_type = response
+        self._send(ecosystem, 200, body, content_type)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, ecosystem: str, status: int, body: bytes, content_type: str = 'application/json',
+              extra_headers: Tuple[Tuple[str, str], ...] = ()):
+        self.server.registry._record(ecosystem, len(body))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in extra_headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _npm(self, data: FakeRegistryData, parts: List[str], query) -> Optional[Tuple[bytes, str]]:
+        name = '/'.join(parts)
+        index = data.package_index(name)
+        if index is None:
+            return None
+
+        versions = data.version_list(index)
+        packument = {
+            'name': name,
+            'dist-tags': {'latest': versions[-1]},
+            'versions': {v: {'name': name, 'version': v, 'description': data.filler()} for v in versions}
+        }
+        # Like registry.npmjs.org, abbreviated documents carry no publish times
+        if not self.headers.get('Accept', '').startswith('application/vnd.npm.install-v1+json'):
+            packument['time'] = {v: data.release_date(index, v).isoformat().replace('+00:00', 'Z') for v in versions}
+        return json.dumps(packument).encode('utf-8'), 'application/json'
+
+    def _pypi(self, data: FakeRegistryData, parts: List[str], query) -> Optional[Tuple[bytes, str]]:
+        if not parts or parts[-1] != 'json':
+            return None
+        index = data.package_index(parts[0])
+        if index is None:
+            return None
+
+        def files(version: str) -> List[Dict]:
+            uploaded = data.release_date(index, version).isoformat().replace('+00:00', 'Z')
+            return [{
+                'filename': f"{parts[0].replace('-', '_')}-{version}-py3-none-any.whl",
+                'upload_time': uploaded[:19],
+                'upload_time_iso_8601': uploaded,
+                'comment_text': data.filler()
+            }]
+
+        if len(parts) == 3:
+            return json.dumps({'info': {'version': parts[1]}, 'urls': files(parts[1])}).encode('utf-8'), 'application/json'
+
+        versions = data.version_list(index)
+        document = {
+            'info': {'name': parts[0], 'version': versions[-1]},
+            'releases': {v: files(v) for v in versions}
+        }
+        return json.dumps(document).encode('utf-8'), 'application/json'
+
+    def _simple(self, data: FakeRegistryData, parts: List[str], query) -> Optional[Tuple[bytes, str]]:
+        if not parts:
+            return None
+        index = data.package_index(parts[0])
+        if index is None or 'application/vnd.pypi.simple.v1+json' not in self.headers.get('Accept', ''):
+            return None
+
+        versions = data.version_list(index)
+        document = {
+            'meta': {'api-version': '1.1'},
+            'name': parts[0],
+            'versions': versions,
+            'files': [{
+                'filename': f"{parts[0].replace('-', '_')}-{v}-py3-none-any.whl",
+                'url': f"https://files.example/{parts[0]}/{v}/{data.filler()}",
+                'hashes': {},
+                'upload-time': data.release_date(index, v).isoformat().replace('+00:00', 'Z')
+            } for v in versions]
+        }
+        return json.dumps(document).encode('utf-8'), 'application/vnd.pypi.simple.v1+json'
+
+    def _maven_metadata(self, data: FakeRegistryData, parts: List[str], query) -> Optional[Tuple[bytes, str]]:
+        if len(parts) < 3 or parts[-1] != 'maven-metadata.xml' or not parts[-2].startswith('artifact-'):
+            return None
+
+        index = data.package_index(parts[-2])
+        versions = data.version_list(index)
+        last_updated = data.release_date(index, versions[-1]).strftime('%Y%m%d%H%M%S')
+        version_tags = ''.join(f"<version>{v}</version>" for v in versions)
+        document = (
+            f"<?xml version=\"1.0\" encoding=\"UTF-8\"?><metadata><groupId>{'.'.join(parts[:-2])}</groupId>"
+            f"<artifactId>{parts[-2]}</artifactId><versioning><latest>{versions[-1]}</latest>"
+            f"<release>{versions[-1]}</release><versions>{version_tags}</versions>"
+            f"<lastUpdated>{last_updated}</lastUpdated></versioning></metadata>"
+        )
+        return document.encode('utf-8'), 'application/xml'
+
+    def _solr(self, data: FakeRegistryData, parts: List[str], query) -> Optional[Tuple[bytes, str]]:
+        clauses = _SOLR_CLAUSE.findall(query.get('q', [''])[0])
+        gav = query.get('core', [''])[0] == 'gav'
+
+        docs = []
+        for group_id, artifact_id, version in clauses:
+            index = data.package_index(artifact_id)
+            if index is None:
+                continue
+            versions = data.version_list(index)
+            if gav:
+                wanted = [version] if version else list(reversed(versions))
+                docs.extend({
+                    'g': group_id, 'a': artifact_id, 'v': v,
+                    'timestamp': int(data.release_date(index, v).timestamp() * 1000)
+                } for v in wanted if v in versions)
+            else:
+                docs.append({
+                    'g': group_id, 'a': artifact_id, 'latestVersion': versions[-1],
+                    'timestamp': int(data.release_date(index, versions[-1]).timestamp() * 1000)
+                })
+
+        start = int(query.get('start', ['0'])[0])
+        rows = int(query.get('rows', ['20'])[0])
+        document = {'response': {'numFound': len(docs), 'start': start, 'docs': docs[start:start + rows]}}
+        return json.dumps(document).encode('utf-8'), 'application/json'
+
+    def _nuget(self, data: FakeRegistryData, parts: List[str], query) -> Optional[Tuple[bytes, str]]:
+        base = f"http://{self.headers.get('Host')}/nuget"
+        if parts == ['v3', 'index.json']:
+            document = {'version': '3.0.0', 'resources': [
+                {'@id': f"{base}/registration/", '@type': 'RegistrationsBaseUrl/3.6.0'},
+                {'@id': f"{base}/flat/", '@type': 'PackageBaseAddress/3.0.0'}
+            ]}
+            return json.dumps(document).encode('utf-8'), 'application/json'
+
+        if len(parts) != 3 or parts[2] != 'index.json':
+            return None
+        index = data.package_index(parts[1])
+        if index is None:
+            return None
+        versions = data.version_list(index)
+
+        if parts[0] == 'flat':
+            return json.dumps({'versions': versions}).encode('utf-8'), 'application/json'
+
+        if parts[0] == 'registration':
+            leaves = [{
+                'catalogEntry': {
+                    'id': parts[1], 'version': v, 'listed': True, 'description': data.filler(),
+                    'published': data.release_date(index, v).isoformat()
+                }
+            } for v in versions]
+            document = {'count': 1, 'items': [{
+                '@id': f"{base}/registration/{parts[1]}/index.json#page/{versions[0]}/{versions[-1]}",
+                'lower': versions[0], 'upper': versions[-1], 'count': len(leaves), 'items': leaves
+            }]}
+            return json.dumps(document).encode('utf-8'), 'application/json'
+
+        return None
@@ -0,0 +1,198 @@
+"""Benchmark the libyear pipeline against a local fake registry.
+
+Run from the repository root:
+
+    python -m benchmarks.run_benchmark --sizes 100,1000,10000 --latency-ms 20 --error-rate 0.01
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import yaml
+
+from .fake_registry import FakeRegistryServer
+from .synthetic_sbom import ECOSYSTEMS, write_sbom
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))]
+
+
+def _peak_memory_mb() -> float:
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_size(config_path: str, sbom_path: str, workers: int, results) -> None:
+    from sbom_libyear.core import LibyearCalculator
+    from sbom_libyear.utils import ConfigLoader, configure_cache, configure_http_client
+
+    config_loader = ConfigLoader(config_path)
+    configure_http_client(config_loader, workers)
+    configure_cache(config_loader, no_cache=True)
+    calculator = LibyearCalculator(config_loader, workers)
+
+    latencies: List[float] = []
+    get_package_info = calculator.registry_manager.get_package_info
+
+    def timed_get_package_info(component):
+        started = time.perf_counter()
+        try:
+            return get_package_info(component)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    calculator.registry_manager.get_package_info = timed_get_package_info
+    get_package_info_async = calculator.registry_manager.get_package_info_async
+
+    async def timed_get_package_info_async(component):
+        started = time.perf_counter()
+        try:
+            return await get_package_info_async(component)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    calculator.registry_manager.get_package_info_async = timed_get_package_info_async
+
+    started = time.perf_counter()
+    lookup_results = calculator.calculate_from_sbom(sbom_path)
+    elapsed = time.perf_counter() - started
+
+    results.put({
+        'components': len(lookup_results),
+        'errors': len([r for r in lookup_results if r.error]),
+        'seconds': elapsed,
+        'components_per_second': len(lookup_results) / elapsed if elapsed else 0.0,
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+        'peak_memory_mb': _peak_memory_mb()
+    })
+
+
+def _wait_for_measurement(process, results, poll_seconds: float = 1.0) -> Optional[Dict]:
+    # A crashed or killed child never puts its measurement, so poll instead of blocking forever
+    while True:
+        try:
+            return results.get(timeout=poll_seconds)
+        except queue.Empty:
+            if process.exitcode is None:
+                continue
+        # The child may have put its measurement right before exiting
+        try:
+            return results.get(timeout=poll_seconds)
+        except queue.Empty:
+            return None
+
+
+def _write_config(path: str, server: FakeRegistryServer, args) -> None:
+    config = {
+        'repositories': server.repositories(),
+        'http': {
+            'timeout': 30,
+            'retries': 3,
+            'backoff_factor': 0.05,
+            'max_backoff': 1,
+            'workers': args.workers,
+            'backend': args.backend,
+            'concurrency': {ecosystem: args.workers for ecosystem in ECOSYSTEMS}
+        },
+        'cache': {'enabled': False}
+    }
+    with open(path, 'w', encoding='utf-8') as config_file:
+        yaml.safe_dump(config, config_file)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run_benchmark',
+        description='Measures throughput, lookup latency and peak memory against a local fake registry'
+    )
+    parser.add_argument('--sizes', default='100,1000,10000',
+                        help='Comma separated SBOM sizes in components (default: 100,1000,10000)')
+    parser.add_argument('--distinct-ratio', type=float, default=0.5,
+                        help='Share of distinct packages among the components (default: 0.5)')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='Registry response latency (default: 20)')
+    parser.add_argument('--jitter-ms', type=float, default=5.0, help='Random extra latency (default: 5)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Share of registry requests answered with 503 (default: 0)')
+    parser.add_argument('--versions', type=int, default=50, help='Versions per package (default: 50)')
+    parser.add_argument('--payload-padding', type=int, default=0,
+                        help='Extra bytes per version entry to enlarge registry documents (default: 0)')
+    parser.add_argument('--workers', type=int, default=32, help='Parallel registry lookups (default: 32)')
+    parser.add_argument('--backend', choices=['requests', 'async'], default='requests',
+                        help='HTTP backend to benchmark (default: requests)')
+    parser.add_argument('--json', dest='json_path', help='Write the measurements to this JSON file')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    server = FakeRegistryServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                                versions=args.versions, padding=args.payload_padding).start()
+    context = multiprocessing.get_context('spawn')
+    measurements: List[Dict] = []
+    failed: List[int] = []
+
+    print(f"{'components':>10} {'comp/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak MB':>9} "
+          f"{'requests':>9} {'MB recv':>9} {'errors':>7}")
+
+    with tempfile.TemporaryDirectory(prefix='sbom-libyear-bench-') as workdir:
+        config_path = os.path.join(workdir, 'config.yaml')
+        _write_config(config_path, server, args)
+
+        try:
+            for size in sizes:
+                sbom_path = write_sbom(os.path.join(workdir, f"sbom-{size}.cdx.json"), size,
+                                       versions=args.versions, distinct_ratio=args.distinct_ratio)
+                server.reset_stats()
+
+                results = context.Queue()
+                # A fresh process per size keeps ConfigLoader, caches and ru_maxrss independent
+                process = context.Process(target=_run_size, args=(config_path, sbom_path, args.workers, results))
+                process.start()
+                measurement = _wait_for_measurement(process, results)
+                process.join()
+
+                if measurement is None:
+                    failed.append(size)
+                    measurements.append({'size': size, 'failed': True, 'exitcode': process.exitcode})
+                    print(f"{size:>10} failed: benchmark process exited with code {process.exitcode}")
+                    continue
+
+                measurement['size'] = size
+                measurement['registry'] = dict(server.stats)
+                measurement['requests'] = sum(stats['requests'] for stats in server.stats.values())
+                measurement['bytes'] = sum(stats['bytes'] for stats in server.stats.values())
+                measurements.append(measurement)
+
+                print(f"{size:>10} {measurement['components_per_second']:>10.1f} {measurement['p50_ms']:>9.2f} "
+                      f"{measurement['p99_ms']:>9.2f} {measurement['peak_memory_mb']:>9.1f} "
+                      f"{measurement['requests']:>9} {measurement['bytes'] / (1024 * 1024):>9.2f} "
+                      f"{measurement['errors']:>7}")
+        finally:
+            server.stop()
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as json_file:
+            json.dump({'settings': vars(args), 'results': measurements}, json_file, indent=2)
+
+    if failed:
+        print(f"Failed sizes: {', '.join(str(size) for size in failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
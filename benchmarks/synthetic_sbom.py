@@ -0,0 +1,41 @@
+import json
+import random
+from typing import Dict, Iterator, Sequence
+
+ECOSYSTEMS = ('npm', 'pypi', 'maven', 'nuget')
+
+
+def component_purl(ecosystem: str, index: int, version: str) -> str:
+    if ecosystem == 'maven':
+        return f"pkg:maven/org.bench.group{index % 50}/artifact-{index}@{version}"
+    if ecosystem == 'nuget':
+        return f"pkg:nuget/Bench.Pkg{index}@{version}"
+    return f"pkg:{ecosystem}/bench-pkg-{index}@{version}"
+
+
+def iter_components(size: int, versions: int = 50, distinct_ratio: float = 0.5,
+                    ecosystems: Sequence[str] = ECOSYSTEMS, seed: int = 0) -> Iterator[Dict]:
+    rng = random.Random(seed)
+    distinct = max(1, int(size * distinct_ratio))
+
+    for position in range(size):
+        index = rng.randrange(distinct)
+        ecosystem = ecosystems[index % len(ecosystems)]
+        version = f"1.{rng.randrange(versions)}.0"
+        purl = component_purl(ecosystem, index, version)
+        yield {
+            'type': 'library',
+            'bom-ref': f"{purl}#{position}",
+            'name': purl.split('/')[-1].split('@')[0],
+            'version': version,
+            'purl': purl
+        }
+
+
+def write_sbom(path: str, size: int, **options) -> str:
+    with open(path, 'w', encoding='utf-8') as sbom_file:
+        sbom_file.write('{"bomFormat": "CycloneDX", "specVersion": "1.5", "version": 1, "components": [')
+        for position, component in enumerate(iter_components(size, **options)):
+            sbom_file.write((',' if position else '') + json.dumps(component))
+        sbom_file.write(']}')
+    return path
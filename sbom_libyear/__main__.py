@@ -1,12 +1,14 @@
 import argparse
+import json
 import logging
 import sys
 from dataclasses import asdict
 from pathlib import Path
 
-from .core import LibyearCalculator
-from .reports import JSONReportGenerator, TextReportGenerator
-from .utils import ConfigLoader, HttpClient
+from .core import (Baseline, BatchAnalyzer, FleetAggregator, LibyearCalculator, LibyearService,
+                   ReleaseIndexBuilder, SnapshotExporter, create_server)
+from .reports import ColumnarReportGenerator, JSONReportGenerator, NDJSONReportGenerator, TextReportGenerator
+from .utils import ConfigLoader, Metrics, ReleaseIndex, SnapshotStore, configure_cache, configure_http_client
 
 
 def setup_logging(verbose: bool, debug: bool):
@@ -22,7 +24,442 @@ def setup_logging(verbose: bool, debug: bool):
     )
 
 
-def main():
+def write_metrics_file(path: str, snapshot: dict):
+    with open(path, 'w', encoding='utf-8') as metrics_file:
+        metrics_file.write(Metrics.to_openmetrics(snapshot))
+
+
+def batch_main(argv):
+    parser = argparse.ArgumentParser(
+        prog='sbom-libyear batch',
+        description='Calculates libyear metrics for many SBOM files in one run',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Inputs can be SBOM files, directories (searched recursively for .json/.xml),
+glob patterns or @list-file (one SBOM path per line).
+
+Examples:
+  %(prog)s sboms/ --output-dir reports/
+  %(prog)s 'builds/**/*.cdx.json' --output-dir reports/ --processes 8
+  %(prog)s @nightly-sboms.txt --output-dir reports/ --max-libyears 50
+  %(prog)s sboms/ --output-dir reports/ --dataset-dir libyear-dataset/
+"""
+    )
+    
+    parser.add_argument('inputs', nargs='+', help='SBOM files, directories, glob patterns or @list-file')
+    parser.add_argument('--output-dir', '-d', required=True,
+                       help='Directory for per-SBOM JSON reports and summary.json')
+    parser.add_argument('--config', '-c', help='Path to configuration file (config.yaml)')
+    parser.add_argument('--processes', '-p', type=int,
+                       help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--workers', type=int,
+                       help='Parallel registry lookups per process (default: http.workers from config)')
+    parser.add_argument('--max-libyears', type=float,
+                       help='Maximum allowed libyears per SBOM. If exceeded, exit code 1 is returned')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the persistent registry response cache')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore cached registry responses and re-download them')
+    parser.add_argument('--snapshot',
+                       help='Resolve release dates offline from a snapshot created with "snapshot export"')
+    parser.add_argument('--release-index',
+                       help='Look up release dates in an index built with "index ingest" before querying registries')
+    parser.add_argument('--baseline-dir',
+                       help='Directory with previous batch reports; unchanged components are reused from them')
+    parser.add_argument('--baseline-max-age', type=float, default=7.0,
+                       help='Days after which reused baseline results are looked up again (default: 7)')
+    parser.add_argument('--metrics', action='store_true',
+                       help='Add timing and registry request metrics to the reports and summary.json')
+    parser.add_argument('--metrics-file',
+                       help='Write the metrics of all SBOMs as a Prometheus/OpenMetrics text file')
+    parser.add_argument('--columnar', action='store_true',
+                       help='Keep results in compact columnar arrays to reduce memory for very large SBOMs')
+    parser.add_argument('--dataset-dir',
+                       help='Append the component results to a Parquet/CSV dataset in this directory')
+    parser.add_argument('--dataset-format', choices=['parquet', 'csv'],
+                       help='Dataset file format (default: parquet if pyarrow is installed, else csv)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Verbose logging output')
+    parser.add_argument('--debug', action='store_true',
+                       help='Enable debug logging')
+    
+    args = parser.parse_args(argv)
+    
+    setup_logging(args.verbose, args.debug)
+    logger = logging.getLogger(__name__)
+    
+    sbom_files = BatchAnalyzer.collect_inputs(args.inputs)
+    if not sbom_files:
+        logger.error("No SBOM files found")
+        return 1
+    
+    analyzer = BatchAnalyzer(
+        config_path=args.config,
+        processes=args.processes,
+        workers=args.workers,
+        no_cache=args.no_cache,
+        refresh=args.refresh,
+        snapshot_path=args.snapshot,
+        release_index_path=args.release_index,
+        baseline_dir=args.baseline_dir,
+        baseline_max_age=args.baseline_max_age,
+        metrics=args.metrics or bool(args.metrics_file),
+        columnar=args.columnar,
+        dataset_dir=args.dataset_dir,
+        dataset_format=args.dataset_format
+    )
+    
+    try:
+        summary = analyzer.run(sbom_files, args.output_dir)
+        if args.metrics_file:
+            write_metrics_file(args.metrics_file, summary['metrics'])
+    except Exception as e:
+        logger.error(f"Failed to analyze SBOMs: {e}")
+        return 1
+    
+    print(f"Analyzed {summary['analyzed_sboms']}/{summary['total_sboms']} SBOMs, "
+          f"total libyear: {summary['total_libyear']:.2f} years "
+          f"(summary: {Path(args.output_dir) / 'summary.json'})")
+    
+    exit_code = 0
+    if summary['failed_sboms']:
+        exit_code = 1
+    
+    if args.max_libyears is not None:
+        for sbom_summary in summary['sboms']:
+            if sbom_summary['error'] is None and sbom_summary['total_libyear'] > args.max_libyears:
+                logger.error(f"Libyear limit exceeded for {sbom_summary['sbom']}: "
+                             f"{sbom_summary['total_libyear']:.2f} > {args.max_libyears}")
+                exit_code = 1
+    
+    return exit_code
+
+
+def snapshot_main(argv):
+    parser = argparse.ArgumentParser(
+        prog='sbom-libyear snapshot',
+        description='Creates and combines offline snapshots of registry release dates',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+A snapshot holds the release dates needed to analyze a set of SBOMs. Pass it to
+the analysis commands with --snapshot to run without any registry access.
+
+Examples:
+  %(prog)s export sboms/ --output libyear.snapshot
+  %(prog)s import other-agent.snapshot --output libyear.snapshot
+  sbom-libyear my-sbom.json --snapshot libyear.snapshot
+"""
+    )
+    
+    subparsers = parser.add_subparsers(dest='action', required=True)
+    
+    export_parser = subparsers.add_parser('export', help='Resolve release dates for SBOMs and store them in a snapshot')
+    export_parser.add_argument('inputs', nargs='+', help='SBOM files, directories, glob patterns or @list-file')
+    export_parser.add_argument('--output', '-o', required=True, help='Snapshot file to create or update')
+    export_parser.add_argument('--config', '-c', help='Path to configuration file (config.yaml)')
+    export_parser.add_argument('--workers', type=int,
+                              help='Number of parallel registry lookups (default: http.workers from config)')
+    export_parser.add_argument('--no-cache', action='store_true',
+                              help='Disable the persistent registry response cache')
+    export_parser.add_argument('--refresh', action='store_true',
+                              help='Ignore cached registry responses and re-download them')
+    
+    import_parser = subparsers.add_parser('import', help='Merge existing snapshots into a snapshot')
+    import_parser.add_argument('snapshots', nargs='+', help='Snapshot files to merge')
+    import_parser.add_argument('--output', '-o', required=True, help='Snapshot file to create or update')
+    
+    for subparser in (export_parser, import_parser):
+        subparser.add_argument('--verbose', '-v', action='store_true',
+                              help='Verbose logging output')
+        subparser.add_argument('--debug', action='store_true',
+                              help='Enable debug logging')
+    
+    args = parser.parse_args(argv)
+    
+    setup_logging(args.verbose, args.debug)
+    logger = logging.getLogger(__name__)
+    
+    try:
+        if args.action == 'export':
+            sbom_files = BatchAnalyzer.collect_inputs(args.inputs)
+            if not sbom_files:
+                logger.error("No SBOM files found")
+                return 1
+            
+            config_loader = ConfigLoader(args.config)
+            configure_http_client(config_loader, args.workers)
+            configure_cache(config_loader, no_cache=args.no_cache, refresh=args.refresh)
+            
+            exported = SnapshotExporter(config_loader, workers=args.workers).export(sbom_files, args.output)
+            print(f"Exported {exported} release records from {len(sbom_files)} SBOMs to {args.output}")
+        else:
+            store = SnapshotStore(args.output, writable=True)
+            try:
+                for snapshot in args.snapshots:
+                    merged = store.merge(snapshot)
+                    logger.info(f"Imported {merged} release records from {snapshot}")
+                print(f"{args.output} now holds {store.count()} release records")
+            finally:
+                store.close()
+    except Exception as e:
+        logger.error(f"Snapshot {args.action} failed: {e}")
+        return 1
+    
+    return 0
+
+
+def index_main(argv):
+    parser = argparse.ArgumentParser(
+        prog='sbom-libyear index',
+        description='Builds a local release-date index from registry dumps',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Dumps are read from local files (optionally gzip compressed):
+  --npm    replicate _changes feed with include_docs=true, one change per line
+  --pypi   BigQuery distribution_metadata export (CSV or JSON lines) with
+           name, version and upload_time columns
+  --maven  index export (CSV, TSV or JSON lines) with groupId/g, artifactId/a,
+           version/v and timestamp columns
+
+Examples:
+  %(prog)s ingest --npm changes.ndjson.gz --pypi pypi.csv --output releases.idx
+  sbom-libyear batch sboms/ --output-dir reports/ --release-index releases.idx
+"""
+    )
+    
+    subparsers = parser.add_subparsers(dest='action', required=True)
+    
+    ingest_parser = subparsers.add_parser('ingest', help='Build a release-date index from registry dumps')
+    ingest_parser.add_argument('--npm', action='append', default=[], help='npm changes feed dump')
+    ingest_parser.add_argument('--pypi', action='append', default=[], help='PyPI BigQuery export')
+    ingest_parser.add_argument('--maven', action='append', default=[], help='Maven Central index export')
+    ingest_parser.add_argument('--output', '-o', required=True, help='Index file to write')
+    ingest_parser.add_argument('--verbose', '-v', action='store_true',
+                              help='Verbose logging output')
+    ingest_parser.add_argument('--debug', action='store_true',
+                              help='Enable debug logging')
+    
+    args = parser.parse_args(argv)
+    
+    setup_logging(args.verbose, args.debug)
+    logger = logging.getLogger(__name__)
+    
+    if not (args.npm or args.pypi or args.maven):
+        logger.error("No dumps given, use --npm, --pypi and/or --maven")
+        return 1
+    
+    builder = ReleaseIndexBuilder()
+    sources = [
+        (builder.ingest_npm, args.npm),
+        (builder.ingest_pypi, args.pypi),
+        (builder.ingest_maven, args.maven)
+    ]
+    
+    try:
+        for ingest, paths in sources:
+            for path in paths:
+                records = ingest(path)
+                logger.info(f"Ingested {records} release records from {path}")
+        packages, versions = builder.write(args.output)
+    except Exception as e:
+        logger.error(f"Failed to build release index: {e}")
+        return 1
+    
+    print(f"Indexed {versions} versions of {packages} packages in {args.output}")
+    return 0
+
+
+def serve_main(argv):
+    parser = argparse.ArgumentParser(
+        prog='sbom-libyear serve',
+        description='Runs an HTTP service that analyzes uploaded SBOMs with warm registry caches',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Endpoints:
+  POST /analyze[?filename=sbom.cdx.json]  SBOM as request body, returns the JSON report
+  GET  /health                             liveness check
+  GET  /metrics                            OpenMetrics counters (with --metrics)
+
+Examples:
+  %(prog)s --port 8080 --config config.yaml
+  curl --data-binary @my-sbom.json -H 'Content-Type: application/json' http://localhost:8080/analyze
+"""
+    )
+    
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    parser.add_argument('--config', '-c', help='Path to configuration file (config.yaml)')
+    parser.add_argument('--workers', type=int,
+                       help='Parallel registry lookups per request (default: http.workers from config)')
+    parser.add_argument('--max-concurrent', type=int, default=4,
+                       help='SBOMs analyzed at the same time, further uploads wait (default: 4)')
+    parser.add_argument('--max-upload-mb', type=float, default=100,
+                       help='Largest accepted SBOM upload in MB (default: 100)')
+    parser.add_argument('--memory-cache-size', type=int, default=100000,
+                       help='Package lookups kept in memory between requests (default: 100000)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the persistent registry response cache')
+    parser.add_argument('--snapshot',
+                       help='Resolve release dates offline from a snapshot created with "snapshot export"')
+    parser.add_argument('--release-index',
+                       help='Look up release dates in an index built with "index ingest" before querying registries')
+    parser.add_argument('--metrics', action='store_true',
+                       help='Expose timing and registry request metrics at GET /metrics (OpenMetrics)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Verbose logging output')
+    parser.add_argument('--debug', action='store_true',
+                       help='Enable debug logging')
+    
+    args = parser.parse_args(argv)
+    
+    setup_logging(args.verbose, args.debug)
+    logger = logging.getLogger(__name__)
+    
+    config_loader = ConfigLoader(args.config)
+    configure_http_client(config_loader, args.workers)
+    configure_cache(config_loader, no_cache=args.no_cache)
+    Metrics().configure(enabled=args.metrics)
+    
+    try:
+        calculator = LibyearCalculator(
+            config_loader,
+            workers=args.workers,
+            snapshot=SnapshotStore(args.snapshot) if args.snapshot else None,
+            release_index=ReleaseIndex(args.release_index) if args.release_index else None,
+            result_cache_size=args.memory_cache_size
+        )
+        service = LibyearService(calculator, args.max_concurrent, int(args.max_upload_mb * 1024 * 1024))
+        server = create_server(service, args.host, args.port)
+    except Exception as e:
+        logger.error(f"Failed to start service: {e}")
+        return 1
+    
+    print(f"Serving libyear analysis on http://{args.host}:{server.server_address[1]}/analyze", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        calculator.close()
+    
+    return 0
+
+
+def format_aggregate(aggregate: dict, limit: int) -> str:
+    def stats(row: dict) -> str:
+        if row['successful_analyses'] == 0:
+            return f"{row['components']} components, no successful analyses"
+        return (f"{row['components']} components, {row['total_libyear']:.2f} years total, "
+                f"mean {row['mean_libyear']:.2f}, p50 {row['p50_libyear']:.2f}, p95 {row['p95_libyear']:.2f}")
+    
+    lines = [
+        '',
+        'Fleet Libyear Aggregate',
+        '=======================',
+        '',
+        'Summary:',
+        f"- Reports: {aggregate['reports']}",
+        f"- SBOMs: {aggregate['sboms']}",
+        f"- Distinct packages: {aggregate['packages']}",
+        f"- Components: {stats(aggregate)}",
+        f"- Failed: {aggregate['failed_analyses']}",
+        '',
+        'By Package Manager:',
+        '------------------------------------',
+    ]
+    lines.extend(f"{row['key'].upper()}: {stats(row)}" for row in aggregate['by_package_manager'])
+    
+    sections = (('SBOMs', aggregate['by_sbom'][:limit]), ('Packages', aggregate['top_packages']))
+    for title, rows in sections:
+        heading = f"Top {len(rows)} {title} by {aggregate['ranked_by']}:"
+        lines.extend(['', heading, '-' * len(heading)])
+        lines.extend(f"{position:>4}. {row['key']}: {stats(row)}" for position, row in enumerate(rows, 1))
+    
+    return '\n'.join(lines) + '\n'
+
+
+def aggregate_main(argv):
+    parser = argparse.ArgumentParser(
+        prog='sbom-libyear aggregate',
+        description='Aggregates libyear across many reports by package, package manager and SBOM',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Reads JSON and NDJSON reports as well as Parquet/CSV datasets written with
+--dataset-dir. Install numpy for vectorised aggregation of large fleets and
+pyarrow to read Parquet datasets.
+
+Examples:
+  %(prog)s reports/ --top 100
+  %(prog)s libyear-dataset/ --rank-by p95_libyear --format json --output fleet.json
+  %(prog)s 'reports/**/*.libyear.json' @more-reports.txt
+"""
+    )
+    
+    parser.add_argument('inputs', nargs='+', help='Report files, dataset directories, glob patterns or @list-file')
+    parser.add_argument('--top', type=int, default=100,
+                       help='Number of most outdated packages to report (default: 100)')
+    parser.add_argument('--rank-by', choices=['total_libyear', 'mean_libyear', 'p50_libyear', 'p95_libyear',
+                                              'components'], default='total_libyear',
+                       help='Statistic that orders packages and SBOMs (default: total_libyear)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Output format (default: text)')
+    parser.add_argument('--output', '-o', help='Write the aggregate to this file instead of stdout')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Verbose logging output')
+    parser.add_argument('--debug', action='store_true',
+                       help='Enable debug logging')
+    
+    args = parser.parse_args(argv)
+    
+    setup_logging(args.verbose, args.debug)
+    logger = logging.getLogger(__name__)
+    
+    report_files = BatchAnalyzer.collect_inputs(args.inputs, FleetAggregator.suffixes)
+    if not report_files:
+        logger.error("No reports found")
+        return 1
+    
+    try:
+        aggregator = FleetAggregator(top=args.top, rank_by=args.rank_by)
+        if not aggregator.is_vectorized():
+            logger.warning("numpy is not installed, aggregating without vectorisation")
+        rows = aggregator.load(report_files)
+        aggregate = aggregator.aggregate()
+    except Exception as e:
+        logger.error(f"Failed to aggregate reports: {e}")
+        return 1
+    
+    logger.info(f"Aggregated {rows} components from {aggregator.reports} reports")
+    if args.format == 'json':
+        output = json.dumps(aggregate, indent=2, ensure_ascii=False)
+    else:
+        output = format_aggregate(aggregate, args.top)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(output)
+        logger.info(f"Aggregate saved: {args.output}")
+    else:
+        print(output)
+    
+    return 0
+
+
+COMMANDS = {
+    'batch': batch_main,
+    'snapshot': snapshot_main,
+    'index': index_main,
+    'serve': serve_main,
+    'aggregate': aggregate_main,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        return COMMANDS[argv[0]](argv[1:])
+    
     parser = argparse.ArgumentParser(
         description='Calculates libyear metrics from SBOM files',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -32,65 +469,125 @@ Examples:
   %(prog)s my-sbom.json --config config.yaml
   %(prog)s my-sbom.json --max-libyears 50
   %(prog)s my-sbom.json --report-path report.json --format json
+  %(prog)s my-sbom.json --report-path report.ndjson --report-format ndjson
+  %(prog)s my-sbom.json --dataset-dir libyear-dataset/
   %(prog)s my-sbom.json --output report.txt --max-libyears 35
   %(prog)s my-sbom.json -c artifactory-config.yaml --verbose
+  %(prog)s my-sbom.json --workers 16
+  %(prog)s my-sbom.json --refresh
+  %(prog)s my-sbom.json --snapshot libyear.snapshot
+  %(prog)s my-sbom.json --baseline previous-report.json --report-path report.json
+  %(prog)s my-sbom.json --report-path report.json --metrics --metrics-file libyear.prom
+  %(prog)s batch sboms/ --output-dir reports/
+  %(prog)s snapshot export sboms/ --output libyear.snapshot
+  %(prog)s aggregate reports/ --top 100
 """
     )
     
     parser.add_argument('sbom_file', help='Path to SBOM file')
     parser.add_argument('--config', '-c', help='Path to configuration file (config.yaml)')
     parser.add_argument('--output', '-o', help='Output file for text report')
-    parser.add_argument('--format', choices=['text', 'json'], default='text', 
+    parser.add_argument('--format', choices=['text', 'json', 'ndjson'], default='text', 
                        help='Output format for stdout (default: text)')
     parser.add_argument('--report-path', help='Path for JSON report')
+    parser.add_argument('--report-format', choices=['json', 'ndjson'], default='json',
+                       help='Format of the --report-path file; ndjson writes one component per line (default: json)')
     parser.add_argument('--max-libyears', type=float, 
                        help='Maximum allowed libyears. If exceeded, exit code 1 is returned')
+    parser.add_argument('--workers', type=int,
+                       help='Number of parallel registry lookups (default: http.workers from config)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the persistent registry response cache')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore cached registry responses and re-download them')
+    parser.add_argument('--snapshot',
+                       help='Resolve release dates offline from a snapshot created with "snapshot export"')
+    parser.add_argument('--release-index',
+                       help='Look up release dates in an index built with "index ingest" before querying registries')
+    parser.add_argument('--baseline',
+                       help='Previous JSON report; unchanged components are reused and a libyear delta is reported')
+    parser.add_argument('--baseline-max-age', type=float, default=7.0,
+                       help='Days after which reused baseline results are looked up again (default: 7)')
+    parser.add_argument('--delta-path', help='Path for the JSON libyear delta report (requires --baseline)')
+    parser.add_argument('--metrics', action='store_true',
+                       help='Add timing and registry request metrics to the JSON report')
+    parser.add_argument('--metrics-file', help='Write timing and registry request metrics as a Prometheus/OpenMetrics text file')
+    parser.add_argument('--columnar', action='store_true',
+                       help='Keep results in compact columnar arrays to reduce memory for very large SBOMs')
+    parser.add_argument('--dataset-dir',
+                       help='Append the component results to a Parquet/CSV dataset in this directory')
+    parser.add_argument('--dataset-format', choices=['parquet', 'csv'],
+                       help='Dataset file format (default: parquet if pyarrow is installed, else csv)')
     parser.add_argument('--verbose', '-v', action='store_true', 
                        help='Verbose logging output')
     parser.add_argument('--debug', action='store_true', 
                        help='Enable debug logging')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     setup_logging(args.verbose, args.debug)
     logger = logging.getLogger(__name__)
     
     config_loader = ConfigLoader(args.config)
     
-    http_config = config_loader.get_http_config()
-    proxy_config = config_loader.get_proxy_config()
-    http_client = HttpClient()
-    http_client.configure(
-        timeout=http_config.get('timeout', 10),
-        user_agent=http_config.get('user_agent', 'sbom-libyear-calculator/1.0'),
-        proxies=proxy_config
-    )
-    
-    calculator = LibyearCalculator(config_loader)
+    configure_http_client(config_loader, args.workers)
+    configure_cache(config_loader, no_cache=args.no_cache, refresh=args.refresh)
+    Metrics().configure(enabled=args.metrics or bool(args.metrics_file))
     
+    calculator = None
     try:
-        libyear_results = calculator.calculate_from_sbom(args.sbom_file)
+        snapshot = SnapshotStore(args.snapshot) if args.snapshot else None
+        release_index = ReleaseIndex(args.release_index) if args.release_index else None
+        calculator = LibyearCalculator(config_loader, workers=args.workers, snapshot=snapshot,
+                                       release_index=release_index, columnar=args.columnar)
+        baseline = Baseline(args.baseline, args.baseline_max_age) if args.baseline else None
+        dataset_generator = (ColumnarReportGenerator(args.sbom_file, args.dataset_format)
+                             if args.dataset_dir else None)
         
-        if args.format == 'json':
-            report_generator = JSONReportGenerator()
-        else:
-            report_generator = TextReportGenerator()
+        libyear_results = calculator.calculate_from_sbom(args.sbom_file, baseline)
         
-        report_str = report_generator.generate(libyear_results)
+        report_generators = {
+            'json': JSONReportGenerator,
+            'ndjson': NDJSONReportGenerator,
+            'text': TextReportGenerator,
+        }
+        report_generator = report_generators[args.format]()
         report = report_generator._create_report_data(libyear_results)
         
-        if args.report_path:
-            with open(args.report_path, 'w', encoding='utf-8') as report_file:
-                json_generator = JSONReportGenerator()
-                report_file.write(json_generator.generate(libyear_results))
-            logger.info(f"JSON report saved: {args.report_path}")
+        # Rows are rendered while they are written, so writing is most of the report phase
+        with Metrics().phase('report'):
+            if args.report_path:
+                with open(args.report_path, 'w', encoding='utf-8') as report_file:
+                    report_generators[args.report_format]().write(report, report_file)
+                logger.info(f"{args.report_format.upper()} report saved: {args.report_path}")
+            
+            if dataset_generator:
+                part_path = dataset_generator.append(report, args.dataset_dir)
+                logger.info(f"Results appended to dataset: {part_path}")
+            
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8') as output_file:
+                    report_generator.write(report, output_file)
+                logger.info(f"Report saved: {args.output}")
+            else:
+                report_generator.write(report, sys.stdout)
+                if args.format != 'ndjson':
+                    sys.stdout.write('\n')
+        
+        if baseline:
+            delta = baseline.delta(libyear_results)
+            if args.delta_path:
+                with open(args.delta_path, 'w', encoding='utf-8') as delta_file:
+                    json.dump(asdict(delta), delta_file, indent=2, ensure_ascii=False)
+                logger.info(f"Delta report saved: {args.delta_path}")
+            print(f"Libyear delta vs {args.baseline}: {delta.libyear_delta:+.2f} years "
+                  f"({delta.baseline_total_libyear:.2f} -> {delta.total_libyear:.2f}), "
+                  f"{len(delta.added)} added, {len(delta.removed)} removed, {len(delta.changed)} changed, "
+                  f"{delta.reused_components} reused", file=sys.stderr)
         
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as output_file:
-                output_file.write(report_str)
-            logger.info(f"Report saved: {args.output}")
-        else:
-            print(report_str)
+        if args.metrics_file:
+            write_metrics_file(args.metrics_file, Metrics().snapshot())
+            logger.info(f"Metrics saved: {args.metrics_file}")
         
         if args.max_libyears is not None:
             if report.total_libyear > args.max_libyears:
@@ -106,6 +603,9 @@ Examples:
     except Exception as e:
         logger.error(f"Failed to analyze SBOM: {e}")
         return 1
+    finally:
+        if calculator:
+            calculator.close()
 
 
 if __name__ == '__main__':
@@ -1,4 +1,11 @@
+from .baseline import Baseline
+from .batch import BatchAnalyzer
 from .calculator import LibyearCalculator
+from .fleet_aggregate import FleetAggregator
 from .registry_manager import RegistryManager
+from .release_index import ReleaseIndexBuilder
+from .service import LibyearService, create_server
+from .snapshot import SnapshotExporter
 
-__all__ = ['LibyearCalculator', 'RegistryManager']
\ No newline at end of file
+__all__ = ['Baseline', 'BatchAnalyzer', 'FleetAggregator', 'LibyearCalculator', 'RegistryManager',
+           'ReleaseIndexBuilder', 'LibyearService', 'SnapshotExporter', 'create_server']
\ No newline at end of file
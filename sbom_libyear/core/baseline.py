@@ -0,0 +1,124 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from ..models import Component, LibyearDelta, LibyearResult
+
+
+class Baseline:
+    def __init__(self, report_path: str, max_age_days: float = 7.0):
+        self.report_path = report_path
+        self.max_age = timedelta(days=max_age_days)
+        self.started_at = datetime.now(timezone.utc)
+
+        with open(report_path, 'r', encoding='utf-8') as report_file:
+            report = json.load(report_file)
+
+        # Reports written before checked_at existed are as old as the file itself
+        self.generated_at = datetime.fromtimestamp(os.path.getmtime(report_path), tz=timezone.utc)
+
+        self.components: List[Dict] = report.get('components', [])
+        self._entries: Dict[Tuple[str, str], Dict] = {}
+        for entry in self.components:
+            identity = self._identity(entry.get('purl'), entry.get('package_type'), entry.get('name'))
+            self._entries[(identity, entry.get('current_version'))] = entry
+
+    def reuse(self, component: Component) -> Optional[LibyearResult]:
+        identity = self._identity(component.purl, component.package_type, component.name)
+        entry = self._entries.get((identity, component.version))
+        if entry is None or entry.get('error'):
+            return None
+
+        checked_at = self._parse_date(entry.get('checked_at')) or self.generated_at
+        if self.started_at - checked_at > self.max_age:
+            return None
+
+        return LibyearResult.from_dates(
+            component=component,
+            current_version=component.version,
+            latest_version=entry.get('latest_version', 'unknown'),
+            current_date=self._parse_date(entry.get('current_date')),
+            latest_date=self._parse_date(entry.get('latest_date')),
+            years_behind=entry.get('years_behind', 0.0),
+            checked_at=checked_at
+        )
+
+    def delta(self, results: List[LibyearResult]) -> LibyearDelta:
+        previous: Dict[str, List[Dict]] = {}
+        for entry in self.components:
+            identity = self._identity(entry.get('purl'), entry.get('package_type'), entry.get('name'))
+            previous.setdefault(identity, []).append(entry)
+
+        current: Dict[str, List[LibyearResult]] = {}
+        for result in results:
+            identity = self._identity(result.component.purl, result.component.package_type, result.component.name)
+            current.setdefault(identity, []).append(result)
+
+        added = []
+        changed = []
+        for identity, identity_results in current.items():
+            years_behind = sum(r.years_behind for r in identity_results if r.error is None)
+            versions = sorted(r.current_version for r in identity_results)
+            if identity not in previous:
+                added.append({
+                    'name': identity_results[0].component.name,
+                    'purl': identity_results[0].component.purl,
+                    'versions': versions,
+                    'years_behind': years_behind
+                })
+                continue
+
+            entries = previous[identity]
+            previous_years = sum(e.get('years_behind', 0.0) for e in entries if not e.get('error'))
+            previous_versions = sorted(e.get('current_version') for e in entries)
+            if previous_versions != versions or abs(previous_years - years_behind) > 1e-9:
+                changed.append({
+                    'name': identity_results[0].component.name,
+                    'purl': identity_results[0].component.purl,
+                    'previous_versions': previous_versions,
+                    'versions': versions,
+                    'previous_years_behind': previous_years,
+                    'years_behind': years_behind,
+                    'libyear_delta': years_behind - previous_years
+                })
+
+        removed = [
+            {
+                'name': entries[0].get('name'),
+                'purl': entries[0].get('purl'),
+                'versions': sorted(e.get('current_version') for e in entries),
+                'years_behind': sum(e.get('years_behind', 0.0) for e in entries if not e.get('error'))
+            }
+            for identity, entries in previous.items() if identity not in current
+        ]
+
+        baseline_total = sum(e.get('years_behind', 0.0) for e in self.components if not e.get('error'))
+        total = sum(r.years_behind for r in results if r.error is None)
+        reused = len([r for r in results if r.checked_at is not None and r.checked_at < self.started_at])
+
+        return LibyearDelta(
+            baseline=self.report_path,
+            baseline_total_libyear=baseline_total,
+            total_libyear=total,
+            libyear_delta=total - baseline_total,
+            reused_components=reused,
+            refreshed_components=len(results) - reused,
+            added=added,
+            removed=removed,
+            changed=sorted(changed, key=lambda c: abs(c['libyear_delta']), reverse=True)
+        )
+
+    @staticmethod
+    def _identity(purl: Optional[str], package_type: Optional[str], name: Optional[str]) -> str:
+        if purl:
+            base = purl.split('#', 1)[0].split('?', 1)[0]
+            name_part = base.rsplit('/', 1)[-1]
+            if '@' in name_part:
+                base = base[:len(base) - len(name_part)] + name_part.rsplit('@', 1)[0]
+            return base
+        return f"{package_type}:{name}"
+
+    @staticmethod
+    def _parse_date(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value else None
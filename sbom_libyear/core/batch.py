@@ -0,0 +1,258 @@
+import glob
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..reports import ColumnarReportGenerator, JSONReportGenerator
+from ..utils import ConfigLoader, Metrics, ReleaseIndex, SnapshotStore, configure_cache, configure_http_client
+from .baseline import Baseline
+from .calculator import LibyearCalculator
+
+SBOM_SUFFIXES = ('.json', '.xml')
+
+_worker_calculator: Optional[LibyearCalculator] = None
+
+
+def _init_worker(config_path: Optional[str], workers: Optional[int], no_cache: bool,
+                 refresh: bool, log_level: int, snapshot_path: Optional[str] = None,
+                 release_index_path: Optional[str] = None, metrics: bool = False, columnar: bool = False,
+                 processes: int = 1):
+    global _worker_calculator
+
+    logging.getLogger().setLevel(log_level)
+    Metrics().configure(enabled=metrics)
+    config_loader = ConfigLoader(config_path)
+    configure_http_client(config_loader, workers, processes)
+    configure_cache(config_loader, no_cache=no_cache, refresh=refresh)
+    snapshot = SnapshotStore(snapshot_path) if snapshot_path else None
+    release_index = ReleaseIndex(release_index_path) if release_index_path else None
+    _worker_calculator = LibyearCalculator(config_loader, workers=workers, snapshot=snapshot,
+                                           release_index=release_index, columnar=columnar)
+
+
+def _analyze_sbom(sbom_file: str, report_path: str, baseline_path: Optional[str] = None,
+                  baseline_max_age: float = 7.0, dataset_dir: Optional[str] = None,
+                  dataset_format: Optional[str] = None, run_at: Optional[int] = None) -> Dict:
+    summary = {
+        'sbom': sbom_file,
+        'report': report_path,
+        'total_libyear': 0.0,
+        'total_components': 0,
+        'successful_analyses': 0,
+        'failed_analyses': 0,
+        'breakdown_by_package_manager': {},
+        'libyear_delta': None,
+        'dataset_part': None,
+        'metrics': None,
+        'error': None
+    }
+
+    metrics = Metrics()
+    metrics.reset()
+    try:
+        baseline = Baseline(baseline_path, baseline_max_age) if baseline_path else None
+        results = _worker_calculator.calculate_from_sbom(sbom_file, baseline)
+        report_generator = JSONReportGenerator()
+        report = report_generator._create_report_data(results)
+        with metrics.phase('report'):
+            with open(report_path, 'w', encoding='utf-8') as report_file:
+                report_generator.write(report, report_file)
+            
+            if dataset_dir:
+                dataset_generator = ColumnarReportGenerator(sbom_file, dataset_format, run_at)
+                summary['dataset_part'] = dataset_generator.append(report, dataset_dir)
+        
+        if baseline:
+            delta = baseline.delta(results)
+            summary['libyear_delta'] = delta.libyear_delta
+            with open(report_path[:-len('.json')] + '.delta.json', 'w', encoding='utf-8') as delta_file:
+                json.dump(asdict(delta), delta_file, indent=2, ensure_ascii=False)
+    except Exception as e:
+        summary['error'] = str(e)
+        return summary
+    finally:
+        if metrics.enabled:
+            summary['metrics'] = metrics.snapshot()
+
+    summary.update(
+        total_libyear=report.total_libyear,
+        total_components=report.total_components,
+        successful_analyses=report.successful_analyses,
+        failed_analyses=report.failed_analyses,
+        breakdown_by_package_manager=report.breakdown_by_package_manager
+    )
+    return summary
+
+
+class BatchAnalyzer:
+    def __init__(self, config_path: Optional[str] = None, processes: Optional[int] = None,
+                 workers: Optional[int] = None, no_cache: bool = False, refresh: bool = False,
+                 snapshot_path: Optional[str] = None, release_index_path: Optional[str] = None,
+                 baseline_dir: Optional[str] = None, baseline_max_age: float = 7.0,
+                 metrics: bool = False, columnar: bool = False, dataset_dir: Optional[str] = None,
+                 dataset_format: Optional[str] = None):
+        self.config_path = config_path
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.workers = workers
+        self.no_cache = no_cache
+        self.refresh = refresh
+        self.snapshot_path = snapshot_path
+        self.release_index_path = release_index_path
+        self.baseline_dir = baseline_dir
+        self.baseline_max_age = baseline_max_age
+        self.metrics = metrics
+        self.columnar = columnar
+        self.dataset_dir = dataset_dir
+        self.dataset_format = dataset_format
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def collect_inputs(cls, inputs: List[str], suffixes: Tuple[str, ...] = SBOM_SUFFIXES) -> List[str]:
+        sbom_files: List[str] = []
+
+        for entry in inputs:
+            if entry.startswith('@'):
+                with open(entry[1:], 'r', encoding='utf-8') as list_file:
+                    sbom_files.extend(
+                        line.strip() for line in list_file
+                        if line.strip() and not line.startswith('#')
+                    )
+            elif os.path.isdir(entry):
+                sbom_files.extend(
+                    str(path) for path in sorted(Path(entry).rglob('*'))
+                    if path.is_file() and path.suffix.lower() in suffixes
+                )
+            elif glob.has_magic(entry):
+                matches = sorted(glob.glob(entry, recursive=True))
+                if not matches:
+                    logging.getLogger(cls.__name__).warning(f"No files match '{entry}'")
+                sbom_files.extend(matches)
+            else:
+                sbom_files.append(entry)
+
+        seen = set()
+        return [f for f in sbom_files if not (f in seen or seen.add(f))]
+
+    def run(self, sbom_files: List[str], output_dir: str) -> Dict:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        report_paths = self._report_paths(sbom_files, output_path)
+        baseline_paths = self._baseline_paths(report_paths)
+        if self.dataset_dir:
+            # Fails early when Parquet was requested without pyarrow, and gives every part the same run time
+            dataset_format = ColumnarReportGenerator(dataset_format=self.dataset_format).dataset_format
+            dataset_args = (self.dataset_dir, dataset_format, int(time.time()))
+        else:
+            dataset_args = ()
+
+        processes = min(self.processes, max(1, len(sbom_files)))
+        self.logger.info(f"Analyzing {len(sbom_files)} SBOMs with {processes} process(es)")
+
+        init_args = (self.config_path, self.workers, self.no_cache, self.refresh,
+                     logging.getLogger().getEffectiveLevel(), self.snapshot_path,
+                     self.release_index_path, self.metrics, self.columnar, processes)
+        summaries: Dict[str, Dict] = {}
+
+        if processes == 1:
+            _init_worker(*init_args)
+            try:
+                for i, sbom_file in enumerate(sbom_files, 1):
+                    summaries[sbom_file] = _analyze_sbom(sbom_file, report_paths[sbom_file],
+                                                         baseline_paths.get(sbom_file), self.baseline_max_age,
+                                                         *dataset_args)
+                    self._log_progress(i, len(sbom_files), summaries[sbom_file])
+            finally:
+                _worker_calculator.close()
+        else:
+            with ProcessPoolExecutor(max_workers=processes,
+                                     initializer=_init_worker, initargs=init_args) as executor:
+                futures = {
+                    executor.submit(_analyze_sbom, sbom_file, report_paths[sbom_file],
+                                    baseline_paths.get(sbom_file), self.baseline_max_age,
+                                    *dataset_args): sbom_file
+                    for sbom_file in sbom_files
+                }
+                for i, future in enumerate(as_completed(futures), 1):
+                    summaries[futures[future]] = future.result()
+                    self._log_progress(i, len(sbom_files), summaries[futures[future]])
+
+        summary = self._aggregate([summaries[f] for f in sbom_files])
+        with open(output_path / 'summary.json', 'w', encoding='utf-8') as summary_file:
+            json.dump(summary, summary_file, indent=2, ensure_ascii=False)
+
+        return summary
+
+    def _report_paths(self, sbom_files: List[str], output_path: Path) -> Dict[str, str]:
+        report_paths = {}
+        used = set()
+
+        for sbom_file in sbom_files:
+            stem = Path(sbom_file).name
+            for suffix in SBOM_SUFFIXES:
+                if stem.lower().endswith(suffix):
+                    stem = stem[:-len(suffix)]
+                    break
+
+            name = f"{stem}.libyear.json"
+            counter = 1
+            while name in used:
+                counter += 1
+                name = f"{stem}-{counter}.libyear.json"
+            used.add(name)
+            report_paths[sbom_file] = str(output_path / name)
+
+        return report_paths
+
+    def _baseline_paths(self, report_paths: Dict[str, str]) -> Dict[str, str]:
+        if not self.baseline_dir:
+            return {}
+        
+        baseline_paths = {}
+        for sbom_file, report_path in report_paths.items():
+            baseline_path = Path(self.baseline_dir) / Path(report_path).name
+            if baseline_path.is_file():
+                baseline_paths[sbom_file] = str(baseline_path)
+        return baseline_paths
+
+    def _log_progress(self, index: int, total: int, summary: Dict):
+        if summary['error']:
+            self.logger.error(f"[{index}/{total}] {summary['sbom']} failed: {summary['error']}")
+        else:
+            self.logger.info(f"[{index}/{total}] {summary['sbom']}: {summary['total_libyear']:.2f} libyears")
+
+    def _aggregate(self, summaries: List[Dict]) -> Dict:
+        breakdown: Dict[str, Dict[str, float]] = {}
+        for summary in summaries:
+            for pkg_type, stats in summary['breakdown_by_package_manager'].items():
+                totals = breakdown.setdefault(pkg_type, {
+                    'total_libyear': 0.0,
+                    'component_count': 0,
+                    'successful_count': 0,
+                    'failed_count': 0
+                })
+                for key in totals:
+                    totals[key] += stats.get(key, 0)
+
+        analyzed = [s for s in summaries if s['error'] is None]
+        aggregate = {
+            'total_sboms': len(summaries),
+            'analyzed_sboms': len(analyzed),
+            'failed_sboms': len(summaries) - len(analyzed),
+            'total_libyear': sum(s['total_libyear'] for s in analyzed),
+            'total_components': sum(s['total_components'] for s in analyzed),
+            'successful_analyses': sum(s['successful_analyses'] for s in analyzed),
+            'failed_analyses': sum(s['failed_analyses'] for s in analyzed),
+            'breakdown_by_package_manager': breakdown,
+            'sboms': [
+                {key: value for key, value in s.items() if key not in ('breakdown_by_package_manager', 'metrics')}
+                for s in summaries
+            ]
+        }
+        if self.metrics:
+            aggregate['metrics'] = Metrics.merge([s['metrics'] for s in summaries if s['metrics']])
+        return aggregate
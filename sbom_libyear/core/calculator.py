@@ -1,50 +1,162 @@
+import asyncio
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from ..models import LibyearResult
+from ..models import Component, LibyearResult, ResultTable
 from ..parsers import SBOMParserContext
-from ..utils import ConfigLoader
+from ..utils import ConfigLoader, HttpClient, Metrics, ReleaseIndex, SnapshotStore
+from .baseline import Baseline
 from .registry_manager import RegistryManager
 
 
 class LibyearCalculator:
-    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+    window_size = 1000
+
+    def __init__(self, config_loader: Optional[ConfigLoader] = None, workers: Optional[int] = None,
+                 snapshot: Optional[SnapshotStore] = None, release_index: Optional[ReleaseIndex] = None,
+                 result_cache_size: int = 0, columnar: bool = False):
         self.config_loader = config_loader or ConfigLoader()
         self.parser_context = SBOMParserContext()
-        self.registry_manager = RegistryManager(self.config_loader)
+        self.metrics = Metrics()
+        self.http_client = HttpClient()
+        self.columnar = columnar
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def calculate_from_sbom(self, filepath: str) -> List[LibyearResult]:
-        components = self.parser_context.parse_file(filepath)
-        results = []
+        if workers is None:
+            workers = self.config_loader.get_http_config().get('workers', 1)
+        self.workers = max(1, int(workers))
+        self.registry_manager = RegistryManager(self.config_loader, snapshot, release_index, result_cache_size,
+                                                workers=self.workers)
+
+    def calculate_from_sbom(self, filepath: str, baseline: Optional[Baseline] = None) -> Sequence[LibyearResult]:
+        return self.calculate_components(self.parser_context.iter_file(filepath), baseline)
+
+    def calculate_components(self, components: Iterable[Component],
+                             baseline: Optional[Baseline] = None) -> Sequence[LibyearResult]:
+        results = ResultTable() if self.columnar else []
+
+        self.logger.info(f"Analyzing components with {self.workers} worker(s)...")
+
+        executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 and not self._asynchronous() else None
+        try:
+            with self.metrics.phase('analyze'):
+                for window in self._windows(components):
+                    results.extend(self._calculate_window(window, len(results), executor, baseline))
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self.logger.info(f"Analyzed {len(results)} components")
+        return results
+
+    def close(self) -> None:
+        # The registries are shared by every analysis of this calculator, so only its owner closes them
+        self.registry_manager.close()
+
+    def _asynchronous(self) -> bool:
+        # Snapshot lookups never touch the network, so only registry lookups move onto the event loop
+        return self.http_client.backend == 'async' and self.registry_manager.snapshot is None
+
+    def _windows(self, components: Iterable[Component]) -> Iterator[List[Component]]:
+        iterator = iter(components)
+        while True:
+            window = list(islice(iterator, self.window_size))
+            if not window:
+                return
+            yield window
+
+    def _calculate_window(self, components: List[Component], offset: int,
+                          executor: Optional[ThreadPoolExecutor],
+                          baseline: Optional[Baseline] = None) -> List[LibyearResult]:
+        results: List[Optional[LibyearResult]] = [None] * len(components)
+        pending: List[int] = []
+        
+        for index, component in enumerate(components):
+            reused = baseline.reuse(component) if baseline else None
+            if reused is not None:
+                results[index] = reused
+            else:
+                pending.append(index)
         
-        self.logger.info(f"Analyzing {len(components)} components...")
+        if baseline:
+            self.logger.debug(f"Reusing {len(components) - len(pending)} baseline results, refreshing {len(pending)}")
+        
+        self.registry_manager.prefetch([components[index] for index in pending])
+        
+        if self._asynchronous():
+            return self.http_client.submit(self._acalculate_pending(components, offset, pending, results)).result()
+        
+        if executor is None or len(pending) <= 1:
+            for index in pending:
+                results[index] = self._calculate_component(components[index], offset + index + 1)
+            return results
+
+        groups = self._group_by_package(components, pending)
         
-        for i, component in enumerate(components, 1):
-            self.logger.info(f"[{i}/{len(components)}] Processing {component.name}...")
-            
-            current_date, latest_date, latest_version = self.registry_manager.get_package_info(component)
-            
+        def calculate_group(indices: List[int]):
+            for index in indices:
+                results[index] = self._calculate_component(components[index], offset + index + 1)
+        
+        list(executor.map(calculate_group, groups.values()))
+        
+        return results
+
+    async def _acalculate_pending(self, components: List[Component], offset: int, pending: List[int],
+                                  results: List[Optional[LibyearResult]]) -> List[Optional[LibyearResult]]:
+        # One task per distinct package, 'workers' of them awaiting registries at a time on a single thread
+        slots = asyncio.Semaphore(self.workers)
+        
+        async def calculate_group(indices: List[int]):
+            async with slots:
+                for index in indices:
+                    results[index] = await self._acalculate_component(components[index], offset + index + 1)
+        
+        await asyncio.gather(*(calculate_group(indices) for indices in self._group_by_package(components, pending).values()))
+        
+        return results
+
+    def _group_by_package(self, components: List[Component], pending: List[int]) -> Dict[Tuple[str, str], List[int]]:
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for index in pending:
+            groups.setdefault(self.registry_manager.package_key(components[index]), []).append(index)
+        
+        self.logger.debug(f"Resolving {len(pending)} components from {len(groups)} distinct packages")
+        return groups
+
+    def _calculate_component(self, component: Component, index: int) -> LibyearResult:
+        self.logger.info(f"[{index}] Processing {component.name}...")
+        return self._libyear_result(component, self.registry_manager.get_package_info(component))
+
+    async def _acalculate_component(self, component: Component, index: int) -> LibyearResult:
+        self.logger.info(f"[{index}] Processing {component.name}...")
+        return self._libyear_result(component, await self.registry_manager.get_package_info_async(component))
+
+    def _libyear_result(self, component: Component,
+                        package_info: Tuple[Optional[datetime], Optional[datetime], Optional[str]]) -> LibyearResult:
+        current_date, latest_date, latest_version = package_info
+
+        years_behind = 0.0
+        libyear_error = None
+
+        if current_date and latest_date:
+            delta = latest_date - current_date
+            years_behind = delta.days / 365.25
+        elif latest_version and latest_version != 'unknown':
+            libyear_error = f"Release dates unavailable from registry, latest version: {latest_version}"
             years_behind = 0.0
-            libyear_error = None
-            
-            if current_date and latest_date:
-                delta = latest_date - current_date
-                years_behind = delta.days / 365.25
-            elif latest_version and latest_version != 'unknown':
-                libyear_error = f"Release dates unavailable from registry, latest version: {latest_version}"
-                years_behind = 0.0
-            else:
-                libyear_error = "Unable to retrieve version or release date information from package registry"
-            
-            results.append(LibyearResult(
-                component=component,
-                current_version=component.version,
-                latest_version=latest_version or 'unknown',
-                current_date=current_date,
-                latest_date=latest_date,
-                years_behind=years_behind if years_behind > 0 else 0,
-                error=libyear_error
-            ))
-        
-        return results
\ No newline at end of file
+        else:
+            libyear_error = "Unable to retrieve version or release date information from package registry"
+
+        return LibyearResult.from_dates(
+            component=component,
+            current_version=component.version,
+            latest_version=latest_version or 'unknown',
+            current_date=current_date,
+            latest_date=latest_date,
+            years_behind=years_behind if years_behind > 0 else 0,
+            error=libyear_error,
+            checked_at=datetime.now(timezone.utc)
+        )
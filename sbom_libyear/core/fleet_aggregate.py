@@ -0,0 +1,314 @@
+import csv
+import heapq
+import json
+import logging
+import math
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from .baseline import Baseline
+
+REPORT_SUFFIXES = ('.json', '.ndjson', '.jsonl', '.csv', '.parquet')
+PERCENTILES = (('p50_libyear', 0.5), ('p95_libyear', 0.95))
+RANKINGS = ('total_libyear', 'mean_libyear', 'p50_libyear', 'p95_libyear', 'components')
+
+
+class _Dictionary:
+    # Maps repeated strings to dense integer codes, the group keys of the aggregations
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class FleetTable:
+    # One row per component across all loaded reports, stored as typed arrays of dictionary codes
+    def __init__(self):
+        self.sboms = _Dictionary()
+        self.packages = _Dictionary()
+        self.package_types = _Dictionary()
+        self.sbom_codes = array('i')
+        self.package_codes = array('i')
+        self.package_type_codes = array('i')
+        self.years = array('d')
+        self.failed = array('b')
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def append(self, sbom: str, package: str, package_type: str, years_behind: float, failed: bool):
+        self.sbom_codes.append(self.sboms.code(sbom))
+        self.package_codes.append(self.packages.code(package))
+        self.package_type_codes.append(self.package_types.code(package_type))
+        self.years.append(years_behind)
+        self.failed.append(failed)
+
+    def extend_encoded(self, sbom_codes, package_codes, package_type_codes, years, failed):
+        # Arrays of already mapped codes, appended without a per-row Python loop
+        self.sbom_codes.frombytes(numpy.asarray(sbom_codes, dtype=numpy.intc).tobytes())
+        self.package_codes.frombytes(numpy.asarray(package_codes, dtype=numpy.intc).tobytes())
+        self.package_type_codes.frombytes(numpy.asarray(package_type_codes, dtype=numpy.intc).tobytes())
+        self.years.frombytes(numpy.asarray(years, dtype=numpy.float64).tobytes())
+        self.failed.frombytes(numpy.asarray(failed, dtype=numpy.int8).tobytes())
+
+
+class FleetAggregator:
+    suffixes = REPORT_SUFFIXES
+    batch_size = 262144
+
+    def __init__(self, top: int = 100, rank_by: str = 'total_libyear'):
+        if rank_by not in RANKINGS:
+            raise ValueError(f"Unsupported ranking: {rank_by}")
+        self.top = top
+        self.rank_by = rank_by
+        self.table = FleetTable()
+        self.reports = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def is_vectorized() -> bool:
+        return numpy is not None
+
+    @staticmethod
+    def is_report(path: str) -> bool:
+        name = Path(path).name
+        return not (name.startswith('.') or name == 'summary.json' or name.endswith('.delta.json'))
+
+    def load(self, paths: Iterable[str]) -> int:
+        loaded = len(self.table)
+        for path in paths:
+            if not self.is_report(path):
+                continue
+
+            suffix = Path(path).suffix.lower()
+            before = len(self.table)
+            if suffix == '.parquet':
+                self._load_parquet(path)
+            elif suffix == '.csv':
+                self._load_rows(self._read_csv(path), self._report_name(path))
+            elif suffix in ('.ndjson', '.jsonl'):
+                self._load_rows(self._read_ndjson(path), self._report_name(path))
+            else:
+                with open(path, 'r', encoding='utf-8') as report_file:
+                    report = json.load(report_file)
+                self._load_rows(report.get('components', []), self._report_name(path))
+
+            self.reports += 1
+            self.logger.info(f"Loaded {len(self.table) - before} components from {path}")
+        return len(self.table) - loaded
+
+    def aggregate(self) -> Dict[str, Any]:
+        table = self.table
+        grouped = self._grouped_numpy if numpy is not None else self._grouped_python
+        ranked = self._rank_years() if numpy is not None else None
+
+        everything = array('i', [0]) * len(table)
+        overall = self._rows(grouped(everything, 1, ranked), ['all'])[0]
+        overall.pop('key')
+
+        by_package_type = self._rows(grouped(table.package_type_codes, len(table.package_types), ranked),
+                                     table.package_types.values)
+        by_sbom = self._rows(grouped(table.sbom_codes, len(table.sboms), ranked), table.sboms.values)
+        by_package = self._rows(grouped(table.package_codes, len(table.packages), ranked), table.packages.values,
+                                self.top)
+
+        return {
+            'reports': self.reports,
+            'sboms': len(table.sboms),
+            'packages': len(table.packages),
+            **overall,
+            'ranked_by': self.rank_by,
+            'by_package_manager': by_package_type,
+            'by_sbom': by_sbom,
+            'top_packages': by_package
+        }
+
+    def _load_rows(self, rows: Iterable[Dict], report_name: Optional[str]):
+        append = self.table.append
+        for row in rows:
+            package_type = row.get('package_type') or 'unknown'
+            package = Baseline._identity(row.get('purl'), package_type, row.get('name'))
+            append(row.get('sbom') or report_name or '', package, package_type,
+                   float(row.get('years_behind') or 0.0), bool(row.get('error')))
+
+    def _load_parquet(self, path: str):
+        if pyarrow is None or numpy is None:
+            raise ImportError("Aggregating Parquet datasets requires pyarrow and numpy: "
+                              "pip install 'sbom-libyear[parquet,aggregate]'")
+
+        compute = pyarrow.compute
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        columns = ['sbom', 'name', 'package_type', 'purl', 'years_behind', 'error']
+        for batch in parquet_file.iter_batches(batch_size=self.batch_size, columns=columns):
+            package_type = compute.fill_null(batch.column('package_type'), 'unknown')
+            name = compute.fill_null(batch.column('name'), '')
+            purl = batch.column('purl')
+            # Same identity as Baseline._identity: the purl without qualifiers, subpath and version,
+            # or type and name for components without a purl
+            identity = compute.replace_substring_regex(purl, pattern=r'[?#].*$', replacement='')
+            identity = compute.replace_substring_regex(identity, pattern=r'@[^/@]*$', replacement='')
+            fallback = compute.binary_join_element_wise(package_type, name, ':')
+            package = compute.if_else(compute.fill_null(compute.equal(purl, ''), True), fallback, identity)
+
+            error = batch.column('error')
+            failed = compute.fill_null(compute.not_equal(error, ''), False)
+            self.table.extend_encoded(
+                self._encode(compute.fill_null(batch.column('sbom'), path), self.table.sboms),
+                self._encode(package, self.table.packages),
+                self._encode(package_type, self.table.package_types),
+                compute.fill_null(batch.column('years_behind'), 0.0).to_numpy(zero_copy_only=False),
+                failed.to_numpy(zero_copy_only=False)
+            )
+
+    @staticmethod
+    def _encode(column, dictionary: _Dictionary):
+        # Only the distinct values of a batch go through Python, the rows are mapped with one array lookup
+        encoded = pyarrow.compute.dictionary_encode(column)
+        values = encoded.dictionary.to_pylist()
+        mapping = numpy.fromiter(map(dictionary.code, values), dtype=numpy.intc, count=len(values))
+        return mapping[encoded.indices.to_numpy(zero_copy_only=False)]
+
+    @staticmethod
+    def _read_csv(path: str) -> Iterator[Dict]:
+        with open(path, 'r', encoding='utf-8', newline='') as csv_file:
+            yield from csv.DictReader(csv_file)
+
+    @staticmethod
+    def _read_ndjson(path: str) -> Iterator[Dict]:
+        with open(path, 'r', encoding='utf-8') as ndjson_file:
+            for line in ndjson_file:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def _report_name(path: str) -> str:
+        name = Path(path).name
+        for suffix in ('.libyear.json', *REPORT_SUFFIXES):
+            if name.lower().endswith(suffix):
+                return name[:-len(suffix)]
+        return name
+
+    def _rank_years(self) -> Tuple:
+        # Ranks the successful rows by years behind once; each grouping then sorts a single integer key
+        failed = numpy.frombuffer(self.table.failed, dtype=numpy.int8) != 0
+        years = numpy.frombuffer(self.table.years, dtype=numpy.float64)[~failed]
+        order = numpy.argsort(years)
+        ranks = numpy.empty(len(order), dtype=numpy.int64)
+        ranks[order] = numpy.arange(len(order))
+        return failed, years, years[order], ranks
+
+    def _grouped_numpy(self, codes: array, size: int, ranked: Tuple) -> Dict[str, List]:
+        failed, years, years_by_rank, ranks = ranked
+        codes = numpy.frombuffer(codes, dtype=numpy.intc)
+
+        components = numpy.bincount(codes, minlength=size)
+        failed_counts = numpy.bincount(codes[failed], minlength=size)
+        codes = codes[~failed]
+        counts = numpy.bincount(codes, minlength=size)
+        totals = numpy.bincount(codes, weights=years, minlength=size).astype(numpy.float64)
+
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            means = numpy.where(counts > 0, totals / numpy.maximum(counts, 1), numpy.nan)
+
+        # Sorting by (group, rank) puts every group's values in a contiguous ascending run
+        keys = numpy.sort(codes.astype(numpy.int64) * max(len(ranks), 1) + ranks)
+        sorted_years = years_by_rank[keys % max(len(ranks), 1)]
+        starts = numpy.cumsum(counts) - counts
+        grouped = {
+            'components': components.tolist(),
+            'failed_analyses': failed_counts.tolist(),
+            'total_libyear': totals.tolist(),
+            'mean_libyear': means.tolist()
+        }
+        for name, quantile in PERCENTILES:
+            grouped[name] = self._percentile_numpy(sorted_years, starts, counts, quantile).tolist()
+        return grouped
+
+    @staticmethod
+    def _percentile_numpy(sorted_years, starts, counts, quantile: float):
+        result = numpy.full(len(counts), numpy.nan)
+        present = counts > 0
+        position = (counts[present] - 1) * quantile
+        lower = numpy.floor(position).astype(numpy.int64)
+        upper = numpy.ceil(position).astype(numpy.int64)
+        low = sorted_years[starts[present] + lower]
+        high = sorted_years[starts[present] + upper]
+        result[present] = low + (high - low) * (position - lower)
+        return result
+
+    def _grouped_python(self, codes: array, size: int, ranked: None = None) -> Dict[str, List]:
+        components = [0] * size
+        failed_counts = [0] * size
+        values: List[List[float]] = [[] for _ in range(size)]
+        for code, years_behind, failed in zip(codes, self.table.years, self.table.failed):
+            components[code] += 1
+            if failed:
+                failed_counts[code] += 1
+            else:
+                values[code].append(years_behind)
+
+        grouped = {
+            'components': components,
+            'failed_analyses': failed_counts,
+            'total_libyear': [sum(group, 0.0) for group in values],
+            'mean_libyear': [sum(group, 0.0) / len(group) if group else math.nan for group in values]
+        }
+        for group in values:
+            group.sort()
+        for name, quantile in PERCENTILES:
+            grouped[name] = [self._percentile(group, quantile) for group in values]
+        return grouped
+
+    @staticmethod
+    def _percentile(ordered: List[float], quantile: float) -> float:
+        # Linear interpolation between closest ranks, the same method as numpy.percentile's default
+        if not ordered:
+            return math.nan
+        position = (len(ordered) - 1) * quantile
+        lower, upper = math.floor(position), math.ceil(position)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    def _rows(self, grouped: Dict[str, List], keys: List[str], limit: Optional[int] = None) -> List[Dict]:
+        ranking = grouped[self.rank_by]
+
+        def rank(index: int) -> float:
+            value = ranking[index]
+            return -math.inf if value != value else value
+
+        if limit is None:
+            indices = sorted(range(len(keys)), key=lambda index: (-rank(index), keys[index]))
+        else:
+            indices = heapq.nlargest(limit, range(len(keys)), key=rank)
+
+        rows = []
+        for index in indices:
+            row: Dict[str, Any] = {'key': keys[index]}
+            for name, column in grouped.items():
+                value = column[index]
+                # Groups without a single successful analysis have no libyear statistics
+                row[name] = None if isinstance(value, float) and math.isnan(value) else value
+            row['successful_analyses'] = row['components'] - row['failed_analyses']
+            rows.append(row)
+        return rows
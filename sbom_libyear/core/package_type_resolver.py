@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from ..models import Component
+from ..utils import ResponseCache
+
+PackageInfo = Tuple[Optional[datetime], Optional[datetime], Optional[str]]
+
+JAVA_INDICATORS = (
+    'jackson', 'guava', 'spring', 'apache', 'junit', 'slf4j', 'log4j',
+    'commons', 'hibernate', 'dropwizard', 'jersey', 'joda', 'gson',
+    'checker', 'error_prone', 'j2objc', 'animal-sniffer', 'jsr305'
+)
+
+_REVERSE_DOMAIN = re.compile(r'^(com|org|net|io)\.[a-z0-9_-]+\.')
+_DOTTED_PASCAL_CASE = re.compile(r'^[A-Z][A-Za-z0-9]*(\.[A-Z0-9][A-Za-z0-9]*)+$')
+
+
+class PackageTypeResolver:
+    cache_namespace = 'package-type'
+
+    def __init__(self, lookup: Callable[[Component], PackageInfo], max_probes: int = 4,
+                 alookup: Optional[Callable[[Component], Awaitable[PackageInfo]]] = None):
+        self.lookup = lookup
+        self.alookup = alookup
+        self.cache = ResponseCache()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._resolved: Dict[str, str] = {}
+        self._missing: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._max_probes = max_probes
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def candidates(self, component: Component) -> List[str]:
+        name = component.name
+        if ':' in name or (component.group_id and component.artifact_id):
+            return ['maven']
+        if name.startswith('@') and '/' in name:
+            return ['npm']
+
+        if _DOTTED_PASCAL_CASE.match(name):
+            return ['nuget', 'pypi']
+
+        lowered = name.lower()
+        if _REVERSE_DOMAIN.match(lowered) or any(indicator in lowered for indicator in JAVA_INDICATORS):
+            return ['maven', 'pypi', 'npm']
+
+        return ['pypi', 'npm']
+
+    def resolve(self, component: Component) -> PackageInfo:
+        key = component.name.lower()
+        resolved, candidates = self._plan(key, component)
+        if resolved:
+            return self._probe(component, resolved) or (None, None, None)
+        if not candidates:
+            return None, None, None
+
+        if len(candidates) == 1:
+            results = {candidates[0]: self._probe(component, candidates[0])}
+        else:
+            self.logger.debug(f"Probing {', '.join(candidates)} for {component.name}")
+            probes = {
+                package_type: self._pool().submit(self._probe, component, package_type)
+                for package_type in candidates
+            }
+            results = {package_type: future.result() for package_type, future in probes.items()}
+        return self._decide(key, candidates, results)
+
+    async def aresolve(self, component: Component) -> PackageInfo:
+        key = component.name.lower()
+        resolved, candidates = self._plan(key, component)
+        if resolved:
+            return await self._aprobe(component, resolved) or (None, None, None)
+        if not candidates:
+            return None, None, None
+
+        self.logger.debug(f"Probing {', '.join(candidates)} for {component.name}")
+        probed = await asyncio.gather(*(self._aprobe(component, package_type) for package_type in candidates))
+        return self._decide(key, candidates, dict(zip(candidates, probed)))
+
+    def _plan(self, key: str, component: Component) -> Tuple[Optional[str], List[str]]:
+        resolved, missing = self._known(key)
+        if resolved:
+            return resolved, []
+
+        candidates = [package_type for package_type in self.candidates(component) if package_type not in missing]
+        if not candidates:
+            self.logger.debug(f"Skipping {component.name}: not found in {', '.join(sorted(missing))} before")
+        return None, candidates
+
+    def _decide(self, key: str, candidates: List[str], results: Dict[str, Optional[PackageInfo]]) -> PackageInfo:
+        # Candidates are ordered by likelihood, so the first hit wins when several registries know the name
+        found = [package_type for package_type in candidates
+                 if results[package_type] is not None and self._found(results[package_type])]
+        # Only registries that answered "not found" are ruled out, failed probes are tried again next time
+        missing = {package_type for package_type in candidates if results[package_type] is not None} - set(found)
+        if found or missing:
+            self._remember(key, found[0] if found else None, missing)
+        return results[found[0]] if found else (None, None, None)
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown()
+
+    def _probe(self, component: Component, package_type: str) -> Optional[PackageInfo]:
+        try:
+            return self.lookup(self._typed(component, package_type))
+        except Exception as e:
+            self.logger.debug(f"Probing {package_type} for {component.name} failed: {e}")
+            return None
+
+    async def _aprobe(self, component: Component, package_type: str) -> Optional[PackageInfo]:
+        try:
+            return await self.alookup(self._typed(component, package_type))
+        except Exception as e:
+            self.logger.debug(f"Probing {package_type} for {component.name} failed: {e}")
+            return None
+
+    def _known(self, key: str) -> Tuple[Optional[str], Set[str]]:
+        with self._lock:
+            if key in self._resolved or key in self._missing:
+                return self._resolved.get(key), self._missing.get(key, set())
+
+        entry = self.cache.get(self.cache_namespace, key) or {}
+        resolved, missing = entry.get('type'), set(entry.get('missing', []))
+        with self._lock:
+            if resolved:
+                self._resolved[key] = resolved
+            self._missing[key] = missing
+        return resolved, missing
+
+    def _remember(self, key: str, resolved: Optional[str], missing: Set[str]):
+        with self._lock:
+            if resolved:
+                self._resolved[key] = resolved
+            missing = self._missing.setdefault(key, set()).union(missing)
+            self._missing[key] = missing
+        self.cache.set(self.cache_namespace, key, {'type': resolved, 'missing': sorted(missing)})
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_probes,
+                                                    thread_name_prefix='package-type-probe')
+            return self._executor
+
+    @staticmethod
+    def _typed(component: Component, package_type: str) -> Component:
+        return replace(component, package_type=package_type)
+
+    @staticmethod
+    def _found(result: PackageInfo) -> bool:
+        return result[0] is not None or result[1] is not None or bool(result[2] and result[2] != 'unknown')
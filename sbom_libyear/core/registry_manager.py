@@ -1,71 +1,219 @@
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
-from typing import Optional, Tuple, Dict
+from typing import Dict, List, Optional, Tuple
 
 from ..models import Component
-from ..registries import PackageRegistryFactory
-from ..utils import ConfigLoader
+from ..registries import (PackageRegistry, PackageRegistryFactory, RegistryUnavailable, ReleaseIndexRegistry,
+                          SnapshotRegistry)
+from ..utils import ConfigLoader, Metrics, ReleaseIndex, RepositoryHealth, SnapshotStore
+from .package_type_resolver import PackageTypeResolver
 
 
 class RegistryManager:
-    def __init__(self, config_loader: Optional[ConfigLoader] = None):
+    def __init__(self, config_loader: Optional[ConfigLoader] = None, snapshot: Optional[SnapshotStore] = None,
+                 release_index: Optional[ReleaseIndex] = None, result_cache_size: int = 0,
+                 workers: Optional[int] = None):
         self.config_loader = config_loader or ConfigLoader()
+        self.snapshot = snapshot
+        self.release_index = release_index
         self.registries: Dict[str, any] = {}
+        self.metrics = Metrics()
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._concurrency_caps = self.config_loader.get_http_config().get('concurrency') or {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_semaphores: Dict[str, asyncio.BoundedSemaphore] = {}
+        self._results: OrderedDict = OrderedDict()
+        self._results_lock = threading.Lock()
+        self._result_cache_size = result_cache_size
+        self._result_ttl = self.config_loader.get_cache_config().get('ttl', 3600)
+        if workers is None:
+            workers = self.config_loader.get_http_config().get('workers', 1)
+        PackageRegistry.configure_hedging(workers, RepositoryHealth().hedge)
+        self.type_resolver = PackageTypeResolver(
+            self._lookup_typed_package_info,
+            max_probes=max(4, int(workers)),
+            alookup=self._alookup_typed_package_info
+        )
 
     def get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        with self.metrics.phase('lookup'), self.metrics.scope(component.package_type):
+            return self._get_package_info(component)
+
+    async def get_package_info_async(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        with self.metrics.phase('lookup'), self.metrics.scope(component.package_type):
+            return await self._aget_package_info(component)
+
+    def _get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        if not self._result_cache_size:
+            return self._lookup_package_info(component)
+        
+        key = (*self.package_key(component), component.version)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+        
+        result = self._lookup_package_info(component)
+        self._store_result(key, result)
+        return result
+
+    async def _aget_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        if not self._result_cache_size:
+            return await self._alookup_package_info(component)
+        
+        key = (*self.package_key(component), component.version)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+        
+        result = await self._alookup_package_info(component)
+        self._store_result(key, result)
+        return result
+
+    def _cached_result(self, key: Tuple[str, str, str]) -> Optional[Tuple[Optional[datetime], Optional[datetime], Optional[str]]]:
+        with self._results_lock:
+            cached = self._results.get(key)
+            if cached is not None and time.monotonic() - cached[0] <= self._result_ttl:
+                self._results.move_to_end(key)
+                return cached[1]
+        return None
+
+    def _store_result(self, key: Tuple[str, str, str],
+                      result: Tuple[Optional[datetime], Optional[datetime], Optional[str]]) -> None:
+        if any(value is not None for value in result):
+            with self._results_lock:
+                self._results[key] = (time.monotonic(), result)
+                self._results.move_to_end(key)
+                while len(self._results) > self._result_cache_size:
+                    self._results.popitem(last=False)
+
+    def _lookup_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        self.logger.debug(f"Fetching info for {component.name} ({component.package_type})")
+        
+        if component.package_type == 'unknown' and not self.snapshot:
+            return self.type_resolver.resolve(component)
+        
+        try:
+            return self._lookup_typed_package_info(component)
+        except RegistryUnavailable as e:
+            self.logger.warning(f"{component.package_type} lookup of '{component.name}' failed: {e}")
+            return None, None, None
+
+    async def _alookup_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
         self.logger.debug(f"Fetching info for {component.name} ({component.package_type})")
         
-        if component.package_type == 'unknown':
-            return self._auto_detect_package_info(component)
+        if component.package_type == 'unknown' and not self.snapshot:
+            return await self.type_resolver.aresolve(component)
+        
+        try:
+            return await self._alookup_typed_package_info(component)
+        except RegistryUnavailable as e:
+            self.logger.warning(f"{component.package_type} lookup of '{component.name}' failed: {e}")
+            return None, None, None
+
+    def close(self) -> None:
+        self.type_resolver.close()
+
+    def prefetch(self, components: List[Component]) -> None:
+        by_type: Dict[str, List[Component]] = {}
+        for component in components:
+            if component.package_type != 'unknown':
+                by_type.setdefault(component.package_type, []).append(component)
+        
+        for package_type, typed_components in by_type.items():
+            registry = self._get_or_create_registry(package_type)
+            if registry:
+                try:
+                    with self.metrics.phase('prefetch'), self.metrics.scope(package_type):
+                        registry.prefetch(typed_components)
+                except Exception as e:
+                    self.logger.debug(f"Prefetch failed for {package_type}: {e}")
+
+    def package_key(self, component: Component) -> Tuple[str, str]:
+        if component.package_type == 'unknown' and not self.snapshot:
+            return component.package_type, component.name
         
         registry = self._get_or_create_registry(component.package_type)
         if registry:
-            return registry.get_package_info(component)
+            return component.package_type, registry.package_key(component)
         
-        return None, None, None
+        return component.package_type, component.name
 
     def _get_or_create_registry(self, package_type: str):
-        if package_type not in self.registries:
-            try:
-                repositories = self.config_loader.get_repositories(package_type)
-                self.registries[package_type] = PackageRegistryFactory.create(package_type, repositories)
-            except ValueError as e:
-                self.logger.warning(f"Failed to create registry for {package_type}: {e}")
-                return None
-        
-        return self.registries[package_type]
-
-    def _auto_detect_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
-        java_indicators = [
-            'jackson', 'guava', 'spring', 'apache', 'junit', 'slf4j', 'log4j',
-            'commons', 'hibernate', 'dropwizard', 'jersey', 'joda', 'gson',
-            'checker', 'error_prone', 'j2objc', 'animal-sniffer', 'jsr305'
-        ]
-        
-        is_likely_java = any(indicator in component.name.lower() for indicator in java_indicators)
-        
-        package_types_to_try = []
-        if is_likely_java:
-            package_types_to_try.append('maven')
-        
-        package_types_to_try.extend(['pypi', 'npm'])
-        
-        for pkg_type in package_types_to_try:
-            temp_component = Component(
-                name=component.name,
-                version=component.version,
-                package_type=pkg_type,
-                namespace=component.namespace,
-                purl=component.purl,
-                group_id=component.group_id,
-                artifact_id=component.artifact_id
-            )
+        with self._lock:
+            if package_type not in self.registries:
+                if self.snapshot:
+                    registry = self._create_snapshot_registry(package_type)
+                else:
+                    try:
+                        repositories = self.config_loader.get_repositories(package_type)
+                        registry = PackageRegistryFactory.create(package_type, repositories)
+                    except ValueError as e:
+                        self.logger.warning(f"Failed to create registry for {package_type}: {e}")
+                        return None
+                
+                if self.release_index:
+                    registry = ReleaseIndexRegistry(package_type, self.release_index, registry)
+                self.registries[package_type] = registry
             
-            registry = self._get_or_create_registry(pkg_type)
-            if registry:
-                result = registry.get_package_info(temp_component)
-                if result[0] is not None or result[1] is not None or (result[2] and result[2] != 'unknown'):
-                    return result
+            return self.registries[package_type]
+
+    def _create_snapshot_registry(self, package_type: str) -> SnapshotRegistry:
+        try:
+            key_registry = PackageRegistryFactory.create(package_type, [])
+        except ValueError:
+            key_registry = None
+        return SnapshotRegistry(package_type, self.snapshot, key_registry)
+
+    @contextmanager
+    def _limit(self, package_type: str):
+        cap = self._concurrency_caps.get(package_type)
+        if not cap:
+            yield
+            return
+        
+        with self._lock:
+            if package_type not in self._semaphores:
+                self._semaphores[package_type] = threading.BoundedSemaphore(int(cap))
+            semaphore = self._semaphores[package_type]
+        
+        with semaphore:
+            yield
+
+    @asynccontextmanager
+    async def _alimit(self, package_type: str):
+        cap = self._concurrency_caps.get(package_type)
+        if not cap:
+            yield
+            return
+        
+        # Only ever awaited on the async backend's event loop, so one semaphore per type suffices
+        with self._lock:
+            if package_type not in self._async_semaphores:
+                self._async_semaphores[package_type] = asyncio.BoundedSemaphore(int(cap))
+            semaphore = self._async_semaphores[package_type]
+        
+        async with semaphore:
+            yield
+
+    def _lookup_typed_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        registry = self._get_or_create_registry(component.package_type)
+        if registry is None:
+            return None, None, None
+        
+        with self._limit(component.package_type), self.metrics.scope(component.package_type):
+            return registry.get_package_info(component)
+
+    async def _alookup_typed_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        registry = self._get_or_create_registry(component.package_type)
+        if registry is None:
+            return None, None, None
         
-        return None, None, None
\ No newline at end of file
+        async with self._alimit(component.package_type):
+            with self.metrics.scope(component.package_type):
+                return await registry.get_package_info_async(component)
@@ -0,0 +1,149 @@
+import csv
+import gzip
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from packaging.version import InvalidVersion, Version
+
+from ..models import Component
+from ..registries import PackageRegistryFactory
+from ..utils.release_index import ReleaseIndexWriter
+
+_TIME_FIELDS = ('upload_time', 'timestamp', 'released', 'lastModified', 'published')
+
+
+class ReleaseIndexBuilder:
+    def __init__(self):
+        self.writer = ReleaseIndexWriter()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._key_registries: Dict[str, Any] = {}
+
+    def ingest_npm(self, path: str) -> int:
+        records = 0
+        for row in self._read_records(path):
+            doc = row.get('doc', row)
+            if row.get('deleted') or doc.get('_deleted') or not doc.get('name', row.get('id')):
+                continue
+
+            package_key = self._package_key('npm', Component(name=doc.get('name', row.get('id')), version='', package_type='npm'))
+            for version, released in (doc.get('time') or {}).items():
+                if version not in ('created', 'modified'):
+                    self.writer.add('npm', package_key, version, self._timestamp(released))
+                    records += 1
+
+            latest = (doc.get('dist-tags') or {}).get('latest')
+            if latest:
+                self.writer.set_latest('npm', package_key, latest)
+        return records
+
+    def ingest_pypi(self, path: str) -> int:
+        records = 0
+        for row in self._read_records(path):
+            name, version = row.get('name'), row.get('version')
+            if not name or not version:
+                continue
+
+            package_key = self._package_key('pypi', Component(name=name, version=version, package_type='pypi'))
+            self.writer.add('pypi', package_key, version, self._timestamp(self._field(row, _TIME_FIELDS)))
+            records += 1
+        return records
+
+    def ingest_maven(self, path: str) -> int:
+        records = 0
+        for row in self._read_records(path):
+            group_id = row.get('groupId') or row.get('g')
+            artifact_id = row.get('artifactId') or row.get('a')
+            version = row.get('version') or row.get('v')
+            if not group_id or not artifact_id or not version:
+                continue
+
+            component = Component(name=artifact_id, version=version, package_type='maven',
+                                  group_id=group_id, artifact_id=artifact_id)
+            self.writer.add('maven', self._package_key('maven', component), version,
+                            self._timestamp(self._field(row, _TIME_FIELDS)))
+            records += 1
+        return records
+
+    def write(self, output_path: str) -> Tuple[int, int]:
+        for ecosystem, package_key, versions in self.writer.packages():
+            if not self.writer.has_latest(ecosystem, package_key):
+                latest = self._latest_version(ecosystem, versions)
+                if latest:
+                    self.writer.set_latest(ecosystem, package_key, latest)
+
+        return self.writer.write(output_path)
+
+    def _latest_version(self, ecosystem: str, versions: Dict[str, int]) -> Optional[str]:
+        if ecosystem == 'pypi':
+            candidates = []
+            for version in versions:
+                try:
+                    candidates.append((Version(version), version))
+                except InvalidVersion:
+                    continue
+            stable = [candidate for candidate in candidates if not candidate[0].is_prerelease]
+            if stable or candidates:
+                return max(stable or candidates)[1]
+
+        releases = [(released, version) for version, released in versions.items() if 'SNAPSHOT' not in version]
+        return max(releases)[1] if releases else None
+
+    def _package_key(self, ecosystem: str, component: Component) -> str:
+        if ecosystem not in self._key_registries:
+            self._key_registries[ecosystem] = PackageRegistryFactory.create(ecosystem, [])
+        return self._key_registries[ecosystem].package_key(component)
+
+    def _read_records(self, path: str) -> Iterator[Dict[str, Any]]:
+        opener = gzip.open if path.endswith('.gz') else open
+        name = path[:-3] if path.endswith('.gz') else path
+
+        with opener(path, 'rt', encoding='utf-8', newline='') as dump:
+            if name.endswith(('.csv', '.tsv')):
+                yield from csv.DictReader(dump, delimiter='\t' if name.endswith('.tsv') else ',')
+                return
+
+            for line_number, line in enumerate(dump, 1):
+                line = line.strip().rstrip(',')
+                if not line.startswith('{'):
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    self.logger.debug(f"Skipping malformed record {path}:{line_number}: {e}")
+
+    @staticmethod
+    def _field(row: Dict[str, Any], names: Tuple[str, ...]) -> Any:
+        for name in names:
+            if row.get(name) not in (None, ''):
+                return row[name]
+        return None
+
+    @staticmethod
+    def _timestamp(value: Any) -> Optional[int]:
+        if value in (None, ''):
+            return None
+
+        if isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                pass
+
+        if isinstance(value, (int, float)):
+            # Maven index and Solr timestamps are epoch milliseconds
+            return int(value / 1000) if value > 10 ** 11 else int(value)
+
+        text = value.strip().replace(' UTC', '+00:00').replace('Z', '+00:00').replace(' ', 'T', 1)
+        if '.' in text:
+            head, _, tail = text.partition('.')
+            digits = len(tail) - len(tail.lstrip('0123456789'))
+            text = f"{head}.{tail[:digits][:6].ljust(6, '0')}{tail[digits:]}"
+        try:
+            released = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+        if released.tzinfo is None:
+            released = released.replace(tzinfo=timezone.utc)
+        return int(released.timestamp())
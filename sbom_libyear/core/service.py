@@ -0,0 +1,112 @@
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from ..models import LibyearReport
+from ..reports import JSONReportGenerator
+from ..utils import Metrics
+from .calculator import LibyearCalculator
+
+
+class LibyearService:
+    def __init__(self, calculator: LibyearCalculator, max_concurrent: int = 4,
+                 max_upload_bytes: int = 100 * 1024 * 1024):
+        self.calculator = calculator
+        self.max_upload_bytes = max_upload_bytes
+        self.report_generator = JSONReportGenerator(include_metrics=False)
+        self.metrics = Metrics()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent))
+
+    def analyze(self, content: str, filename: Optional[str] = None,
+                media_type: Optional[str] = None) -> LibyearReport:
+        components = self.calculator.parser_context.parse_content(content, filename, media_type)
+        with self._slots:
+            results = self.calculator.calculate_components(components)
+        return self.report_generator._create_report_data(results)
+
+    def format_report(self, report: LibyearReport) -> str:
+        return self.report_generator._format_report(report)
+
+
+class LibyearRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'sbom-libyear'
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def service(self) -> LibyearService:
+        return self.server.service
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif path == '/metrics' and self.service.metrics.enabled:
+            body = Metrics.to_openmetrics(self.service.metrics.snapshot()).encode('utf-8')
+            self._send_body(200, body, 'application/openmetrics-text; version=1.0.0; charset=utf-8')
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != '/analyze':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            self._send_json(411, {'error': 'Content-Length required'})
+            return
+        if length > self.service.max_upload_bytes:
+            self._send_json(413, {'error': f"SBOM exceeds {self.service.max_upload_bytes} bytes"})
+            self.close_connection = True
+            return
+
+        content = self.rfile.read(length).decode('utf-8-sig', errors='replace')
+        filename = parse_qs(url.query).get('filename', [None])[0]
+        media_type = self.headers.get('Content-Type', '').split(';', 1)[0].strip() or None
+
+        started = time.perf_counter()
+        try:
+            report = self.service.analyze(content, filename, media_type)
+        except (ValueError, SyntaxError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        except Exception as e:
+            self.service.logger.exception("SBOM analysis failed")
+            self._send_json(500, {'error': str(e)})
+            return
+
+        self.service.logger.info(
+            f"Analyzed {report.total_components} components in {time.perf_counter() - started:.3f}s"
+        )
+        self._send_body(200, self.service.format_report(report).encode('utf-8'),
+                        extra_headers=(('X-Libyear-Total', f"{report.total_libyear:.4f}"),))
+
+    def log_message(self, format, *args):
+        self.service.logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status: int, payload: dict):
+        self._send_body(status, json.dumps(payload).encode('utf-8'))
+
+    def _send_body(self, status: int, body: bytes, content_type: str = 'application/json; charset=utf-8',
+                   extra_headers: Tuple[Tuple[str, str], ...] = ()):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in extra_headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(service: LibyearService, host: str = '127.0.0.1', port: int = 8080) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), LibyearRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
@@ -0,0 +1,35 @@
+import logging
+from typing import List, Optional
+
+from ..utils import ConfigLoader, SnapshotStore
+from .calculator import LibyearCalculator
+
+
+class SnapshotExporter:
+    def __init__(self, config_loader: Optional[ConfigLoader] = None, workers: Optional[int] = None):
+        self.calculator = LibyearCalculator(config_loader, workers=workers)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def export(self, sbom_files: List[str], output_path: str) -> int:
+        store = SnapshotStore(output_path, writable=True)
+        registry_manager = self.calculator.registry_manager
+        exported = 0
+        
+        try:
+            for sbom_file in sbom_files:
+                self.logger.info(f"Snapshotting release dates for {sbom_file}")
+                rows = []
+                for result in self.calculator.calculate_from_sbom(sbom_file):
+                    if result.current_date is None and result.latest_date is None and result.latest_version == 'unknown':
+                        continue
+                    package_type, package_key = registry_manager.package_key(result.component)
+                    rows.append((
+                        package_type, package_key, result.component.version,
+                        (result.current_date, result.latest_date, result.latest_version)
+                    ))
+                exported += store.store(rows)
+        finally:
+            store.close()
+            self.calculator.close()
+        
+        return exported
@@ -1,6 +1,10 @@
 from .component import Component
+from .libyear_delta import LibyearDelta
 from .libyear_result import LibyearResult
 from .libyear_report import LibyearReport
+from .maven_metadata import MavenMetadata
 from .repository_config import RepositoryConfig
+from .result_table import ResultTable
 
-__all__ = ['Component', 'LibyearResult', 'LibyearReport', 'RepositoryConfig']
\ No newline at end of file
+__all__ = ['Component', 'LibyearDelta', 'LibyearResult', 'LibyearReport', 'MavenMetadata', 'RepositoryConfig',
+           'ResultTable']
\ No newline at end of file
@@ -1,8 +1,12 @@
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# Slotted dataclasses need Python 3.10; older interpreters keep a per-instance __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Component:
     name: str
     version: str
@@ -10,4 +14,9 @@ class Component:
     namespace: Optional[str] = None
     purl: Optional[str] = None
     group_id: Optional[str] = None
-    artifact_id: Optional[str] = None
\ No newline at end of file
+    artifact_id: Optional[str] = None
+
+    def __post_init__(self):
+        # A handful of package types repeat across every component, so share one string per type
+        if isinstance(self.package_type, str):
+            self.package_type = sys.intern(self.package_type)
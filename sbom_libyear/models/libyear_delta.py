@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class LibyearDelta:
+    baseline: str
+    baseline_total_libyear: float
+    total_libyear: float
+    libyear_delta: float
+    reused_components: int
+    refreshed_components: int
+    added: List[Dict]
+    removed: List[Dict]
+    changed: List[Dict]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Sequence
 
 
 @dataclass
@@ -9,5 +9,5 @@ class LibyearReport:
     successful_analyses: int
     failed_analyses: int
     breakdown_by_package_manager: Dict[str, Dict[str, float]]
-    components: List[Dict]
-    errors: List[Dict]
\ No newline at end of file
+    components: Sequence[Dict]
+    errors: Sequence[Dict]
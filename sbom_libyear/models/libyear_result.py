@@ -1,16 +1,46 @@
+import calendar
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from .component import Component
+from .component import DATACLASS_SLOTS, Component
 
 
-@dataclass
+def to_timestamp(value: Optional[datetime]) -> Optional[int]:
+    # Naive datetimes from registries are UTC
+    return calendar.timegm(value.utctimetuple()) if value else None
+
+
+def from_timestamp(value: Optional[int]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value, tz=timezone.utc) if value is not None else None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LibyearResult:
     component: Component
     current_version: str
     latest_version: str
-    current_date: Optional[datetime]
-    latest_date: Optional[datetime]
+    current_timestamp: Optional[int]
+    latest_timestamp: Optional[int]
     years_behind: float
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+    checked_timestamp: Optional[int] = None
+
+    @classmethod
+    def from_dates(cls, component: Component, current_version: str, latest_version: str,
+                   current_date: Optional[datetime], latest_date: Optional[datetime], years_behind: float,
+                   error: Optional[str] = None, checked_at: Optional[datetime] = None) -> 'LibyearResult':
+        return cls(component, current_version, latest_version, to_timestamp(current_date),
+                   to_timestamp(latest_date), years_behind, error, to_timestamp(checked_at))
+
+    @property
+    def current_date(self) -> Optional[datetime]:
+        return from_timestamp(self.current_timestamp)
+
+    @property
+    def latest_date(self) -> Optional[datetime]:
+        return from_timestamp(self.latest_timestamp)
+
+    @property
+    def checked_at(self) -> Optional[datetime]:
+        return from_timestamp(self.checked_timestamp)
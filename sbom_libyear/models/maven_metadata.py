@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class MavenMetadata:
+    release: Optional[str] = None
+    latest: Optional[str] = None
+    versions: List[str] = field(default_factory=list)
+    last_updated: Optional[str] = None
+    timestamp: Optional[str] = None
@@ -7,6 +7,8 @@ class RepositoryConfig:
     name: str
     url: str
     search_url: Optional[str] = None
+    service_index: Optional[str] = None
+    simple_url: Optional[str] = None
     enabled: bool = True
     priority: int = 1
     auth: Optional[Dict[str, str]] = None
\ No newline at end of file
@@ -0,0 +1,105 @@
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .component import Component
+from .libyear_result import LibyearResult
+
+MISSING = -(2 ** 63)
+
+
+# Dates, years behind and package types live in typed arrays and rarely set fields in sparse dicts,
+# so a result costs a few dozen bytes instead of two objects; indexing builds a LibyearResult on the fly
+class ResultTable(Sequence):
+    def __init__(self, results: Iterable[LibyearResult] = ()):
+        self._names: List[str] = []
+        self._versions: List[str] = []
+        self._purls: List[Optional[str]] = []
+        self._latest_versions: List[str] = []
+        self._types = array('H')
+        self._type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._current = array('q')
+        self._latest = array('q')
+        self._checked = array('q')
+        self._years = array('d')
+        self._errors: Dict[int, str] = {}
+        self._details: Dict[int, Tuple[Optional[str], Optional[str], Optional[str], str]] = {}
+        self.extend(results)
+
+    def append(self, result: LibyearResult):
+        component = result.component
+        index = len(self._names)
+
+        code = self._type_codes.get(component.package_type)
+        if code is None:
+            code = self._type_codes[component.package_type] = len(self._type_names)
+            self._type_names.append(component.package_type)
+
+        self._names.append(component.name)
+        self._versions.append(component.version)
+        self._purls.append(component.purl)
+        self._latest_versions.append(sys.intern(result.latest_version))
+        self._types.append(code)
+        self._current.append(_column(result.current_timestamp))
+        self._latest.append(_column(result.latest_timestamp))
+        self._checked.append(_column(result.checked_timestamp))
+        self._years.append(result.years_behind)
+
+        if result.error is not None:
+            # Error messages are shared by most failures, keep one copy of each
+            self._errors[index] = sys.intern(result.error)
+        if (component.namespace or component.group_id or component.artifact_id
+                or result.current_version != component.version):
+            self._details[index] = (component.namespace, component.group_id, component.artifact_id,
+                                    result.current_version)
+
+    def extend(self, results: Iterable[LibyearResult]):
+        for result in results:
+            self.append(result)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('result index out of range')
+
+        version = self._versions[index]
+        namespace, group_id, artifact_id, current_version = self._details.get(index, (None, None, None, version))
+        component = Component(
+            name=self._names[index],
+            version=version,
+            package_type=self._type_names[self._types[index]],
+            namespace=namespace,
+            purl=self._purls[index],
+            group_id=group_id,
+            artifact_id=artifact_id
+        )
+        return LibyearResult(
+            component=component,
+            current_version=current_version,
+            latest_version=self._latest_versions[index],
+            current_timestamp=_value(self._current[index]),
+            latest_timestamp=_value(self._latest[index]),
+            years_behind=self._years[index],
+            error=self._errors.get(index),
+            checked_timestamp=_value(self._checked[index])
+        )
+
+    def __iter__(self) -> Iterator[LibyearResult]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def _column(value: Optional[int]) -> int:
+    return MISSING if value is None else value
+
+
+def _value(value: int) -> Optional[int]:
+    return None if value == MISSING else value
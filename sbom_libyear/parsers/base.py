@@ -1,11 +1,44 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
 import logging
 
 from ..models import Component
 
+DETECTION_PREFIX_SIZE = 64 * 1024
+
+PURL_TYPE_ALIASES = {
+    'pip': 'pypi',
+    'python': 'pypi',
+    'node': 'npm',
+    'javascript': 'npm',
+    'dotnet': 'nuget',
+    'java': 'maven',
+    'java-archive': 'maven',
+    'jenkins-plugin': 'maven'
+}
+
+REPOSITORY_HOSTS = (
+    ('npmjs.org', 'npm'),
+    ('npmjs.com', 'npm'),
+    ('pypi.org', 'pypi'),
+    ('pythonhosted.org', 'pypi'),
+    ('nuget.org', 'nuget'),
+    ('maven', 'maven'),
+    ('mvnrepository', 'maven')
+)
+
+REGISTRY_TYPES = ('maven', 'npm', 'pypi', 'nuget')
+
+# Package type properties written by syft, cdxgen and other CycloneDX generators
+TYPE_PROPERTIES = ('syft:package:type', 'syft:package:language', 'language')
+
 
 class SBOMParser(ABC):
+    document_format: Optional[str] = None
+    file_suffixes: Tuple[str, ...] = ()
+    media_types: Tuple[str, ...] = ()
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -17,22 +50,72 @@ class SBOMParser(ABC):
     def can_parse(self, content: str) -> bool:
         pass
 
+    def detect(self, prefix: str) -> bool:
+        return self.can_parse(prefix)
+
+    def decode(self, content: str) -> Any:
+        return content
+
+    def parse_document(self, document: Any) -> List[Component]:
+        return self.parse(document)
+
+    def matches_document(self, document: Any) -> bool:
+        return False
+
+    def iter_components(self, stream: TextIO) -> Iterator[Component]:
+        yield from self.parse(stream.read())
+
     def _parse_purl(self, purl: str) -> Tuple[str, Optional[str], Optional[str]]:
         if not purl or not purl.startswith('pkg:'):
             return 'unknown', None, None
         
-        purl_parts = purl[4:]
+        purl_parts, _, qualifiers = purl[4:].split('#', 1)[0].partition('?')
         
-        if '@' in purl_parts:
-            purl_parts = purl_parts.split('@')[0]
+        head, _, tail = purl_parts.rpartition('/')
+        if '@' in tail:
+            purl_parts = f"{head}/{tail.split('@')[0]}" if head else tail.split('@')[0]
         
         parts = purl_parts.split('/')
         
-        package_type = parts[0] if parts else 'unknown'
+        package_type = self._normalize_package_type(parts[0]) if parts else 'unknown'
         namespace = parts[1] if len(parts) > 1 else None
         name = parts[2] if len(parts) > 2 else None
         
-        if package_type == 'maven':
-            return package_type, namespace, name
+        if package_type == 'generic' and qualifiers:
+            # generic purls may still point at a known registry through their qualifiers
+            values = parse_qs(qualifiers)
+            for qualifier in ('repository_url', 'download_url'):
+                package_type = self._package_type_from_url(unquote(values.get(qualifier, [''])[0])) or package_type
+                if package_type != 'generic':
+                    break
         
-        return package_type, namespace, name
\ No newline at end of file
+        return package_type, namespace, name
+
+    def _package_type_from_properties(self, properties: Iterable[Dict[str, Any]]) -> Optional[str]:
+        for prop in properties or ():
+            name = str(prop.get('name', ''))
+            if name in TYPE_PROPERTIES:
+                value = str(prop.get('value') or '')
+            elif name.startswith('cdx:') and name.count(':') >= 2:
+                # cdxgen namespaces its properties by ecosystem, e.g. cdx:npm:package_json
+                value = name.split(':')[1]
+            else:
+                continue
+            
+            package_type = self._normalize_package_type(value)
+            if package_type in REGISTRY_TYPES:
+                return package_type
+        return None
+
+    @staticmethod
+    def _package_type_from_url(url: str) -> Optional[str]:
+        host = urlsplit(url if '//' in url else f"//{url}").netloc.lower()
+        for fragment, package_type in REPOSITORY_HOSTS:
+            if fragment in host:
+                return package_type
+        return None
+
+    @staticmethod
+    def _normalize_package_type(package_type: str) -> str:
+        package_type = package_type.strip().lower()
+        return PURL_TYPE_ALIASES.get(package_type, package_type) or 'unknown'
@@ -1,47 +1,77 @@
 import json
-from typing import List
+from typing import Any, Iterator, List, Optional, TextIO
 
 from ..models import Component
-from .base import SBOMParser
+from .base import DETECTION_PREFIX_SIZE, SBOMParser
+from .json_stream import iter_json_array
 
 
 class CycloneDXJSONParser(SBOMParser):
+    document_format = 'json'
+    file_suffixes = ('.cdx.json', '.bom.json')
+    media_types = ('application/vnd.cyclonedx+json',)
+
     def can_parse(self, content: str) -> bool:
-        try:
-            if content.strip().startswith('{'):
-                data = json.loads(content)
-                return 'bomFormat' in data
-        except:
-            pass
-        return False
+        return self.detect(content[:DETECTION_PREFIX_SIZE])
+
+    def detect(self, prefix: str) -> bool:
+        return prefix.lstrip().startswith('{') and '"bomFormat"' in prefix
+
+    def decode(self, content: str) -> Any:
+        return json.loads(content)
+
+    def matches_document(self, document: Any) -> bool:
+        return isinstance(document, dict) and 'bomFormat' in document
 
     def parse(self, content: str) -> List[Component]:
-        cyclonedx_data = json.loads(content)
+        return self.parse_document(self.decode(content))
+
+    def parse_document(self, cyclonedx_data: dict) -> List[Component]:
         components = []
         
         for component in cyclonedx_data.get('components', []):
-            name = component.get('name', '')
-            version = component.get('version', '')
-            purl = component.get('purl', '')
-            
-            package_type = 'unknown'
-            group_id = None
-            artifact_id = None
-            
-            if purl:
-                package_type, group_id, artifact_id = self._parse_purl(purl)
-                
-            if name and version:
-                components.append(Component(
-                    name=name,
-                    version=version,
-                    package_type=package_type,
-                    purl=purl,
-                    group_id=group_id,
-                    artifact_id=artifact_id
-                ))
-            elif name and not version:
-                self.logger.warning(f"Skipping component '{name}' - no version information")
+            parsed = self._component_from(component)
+            if parsed:
+                components.append(parsed)
         
         self.logger.info(f"Parsed {len(components)} components from CycloneDX JSON")
-        return components
\ No newline at end of file
+        return components
+
+    def iter_components(self, stream: TextIO) -> Iterator[Component]:
+        count = 0
+        for component in iter_json_array(stream, 'components'):
+            parsed = self._component_from(component)
+            if parsed:
+                count += 1
+                yield parsed
+        
+        self.logger.info(f"Parsed {count} components from CycloneDX JSON")
+
+    def _component_from(self, component: dict) -> Optional[Component]:
+        name = component.get('name', '')
+        version = component.get('version', '')
+        purl = component.get('purl', '')
+        
+        package_type = 'unknown'
+        group_id = None
+        artifact_id = None
+        
+        if purl:
+            package_type, group_id, artifact_id = self._parse_purl(purl)
+        
+        if package_type in ('unknown', 'generic'):
+            package_type = self._package_type_from_properties(component.get('properties')) or package_type
+            
+        if name and version:
+            return Component(
+                name=name,
+                version=version,
+                package_type=package_type,
+                purl=purl,
+                group_id=group_id,
+                artifact_id=artifact_id
+            )
+        elif name and not version:
+            self.logger.warning(f"Skipping component '{name}' - no version information")
+        
+        return None
\ No newline at end of file
@@ -1,16 +1,31 @@
 import xml.etree.ElementTree as ET
-from typing import List
+from typing import Any, Iterator, List, Optional, TextIO
 
 from ..models import Component
-from .base import SBOMParser
+from .base import DETECTION_PREFIX_SIZE, SBOMParser
 
 
 class CycloneDXXMLParser(SBOMParser):
+    document_format = 'xml'
+    file_suffixes = ('.cdx.xml', '.bom.xml', '.xml')
+    media_types = ('application/vnd.cyclonedx+xml',)
+
     def can_parse(self, content: str) -> bool:
-        return content.strip().startswith('<') and 'cyclonedx' in content.lower()
+        return self.detect(content[:DETECTION_PREFIX_SIZE])
+
+    def detect(self, prefix: str) -> bool:
+        return prefix.lstrip().startswith('<') and 'cyclonedx' in prefix.lower()
+
+    def decode(self, content: str) -> Any:
+        return ET.fromstring(content)
+
+    def matches_document(self, document: Any) -> bool:
+        return isinstance(document, ET.Element) and 'cyclonedx' in document.tag.lower()
 
     def parse(self, content: str) -> List[Component]:
-        root = ET.fromstring(content)
+        return self.parse_document(self.decode(content))
+
+    def parse_document(self, root: ET.Element) -> List[Component]:
         components = []
         
         ns = {'': 'http://cyclonedx.org/schema/bom/1.4'}
@@ -19,26 +34,71 @@ class CycloneDXXMLParser(SBOMParser):
             ns = {'bom': ns_uri}
         
         for component in root.findall('.//bom:component', ns):
-            name = component.get('name', '')
-            version = component.get('version', '')
-            purl = component.get('purl', '')
-            
-            package_type = 'unknown'
-            group_id = None
-            artifact_id = None
+            parsed = self._component_from(component)
+            if parsed:
+                components.append(parsed)
+        
+        self.logger.info(f"Parsed {len(components)} components from CycloneDX XML")
+        return components
+
+    def iter_components(self, stream: TextIO) -> Iterator[Component]:
+        count = 0
+        component_tag = None
+        elements = []
+        components_open = 0
+        
+        for event, element in ET.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                if component_tag is None:
+                    if element.tag.startswith('{'):
+                        component_tag = f"{{{element.tag[1:].split('}')[0]}}}component"
+                    else:
+                        component_tag = 'component'
+                elements.append(element)
+                
+                if element.tag == component_tag:
+                    components_open += 1
+                    parsed = self._component_from(element)
+                    if parsed:
+                        count += 1
+                        yield parsed
+                continue
             
-            if purl:
-                package_type, group_id, artifact_id = self._parse_purl(purl)
+            elements.pop()
+            if element.tag == component_tag:
+                components_open -= 1
+            elif components_open:
+                # Children of a component are released together with it
+                continue
             
-            if name and version:
-                components.append(Component(
-                    name=name,
-                    version=version,
-                    package_type=package_type,
-                    purl=purl,
-                    group_id=group_id,
-                    artifact_id=artifact_id
-                ))
+            # Finished elements are emptied and detached, so neither metadata, dependencies
+            # nor the root's list of processed siblings grow with the document
+            element.clear()
+            if elements and len(elements[-1]) and elements[-1][-1] is element:
+                del elements[-1][-1]
         
-        self.logger.info(f"Parsed {len(components)} components from CycloneDX XML")
-        return components
\ No newline at end of file
+        self.logger.info(f"Parsed {count} components from CycloneDX XML")
+
+    def _component_from(self, component: ET.Element) -> Optional[Component]:
+        name = component.get('name', '')
+        version = component.get('version', '')
+        purl = component.get('purl', '')
+        
+        package_type = 'unknown'
+        group_id = None
+        artifact_id = None
+        
+        if purl:
+            package_type, group_id, artifact_id = self._parse_purl(purl)
+        
+        if name and version:
+            return Component(
+                name=name,
+                version=version,
+                package_type=package_type,
+                purl=purl,
+                group_id=group_id,
+                artifact_id=artifact_id
+            )
+        
+        return None
\ No newline at end of file
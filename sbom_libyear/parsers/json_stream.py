@@ -0,0 +1,126 @@
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+CHUNK_SIZE = 1024 * 1024
+
+_TOP_LEVEL_TOKENS = re.compile(r'["{}\[\]:,]')
+_NESTED_TOKENS = re.compile(r'["{}\[\]]')
+_STRING_END = re.compile(r'["\\]')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_VALUE_END = re.compile(r'[\s,\]}]')
+
+
+class _Reader:
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+
+    def fill(self) -> bool:
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer += chunk
+        return True
+
+    def compact(self) -> None:
+        if self.pos > self.chunk_size:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+    def search(self, pattern) -> re.Match:
+        while True:
+            match = pattern.search(self.buffer, self.pos)
+            if match:
+                return match
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def skip_whitespace(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def skip_string(self) -> int:
+        start = self.pos
+        self.pos += 1
+        while True:
+            match = self.search(_STRING_END)
+            if match.group() == '\\':
+                self.pos = match.end() + 1
+                while self.pos > len(self.buffer):
+                    if not self.fill():
+                        raise ValueError("Unexpected end of JSON document")
+                continue
+            self.pos = match.end()
+            return start
+
+
+def iter_json_array(stream: TextIO, key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    reader = _Reader(stream, chunk_size)
+    decoder = json.JSONDecoder()
+
+    if reader.skip_whitespace() != '{':
+        raise ValueError("JSON document is not an object")
+    reader.pos += 1
+
+    depth = 1
+    last_string = None
+    while True:
+        reader.compact()
+        match = reader.search(_TOP_LEVEL_TOKENS if depth == 1 else _NESTED_TOKENS)
+        token = match.group()
+        reader.pos = match.start()
+
+        if token == '"':
+            start = reader.skip_string()
+            if depth == 1:
+                last_string = json.loads(reader.buffer[start:reader.pos])
+            continue
+
+        reader.pos += 1
+        if token in '{[':
+            depth += 1
+        elif token in '}]':
+            depth -= 1
+            if depth == 0:
+                return
+        elif token == ':' and last_string == key:
+            break
+        last_string = None
+
+    if reader.skip_whitespace() != '[':
+        return
+    reader.pos += 1
+
+    while True:
+        reader.compact()
+        char = reader.skip_whitespace()
+        if char == ',':
+            reader.pos += 1
+            continue
+        if char in (']', ''):
+            return
+
+        if char not in '{["':
+            while not _VALUE_END.search(reader.buffer, reader.pos) and reader.fill():
+                pass
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(reader.buffer, reader.pos)
+            except json.JSONDecodeError:
+                if reader.fill():
+                    continue
+                raise
+            if end == len(reader.buffer) and reader.fill():
+                continue
+            break
+
+        reader.pos = end
+        yield item
@@ -1,9 +1,9 @@
-import json
 import logging
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..models import Component
-from .base import SBOMParser
+from ..utils.metrics import Metrics
+from .base import DETECTION_PREFIX_SIZE, SBOMParser
 from .cyclonedx_json import CycloneDXJSONParser
 from .cyclonedx_xml import CycloneDXXMLParser
 from .spdx_json import SPDXJSONParser
@@ -16,6 +16,7 @@ class SBOMParserContext:
             CycloneDXJSONParser(),
             CycloneDXXMLParser()
         ]
+        self.metrics = Metrics()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def parse_file(self, filepath: str) -> List[Component]:
@@ -24,12 +25,75 @@ class SBOMParserContext:
         
         self.logger.info(f"Parsing SBOM file: {filepath}")
         
+        return self.parse_content(content, filename=filepath)
+
+    def parse_content(self, content: str, filename: Optional[str] = None,
+                      media_type: Optional[str] = None) -> List[Component]:
+        with self.metrics.phase('parse'):
+            return self._parse_content(content, filename, media_type)
+
+    def _parse_content(self, content: str, filename: Optional[str] = None,
+                       media_type: Optional[str] = None) -> List[Component]:
+        parser = self.detect_parser(content[:DETECTION_PREFIX_SIZE], filename, media_type)
+        if parser:
+            self.logger.info(f"Using parser: {parser.__class__.__name__}")
+            return parser.parse_document(parser.decode(content))
+        
+        documents: Dict[str, Any] = {}
         for parser in self.parsers:
-            if parser.can_parse(content):
+            if parser.document_format is None:
+                if parser.can_parse(content):
+                    self.logger.info(f"Using parser: {parser.__class__.__name__}")
+                    return parser.parse(content)
+                continue
+            
+            if parser.document_format not in documents:
+                try:
+                    documents[parser.document_format] = parser.decode(content)
+                except Exception:
+                    documents[parser.document_format] = None
+            
+            document = documents[parser.document_format]
+            if document is not None and parser.matches_document(document):
                 self.logger.info(f"Using parser: {parser.__class__.__name__}")
-                return parser.parse(content)
+                return parser.parse_document(document)
         
         raise ValueError("SBOM format not recognized. Expected SPDX or CycloneDX in JSON or XML format.")
 
+    def detect_parser(self, prefix: str, filename: Optional[str] = None,
+                      media_type: Optional[str] = None) -> Optional[SBOMParser]:
+        if media_type:
+            media_type = media_type.split(';')[0].strip().lower()
+            for parser in self.parsers:
+                if media_type in parser.media_types:
+                    return parser
+        
+        for parser in self.parsers:
+            if parser.detect(prefix):
+                return parser
+        
+        if filename:
+            filename = filename.lower()
+            for parser in self.parsers:
+                if any(filename.endswith(suffix) for suffix in parser.file_suffixes):
+                    return parser
+        
+        return None
+
+    def iter_file(self, filepath: str) -> Iterator[Component]:
+        with open(filepath, 'r', encoding='utf-8') as sbom_file:
+            prefix = sbom_file.read(DETECTION_PREFIX_SIZE)
+            sbom_file.seek(0)
+            
+            self.logger.info(f"Parsing SBOM file: {filepath}")
+            
+            parser = self.detect_parser(prefix, filepath)
+            if parser:
+                self.logger.info(f"Using streaming parser: {parser.__class__.__name__}")
+                yield from self.metrics.timed('parse', parser.iter_components(sbom_file))
+                return
+        
+        yield from self.parse_file(filepath)
+
     def register_parser(self, parser: SBOMParser):
         self.parsers.append(parser)
\ No newline at end of file
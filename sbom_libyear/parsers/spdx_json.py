@@ -1,40 +1,84 @@
 import json
-from typing import List
+from typing import Any, Iterator, List, Optional, TextIO
 
 from ..models import Component
-from .base import SBOMParser
+from .base import DETECTION_PREFIX_SIZE, SBOMParser
+from .json_stream import iter_json_array
 
 
 class SPDXJSONParser(SBOMParser):
+    document_format = 'json'
+    file_suffixes = ('.spdx.json',)
+    media_types = ('application/spdx+json',)
+
     def can_parse(self, content: str) -> bool:
-        try:
-            if content.strip().startswith('{'):
-                data = json.loads(content)
-                return 'spdxVersion' in data
-        except:
-            pass
-        return False
+        return self.detect(content[:DETECTION_PREFIX_SIZE])
+
+    def detect(self, prefix: str) -> bool:
+        return prefix.lstrip().startswith('{') and '"spdxVersion"' in prefix
+
+    def decode(self, content: str) -> Any:
+        return json.loads(content)
+
+    def matches_document(self, document: Any) -> bool:
+        return isinstance(document, dict) and 'spdxVersion' in document
 
     def parse(self, content: str) -> List[Component]:
-        spdx_data = json.loads(content)
+        return self.parse_document(self.decode(content))
+
+    def parse_document(self, spdx_data: dict) -> List[Component]:
         components = []
         
         for package in spdx_data.get('packages', []):
-            name = package.get('name', '')
-            version = package.get('versionInfo', '')
-            
-            package_type = self._determine_package_type(package)
-            
-            if name and version:
-                components.append(Component(
-                    name=name,
-                    version=version,
-                    package_type=package_type
-                ))
+            component = self._component_from(package)
+            if component:
+                components.append(component)
         
         self.logger.info(f"Parsed {len(components)} components from SPDX JSON")
         return components
 
+    def iter_components(self, stream: TextIO) -> Iterator[Component]:
+        count = 0
+        for package in iter_json_array(stream, 'packages'):
+            component = self._component_from(package)
+            if component:
+                count += 1
+                yield component
+        
+        self.logger.info(f"Parsed {count} components from SPDX JSON")
+
+    def _component_from(self, package: dict) -> Optional[Component]:
+        name = package.get('name', '')
+        version = package.get('versionInfo', '')
+        
+        purl = self._package_manager_purl(package)
+        group_id = None
+        artifact_id = None
+        
+        if purl:
+            package_type, group_id, artifact_id = self._parse_purl(purl)
+        else:
+            package_type = self._determine_package_type(package)
+        
+        if name and version:
+            return Component(
+                name=name,
+                version=version,
+                package_type=package_type,
+                purl=purl,
+                group_id=group_id,
+                artifact_id=artifact_id
+            )
+        
+        return None
+
+    def _package_manager_purl(self, package: dict) -> Optional[str]:
+        for ref in package.get('externalRefs', []):
+            category = ref.get('referenceCategory', '').replace('_', '-').upper()
+            if category == 'PACKAGE-MANAGER' and ref.get('referenceType') == 'purl' and ref.get('referenceLocator'):
+                return ref['referenceLocator']
+        return None
+
     def _determine_package_type(self, package: dict) -> str:
         download_location = package.get('downloadLocation', '')
         
@@ -50,7 +94,6 @@ class SPDXJSONParser(SBOMParser):
         name = package.get('name', '')
         if ':' in name:
             return 'maven'
-        elif '.' in name and not name.endswith('.py'):
-            return 'maven'
         
+        # Dotted names are as likely PyPI or NuGet packages, the registry manager resolves them
         return 'unknown'
\ No newline at end of file
@@ -1,15 +1,20 @@
-from .base import PackageRegistry
+from .base import PackageRegistry, RegistryUnavailable
 from .factory import PackageRegistryFactory
 from .maven import MavenRegistry
 from .npm import NpmRegistry
 from .nuget import NugetRegistry
 from .pypi import PypiRegistry
+from .release_index import ReleaseIndexRegistry
+from .snapshot import SnapshotRegistry
 
 __all__ = [
     'PackageRegistry',
+    'RegistryUnavailable',
     'PackageRegistryFactory',
     'MavenRegistry',
     'NpmRegistry',
     'NugetRegistry',
-    'PypiRegistry'
+    'PypiRegistry',
+    'ReleaseIndexRegistry',
+    'SnapshotRegistry'
 ]
\ No newline at end of file
@@ -1,26 +1,419 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Optional, Tuple, List
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, List
 import logging
+import threading
+import time
 
 from ..models import Component, RepositoryConfig
 from ..utils.http_client import HttpClient
+from ..utils.metrics import Metrics
+from ..utils.repository_health import RepositoryHealth
+from ..utils.response_cache import ResponseCache
+
+
+_MISSING = object()
+
+NOT_FOUND_STATUS_CODES = {404, 410}
+
+
+class RegistryUnavailable(Exception):
+    pass
 
 
 class PackageRegistry(ABC):
+    package_type = 'unknown'
+    memo_size = 256
+    namespace_memo_size = 1024
+    hedge_pool_size = 32
+
+    _hedge_pool: Optional[ThreadPoolExecutor] = None
+    _hedge_pool_lock = threading.Lock()
+
     def __init__(self, repositories: List[RepositoryConfig]):
         self.repositories = repositories
         self.http_client = HttpClient()
+        self.cache = ResponseCache()
+        self.metrics = Metrics()
+        self.health = RepositoryHealth()
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._documents: OrderedDict = OrderedDict()
+        self._documents_lock = threading.Lock()
+        self._namespaces: OrderedDict = OrderedDict()
+        self._namespaces_lock = threading.Lock()
+        self._flights: Dict[str, asyncio.Future] = {}
 
     @abstractmethod
     def get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
         pass
 
+    async def get_package_info_async(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        # Registries without a native async lookup block a worker thread rather than the event loop
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_package_info, component)
+
     @abstractmethod
     def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
         pass
 
+    def package_key(self, component: Component) -> str:
+        return component.name
+
+    def namespace(self, component: Component) -> str:
+        return self.package_key(component)
+
+    def prefetch(self, components: List[Component]) -> None:
+        pass
+
+    def _query_repositories(self, component: Component, query: Callable[[RepositoryConfig], Any]) -> Any:
+        namespace = self.namespace(component)
+        repositories, gated = self._candidate_repositories(namespace)
+        if gated:
+            query = self._circuit_checked(query)
+        hedge = min(self.health.hedge, len(repositories))
+        failed: List[str] = []
+        
+        result, repository = None, None
+        if hedge > 1:
+            result, repository = self._race(repositories[:hedge], query, failed)
+            repositories = repositories[hedge:]
+        
+        for candidate in repositories:
+            if result is not None:
+                break
+            result, repository = self._query_repository(candidate, query, failed), candidate
+        
+        return self._settle(component, namespace, result, repository, failed)
+
+    async def _aquery_repositories(self, component: Component,
+                                   query: Callable[[RepositoryConfig], Awaitable[Any]]) -> Any:
+        namespace = self.namespace(component)
+        repositories, gated = self._candidate_repositories(namespace)
+        if gated:
+            query = self._acircuit_checked(query)
+        hedge = min(self.health.hedge, len(repositories))
+        failed: List[str] = []
+        
+        result, repository = None, None
+        if hedge > 1:
+            result, repository = await self._arace(repositories[:hedge], query, failed)
+            repositories = repositories[hedge:]
+        
+        for candidate in repositories:
+            if result is not None:
+                break
+            result, repository = await self._aquery_repository(candidate, query, failed), candidate
+        
+        return self._settle(component, namespace, result, repository, failed)
+
+    def _candidate_repositories(self, namespace: str) -> Tuple[List[RepositoryConfig], bool]:
+        repositories = self.health.order(self.repositories, self._preferred_repository(namespace))
+        # Open circuits are skipped, unless every repository is behind one
+        return repositories, not all(self.health.blocked(repository.url) for repository in repositories)
+
+    def _settle(self, component: Component, namespace: str, result: Any,
+                repository: Optional[RepositoryConfig], failed: List[str]) -> Any:
+        if result is not None:
+            self._remember_repository(namespace, repository.name)
+        elif failed:
+            # A repository that did not answer may still have the package, so this is not a miss
+            raise RegistryUnavailable(f"{', '.join(failed)} failed to answer for {component.name}")
+        return result
+
+    def _preferred_repository(self, namespace: str) -> Optional[str]:
+        with self._namespaces_lock:
+            name = self._namespaces.get(namespace)
+            if name is not None:
+                self._namespaces.move_to_end(namespace)
+            return name
+
+    def _remember_repository(self, namespace: str, name: str) -> None:
+        with self._namespaces_lock:
+            self._namespaces[namespace] = name
+            self._namespaces.move_to_end(namespace)
+            while len(self._namespaces) > self.namespace_memo_size:
+                self._namespaces.popitem(last=False)
+
+    def _circuit_checked(self, query: Callable[[RepositoryConfig], Any]) -> Callable[[RepositoryConfig], Any]:
+        def checked(repository: RepositoryConfig) -> Any:
+            self._check_circuit(repository)
+            return query(repository)
+        return checked
+
+    def _acircuit_checked(self, query: Callable[[RepositoryConfig], Awaitable[Any]]) -> Callable[[RepositoryConfig], Awaitable[Any]]:
+        async def checked(repository: RepositoryConfig) -> Any:
+            self._check_circuit(repository)
+            return await query(repository)
+        return checked
+
+    def _check_circuit(self, repository: RepositoryConfig) -> None:
+        # Checked right before the request so only the repository actually asked claims a half-open trial
+        if not self.health.available(repository.url):
+            raise RegistryUnavailable(f"circuit open for {repository.url}")
+
+    def _query_repository(self, repository: RepositoryConfig, query: Callable[[RepositoryConfig], Any],
+                          failed: Optional[List[str]] = None) -> Any:
+        try:
+            return query(repository)
+        except Exception as e:
+            self.logger.debug(f"Error accessing {self.package_type} repository {repository.name}: {e}")
+            if failed is not None:
+                failed.append(repository.name)
+            return None
+
+    async def _aquery_repository(self, repository: RepositoryConfig,
+                                 query: Callable[[RepositoryConfig], Awaitable[Any]],
+                                 failed: Optional[List[str]] = None) -> Any:
+        try:
+            return await query(repository)
+        except Exception as e:
+            self.logger.debug(f"Error accessing {self.package_type} repository {repository.name}: {e}")
+            if failed is not None:
+                failed.append(repository.name)
+            return None
+
+    def _race(self, repositories: List[RepositoryConfig], query: Callable[[RepositoryConfig], Any],
+              failed: Optional[List[str]] = None) -> Tuple[Any, Optional[RepositoryConfig]]:
+        pool = self._hedging_pool()
+        queue = list(repositories)
+        pending: Dict[Future, RepositoryConfig] = {}
+        
+        try:
+            while queue or pending:
+                if queue:
+                    repository = queue.pop(0)
+                    pending[pool.submit(self._query_repository, repository, query, failed)] = repository
+                
+                # Give the fastest repository a head start before hedging with the next one
+                timeout = self._hedge_delay(repository) if queue else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    answered = pending.pop(future)
+                    if future.result() is not None:
+                        return future.result(), answered
+        finally:
+            # Losers still waiting for a thread are dropped, so they do not hold up later hedges
+            for future in pending:
+                future.cancel()
+        
+        return None, None
+
+    async def _arace(self, repositories: List[RepositoryConfig], query: Callable[[RepositoryConfig], Awaitable[Any]],
+                     failed: Optional[List[str]] = None) -> Tuple[Any, Optional[RepositoryConfig]]:
+        queue = list(repositories)
+        pending: Dict[asyncio.Task, RepositoryConfig] = {}
+        
+        try:
+            while queue or pending:
+                if queue:
+                    repository = queue.pop(0)
+                    pending[asyncio.ensure_future(self._aquery_repository(repository, query, failed))] = repository
+                
+                timeout = self._hedge_delay(repository) if queue else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    answered = pending.pop(task)
+                    if task.result() is not None:
+                        return task.result(), answered
+        finally:
+            # Requests of the losers are abandoned mid-flight instead of occupying the connection pool
+            for task in pending:
+                task.cancel()
+        
+        return None, None
+
+    def _hedge_delay(self, repository: RepositoryConfig) -> float:
+        if self.health.hedge_delay is not None:
+            return self.health.hedge_delay
+        latency = self.health.latency(repository.url)
+        return max(0.05, 2 * latency) if latency is not None else 1.0
+
+    @classmethod
+    def configure_hedging(cls, workers: int, hedge: int) -> None:
+        # Every worker may race 'hedge' repositories at once; only pools created afterwards pick this up
+        with PackageRegistry._hedge_pool_lock:
+            PackageRegistry.hedge_pool_size = max(1, int(workers)) * max(1, int(hedge))
+
+    @classmethod
+    def _hedging_pool(cls) -> ThreadPoolExecutor:
+        with PackageRegistry._hedge_pool_lock:
+            if PackageRegistry._hedge_pool is None:
+                PackageRegistry._hedge_pool = ThreadPoolExecutor(max_workers=PackageRegistry.hedge_pool_size,
+                                                                 thread_name_prefix='registry-hedge')
+            return PackageRegistry._hedge_pool
+
+    def _repository_auth(self, repository: RepositoryConfig) -> Optional[Tuple[str, str]]:
+        if repository.auth and 'username' in repository.auth and 'password' in repository.auth:
+            return repository.auth['username'], repository.auth['password']
+        return None
+
+    def _cache_key(self, repository: RepositoryConfig, key: str) -> str:
+        return f"{repository.name}|{repository.url}|{key}"
+
+    def _fetch_cached(self, repository: RepositoryConfig, key: str, fetch: Callable[[], Any]) -> Any:
+        cache_key = self._cache_key(repository, key)
+        
+        with self.metrics.scope(self.package_type, repository.name):
+            value = self._cached_value(cache_key)
+            self.metrics.record_cache(value is not _MISSING)
+            if value is _MISSING:
+                started = time.perf_counter()
+                value = fetch()
+                self.metrics.record_fetch(time.perf_counter() - started)
+                self._store_value(cache_key, value)
+        return value
+
+    async def _afetch_cached(self, repository: RepositoryConfig, key: str,
+                             fetch: Callable[[], Awaitable[Any]]) -> Any:
+        cache_key = self._cache_key(repository, key)
+        
+        with self.metrics.scope(self.package_type, repository.name):
+            value = self._cached_value(cache_key)
+            self.metrics.record_cache(value is not _MISSING)
+            if value is _MISSING:
+                value = await self._ashared_fetch(cache_key, fetch)
+        return value
+
+    async def _ashared_fetch(self, cache_key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        # Lookups awaiting the same document share one request, the flights all live on the one event loop
+        flight = self._flights.get(cache_key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._afetch_and_store(cache_key, fetch))
+            self._flights[cache_key] = flight
+            flight.add_done_callback(lambda _: self._flights.pop(cache_key, None))
+        # A cancelled hedge must not cancel the request the other lookups are waiting for
+        return await asyncio.shield(flight)
+
+    async def _afetch_and_store(self, cache_key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        value = await fetch()
+        self.metrics.record_fetch(time.perf_counter() - started)
+        self._store_value(cache_key, value)
+        return value
+
+    def _fetch_conditional(self, repository: RepositoryConfig, key: str, url: str,
+                           parse: Callable[[Any], Any], headers: Optional[Dict[str, str]] = None,
+                           auth: Optional[tuple] = None) -> Any:
+        cache_key = self._cache_key(repository, key)
+        
+        with self.metrics.scope(self.package_type, repository.name):
+            entry = self._cached_value(cache_key)
+            self.metrics.record_cache(entry is not _MISSING)
+            if entry is _MISSING:
+                started = time.perf_counter()
+                stale = self.cache.get_stale(self.package_type, cache_key)
+                entry = self._revalidate(url, parse, headers, auth, stale)
+                self.metrics.record_fetch(time.perf_counter() - started)
+                self._store_value(cache_key, entry)
+        
+        return entry['value'] if entry else None
+
+    async def _afetch_conditional(self, repository: RepositoryConfig, key: str, url: str,
+                                  parse: Callable[[Any], Any], headers: Optional[Dict[str, str]] = None,
+                                  auth: Optional[tuple] = None) -> Any:
+        cache_key = self._cache_key(repository, key)
+        
+        async def revalidate():
+            stale = self.cache.get_stale(self.package_type, cache_key)
+            response = await self.http_client.aget(url, headers=self._conditional_headers(headers, stale), auth=auth)
+            return self._revalidated(response, url, parse, stale)
+        
+        with self.metrics.scope(self.package_type, repository.name):
+            entry = self._cached_value(cache_key)
+            self.metrics.record_cache(entry is not _MISSING)
+            if entry is _MISSING:
+                entry = await self._ashared_fetch(cache_key, revalidate)
+        
+        return entry['value'] if entry else None
+
+    def _revalidate(self, url: str, parse: Callable[[Any], Any], headers: Optional[Dict[str, str]],
+                    auth: Optional[tuple], stale: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        response = self.http_client.get(url, headers=self._conditional_headers(headers, stale), auth=auth)
+        return self._revalidated(response, url, parse, stale)
+
+    def _conditional_headers(self, headers: Optional[Dict[str, str]],
+                             stale: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        request_headers = dict(headers or {})
+        if stale:
+            if stale.get('etag'):
+                request_headers['If-None-Match'] = stale['etag']
+            if stale.get('last_modified'):
+                request_headers['If-Modified-Since'] = stale['last_modified']
+        return request_headers
+
+    def _revalidated(self, response, url: str, parse: Callable[[Any], Any],
+                     stale: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if response.status_code == 304 and stale:
+            self.logger.debug(f"Not modified: {url}")
+            return stale
+        
+        if response.status_code != 200:
+            self.logger.debug(f"Request to {url} failed - HTTP {response.status_code}")
+            return self._not_found(response, url)
+        
+        value = parse(response)
+        if value is None:
+            return None
+        
+        return {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'value': value
+        }
+
+    def _not_found(self, response, url: str) -> None:
+        # Only a definitive miss may be cached, throttled or failing requests are retried on the next lookup
+        if response.status_code in NOT_FOUND_STATUS_CODES:
+            return None
+        raise RegistryUnavailable(f"HTTP {response.status_code} from {url}")
+
+    def _cached_value(self, cache_key: str) -> Any:
+        value = self._memo_get(cache_key)
+        if value is not _MISSING:
+            return value
+        
+        value = self.cache.get(self.package_type, cache_key)
+        if value is None:
+            return _MISSING
+        
+        self._memo_set(cache_key, value)
+        return value
+
+    def _store_value(self, cache_key: str, value: Any) -> None:
+        self.cache.set(self.package_type, cache_key, value)
+        self._memo_set(cache_key, value)
+
+    def _memo_get(self, key: str) -> Any:
+        with self._documents_lock:
+            value = self._documents.get(key, _MISSING)
+            if value is not _MISSING:
+                self._documents.move_to_end(key)
+            return value
+
+    def _memo_set(self, key: str, value: Any) -> None:
+        with self._documents_lock:
+            self._documents[key] = value
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.memo_size:
+                self._documents.popitem(last=False)
+
+    def _get_package_data(self, component: Component, repository: RepositoryConfig) -> Any:
+        return self._fetch_cached(
+            repository, self.package_key(component),
+            lambda: self._fetch_package_data(component, repository)
+        )
+
+    async def _aget_package_data(self, component: Component, repository: RepositoryConfig) -> Any:
+        return await self._afetch_cached(
+            repository, self.package_key(component),
+            lambda: self._afetch_package_data(component, repository)
+        )
+
+    async def _afetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
+        return await asyncio.get_running_loop().run_in_executor(None, self._fetch_package_data, component, repository)
+
     def _normalize_version(self, version: str) -> str:
         if version.lower().startswith('v'):
             version = version[1:]
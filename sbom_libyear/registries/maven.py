@@ -1,25 +1,46 @@
 import xml.etree.ElementTree as ET
-from datetime import datetime
-from typing import Optional, Tuple
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from ..models import Component, RepositoryConfig
-from .base import PackageRegistry
+from ..models import Component, MavenMetadata, RepositoryConfig
+from .base import PackageRegistry, RegistryUnavailable
 
 
 class MavenRegistry(PackageRegistry):
+    package_type = 'maven'
+    search_batch_size = 20
+    search_max_clauses = 60
+    search_page_size = 200
+
+    def __init__(self, repositories: List[RepositoryConfig]):
+        super().__init__(repositories)
+        self._search_index: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
     def get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
         group_id, artifact_id = self._extract_maven_coordinates(component)
         
         self.logger.debug(f"Maven lookup: {group_id}:{artifact_id}")
         
-        for repo in self.repositories:
-            try:
-                result = self._fetch_from_repository(group_id, artifact_id, component.version, repo)
-                if result[0] is not None or result[1] is not None or result[2] is not None:
-                    return result
-            except Exception as e:
-                self.logger.debug(f"Error accessing Maven repository {repo.name}: {e}")
-                continue
+        result = self._query_repositories(component, lambda repo: self._repository_package_info(
+            group_id, artifact_id, component.version, repo
+        ))
+        if result is not None:
+            return result
+        
+        self.logger.warning(f"Maven artifact '{group_id}:{artifact_id}' not found in any configured repository")
+        return None, None, None
+
+    async def get_package_info_async(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        group_id, artifact_id = self._extract_maven_coordinates(component)
+        
+        self.logger.debug(f"Maven lookup: {group_id}:{artifact_id}")
+        
+        result = await self._aquery_repositories(component, lambda repo: self._arepository_package_info(
+            group_id, artifact_id, component.version, repo
+        ))
+        if result is not None:
+            return result
         
         self.logger.warning(f"Maven artifact '{group_id}:{artifact_id}' not found in any configured repository")
         return None, None, None
@@ -27,6 +48,203 @@ class MavenRegistry(PackageRegistry):
     def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
         pass
 
+    def package_key(self, component: Component) -> str:
+        group_id, artifact_id = self._extract_maven_coordinates(component)
+        return f"{group_id}:{artifact_id}"
+
+    def namespace(self, component: Component) -> str:
+        return self._extract_maven_coordinates(component)[0]
+
+    def _repository_package_info(self, group_id: str, artifact_id: str, version: str, repo: RepositoryConfig):
+        result = self._fetch_from_repository(group_id, artifact_id, version, repo)
+        return result if any(value is not None for value in result) else None
+
+    async def _arepository_package_info(self, group_id: str, artifact_id: str, version: str, repo: RepositoryConfig):
+        result = await self._afetch_from_repository(group_id, artifact_id, version, repo)
+        return result if any(value is not None for value in result) else None
+
+    def prefetch(self, components: List[Component]) -> None:
+        wanted: Dict[Tuple[str, str], Set[str]] = {}
+        for component in components:
+            group_id, artifact_id = self._extract_maven_coordinates(component)
+            if group_id != 'unknown':
+                wanted.setdefault((group_id, artifact_id), set()).add(component.version)
+        
+        for repo in self.repositories:
+            if not repo.search_url or not self.health.available(repo.search_url):
+                continue
+            
+            auth = self._repository_auth(repo)
+            pending = []
+            for (group_id, artifact_id), versions in wanted.items():
+                entry = self._indexed_entry(repo, group_id, artifact_id)
+                if entry is None or not versions.issubset(entry['queried']):
+                    if entry is not None:
+                        versions |= entry['queried']
+                    pending.append((group_id, artifact_id))
+            
+            if not pending:
+                continue
+            
+            self.logger.debug(f"Bulk searching {len(pending)} Maven artifacts in {repo.name}")
+            
+            for start in range(0, len(pending), self.search_batch_size):
+                batch = pending[start:start + self.search_batch_size]
+                try:
+                    self._bulk_search(repo, auth, batch, wanted)
+                except Exception as e:
+                    self.logger.debug(f"Bulk search failed in Maven repository {repo.name}: {e}")
+
+    def _bulk_search(self, repo: RepositoryConfig, auth: Optional[Tuple[str, str]],
+                     batch: List[Tuple[str, str]], wanted: Dict[Tuple[str, str], Set[str]]) -> None:
+        query = ' OR '.join(f'(g:"{group_id}" AND a:"{artifact_id}")' for group_id, artifact_id in batch)
+        latest_versions = {
+            (doc.get('g'), doc.get('a')): doc.get('latestVersion', '')
+            for doc in self._paged_search(repo, auth, {'q': query})
+        }
+        
+        gav_clauses = []
+        for group_id, artifact_id in batch:
+            latest_version = latest_versions.get((group_id, artifact_id))
+            if latest_version is None:
+                continue
+            for version in sorted(wanted[(group_id, artifact_id)] | {latest_version}):
+                if version:
+                    gav_clauses.append(f'(g:"{group_id}" AND a:"{artifact_id}" AND v:"{version}")')
+        
+        timestamps: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for start in range(0, len(gav_clauses), self.search_max_clauses):
+            params = {'q': ' OR '.join(gav_clauses[start:start + self.search_max_clauses]), 'core': 'gav'}
+            for doc in self._paged_search(repo, auth, params):
+                timestamps.setdefault((doc.get('g'), doc.get('a')), {})[doc.get('v', '')] = doc.get('timestamp', 0)
+        
+        for group_id, artifact_id in batch:
+            latest_version = latest_versions.get((group_id, artifact_id))
+            entry = {
+                'found': latest_version is not None,
+                'latest': latest_version or '',
+                'timestamps': timestamps.get((group_id, artifact_id), {}),
+                'queried': sorted(wanted[(group_id, artifact_id)])
+            }
+            self._store_indexed_entry(repo, group_id, artifact_id, entry)
+
+    def _paged_search(self, repo: RepositoryConfig, auth: Optional[Tuple[str, str]],
+                      params: Dict[str, Any]) -> List[dict]:
+        docs: List[dict] = []
+        start = 0
+        while True:
+            page_params = dict(params, rows=self.search_page_size, start=start, wt='json')
+            with self.metrics.scope(self.package_type, repo.name):
+                response = self.http_client.get(repo.search_url, params=page_params, auth=auth)
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+            
+            result = response.json().get('response', {})
+            page = result.get('docs', [])
+            docs.extend(page)
+            start += len(page)
+            if not page or start >= result.get('numFound', 0):
+                return docs
+
+    def _indexed_entry(self, repo: RepositoryConfig, group_id: str, artifact_id: str) -> Optional[Dict[str, Any]]:
+        index_key = (repo.name, group_id, artifact_id)
+        entry = self._search_index.get(index_key)
+        if entry is None:
+            entry = self.cache.get(self.package_type, self._cache_key(repo, f"search-index:{group_id}:{artifact_id}"))
+            if entry is not None:
+                entry['queried'] = set(entry['queried'])
+                self._search_index[index_key] = entry
+        return entry
+
+    def _store_indexed_entry(self, repo: RepositoryConfig, group_id: str, artifact_id: str,
+                             entry: Dict[str, Any]) -> None:
+        self.cache.set(self.package_type, self._cache_key(repo, f"search-index:{group_id}:{artifact_id}"), entry)
+        entry['queried'] = set(entry['queried'])
+        self._search_index[(repo.name, group_id, artifact_id)] = entry
+
+    def _search(self, repo: RepositoryConfig, key: str, params: Dict[str, Any],
+                auth: Optional[Tuple[str, str]]) -> Optional[dict]:
+        def fetch():
+            return self._search_result(repo, self.http_client.get(repo.search_url, params=params, auth=auth))
+        
+        return self._fetch_cached(repo, key, fetch)
+
+    async def _asearch(self, repo: RepositoryConfig, key: str, params: Dict[str, Any],
+                       auth: Optional[Tuple[str, str]]) -> Optional[dict]:
+        async def fetch():
+            return self._search_result(repo, await self.http_client.aget(repo.search_url, params=params, auth=auth))
+        
+        return await self._afetch_cached(repo, key, fetch)
+
+    def _search_result(self, repo: RepositoryConfig, response) -> Optional[dict]:
+        if response.status_code != 200:
+            return self._not_found(response, repo.search_url)
+        return response.json()
+
+    def _get_metadata(self, repo: RepositoryConfig, group_id: str, artifact_id: str,
+                      auth: Optional[Tuple[str, str]], version: Optional[str] = None) -> Optional[MavenMetadata]:
+        url = self._metadata_url(repo, group_id, artifact_id, version)
+        
+        def fetch():
+            return self._metadata_document(url, self.http_client.get(url, auth=auth))
+        
+        data = self._fetch_cached(repo, f"metadata:{group_id}:{artifact_id}:{version or ''}", fetch)
+        if data is None:
+            return None
+        return MavenMetadata(**data)
+
+    async def _aget_metadata(self, repo: RepositoryConfig, group_id: str, artifact_id: str,
+                             auth: Optional[Tuple[str, str]], version: Optional[str] = None) -> Optional[MavenMetadata]:
+        url = self._metadata_url(repo, group_id, artifact_id, version)
+        
+        async def fetch():
+            return self._metadata_document(url, await self.http_client.aget(url, auth=auth))
+        
+        data = await self._afetch_cached(repo, f"metadata:{group_id}:{artifact_id}:{version or ''}", fetch)
+        if data is None:
+            return None
+        return MavenMetadata(**data)
+
+    def _metadata_url(self, repo: RepositoryConfig, group_id: str, artifact_id: str,
+                      version: Optional[str] = None) -> str:
+        group_path = group_id.replace('.', '/')
+        if version:
+            return f"{repo.url}/{group_path}/{artifact_id}/{version}/maven-metadata.xml"
+        return f"{repo.url}/{group_path}/{artifact_id}/maven-metadata.xml"
+
+    def _metadata_document(self, url: str, response) -> Optional[Dict[str, Any]]:
+        if response.status_code != 200:
+            return self._not_found(response, url)
+        try:
+            return asdict(self._parse_metadata(response.content))
+        except ET.ParseError as e:
+            self.logger.debug(f"Invalid maven-metadata.xml at {url}: {e}")
+            return None
+
+    def _parse_metadata(self, content: bytes) -> MavenMetadata:
+        root = ET.fromstring(content)
+        
+        def text_of(path: str) -> Optional[str]:
+            element = root.find(path)
+            return element.text if element is not None and element.text else None
+        
+        return MavenMetadata(
+            release=text_of('.//release'),
+            latest=text_of('.//latest'),
+            versions=[v.text for v in root.findall('.//version') if v.text],
+            last_updated=text_of('.//lastUpdated'),
+            timestamp=text_of('.//timestamp')
+        )
+
+    def _parse_metadata_timestamp(self, value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            # maven-metadata.xml timestamps are UTC
+            return datetime.strptime(value.replace('.', '')[:14], '%Y%m%d%H%M%S').replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
     def _extract_maven_coordinates(self, component: Component) -> Tuple[str, str]:
         if component.group_id and component.artifact_id:
             return component.group_id, component.artifact_id
@@ -57,14 +275,16 @@ class MavenRegistry(PackageRegistry):
 
     def _fetch_from_repository(self, group_id: str, artifact_id: str, current_version: str,
                                repo: RepositoryConfig) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
-        auth = None
-        if repo.auth and 'username' in repo.auth and 'password' in repo.auth:
-            auth = (repo.auth['username'], repo.auth['password'])
+        auth = self._repository_auth(repo)
         
         if repo.search_url:
-            result = self._search_maven_central(group_id, artifact_id, current_version, repo, auth)
-            if result[0] is not None or result[1] is not None or result[2] is not None:
-                return result
+            try:
+                result = self._search_maven_central(group_id, artifact_id, current_version, repo, auth)
+            except RegistryUnavailable as e:
+                self.logger.debug(f"Maven search of {repo.name} unavailable, falling back to metadata: {e}")
+            else:
+                if result[0] is not None or result[1] is not None or result[2] is not None:
+                    return result
         
         result = self._get_maven_metadata_dates(group_id, artifact_id, current_version, repo, auth)
         if result[0] is not None or result[1] is not None:
@@ -73,42 +293,130 @@ class MavenRegistry(PackageRegistry):
         
         return None, None, None
 
+    async def _afetch_from_repository(self, group_id: str, artifact_id: str, current_version: str,
+                                      repo: RepositoryConfig) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        auth = self._repository_auth(repo)
+        
+        if repo.search_url:
+            try:
+                result = await self._asearch_maven_central(group_id, artifact_id, current_version, repo, auth)
+            except RegistryUnavailable as e:
+                self.logger.debug(f"Maven search of {repo.name} unavailable, falling back to metadata: {e}")
+            else:
+                if result[0] is not None or result[1] is not None or result[2] is not None:
+                    return result
+        
+        result = await self._aget_maven_metadata_dates(group_id, artifact_id, current_version, repo, auth)
+        if result[0] is not None or result[1] is not None:
+            latest_version = await self._aget_latest_version_from_metadata(group_id, artifact_id, repo, auth)
+            return result[0], result[1], latest_version or 'unknown'
+        
+        return None, None, None
+
     def _search_maven_central(self, group_id: str, artifact_id: str, current_version: str,
                               repo: RepositoryConfig, auth: Optional[Tuple[str, str]]) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
-        params = {
-            'q': f'g:"{group_id}" AND a:"{artifact_id}"',
-            'rows': 1,
-            'wt': 'json'
-        }
+        entry = self._indexed_entry(repo, group_id, artifact_id)
+        if entry is not None and current_version in entry['queried']:
+            if not entry['found']:
+                return None, None, None
+            latest_version = entry['latest']
+            version_records = self._indexed_records(entry)
+        else:
+            search_data = self._search(repo, f"search:{group_id}:{artifact_id}",
+                                       self._artifact_search_params(group_id, artifact_id), auth)
+            latest_version = self._searched_latest_version(search_data)
+            if latest_version is None:
+                return None, None, None
+            
+            versions_data = self._search(repo, f"search-gav:{group_id}:{artifact_id}",
+                                         self._version_search_params(group_id, artifact_id), auth)
+            if versions_data is None:
+                return None, None, latest_version
+            
+            version_records = versions_data.get('response', {}).get('docs', [])
         
-        response = self.http_client.get(repo.search_url, params=params, auth=auth)
+        current_date, latest_date = self._record_dates(version_records, current_version, latest_version)
         
-        if response.status_code != 200:
-            return None, None, None
+        if not current_date or not latest_date:
+            try:
+                fallback_result = self._get_maven_metadata_dates(
+                    group_id, artifact_id, current_version, repo, auth, latest_version
+                )
+            except Exception as e:
+                self.logger.debug(f"Metadata fallback for {group_id}:{artifact_id} in {repo.name} failed: {e}")
+                fallback_result = None, None
+            current_date = current_date or fallback_result[0]
+            latest_date = latest_date or fallback_result[1]
         
-        search_data = response.json()
-        artifacts = search_data.get('response', {}).get('docs', [])
+        return current_date, latest_date, latest_version
+
+    async def _asearch_maven_central(self, group_id: str, artifact_id: str, current_version: str,
+                                     repo: RepositoryConfig, auth: Optional[Tuple[str, str]]) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        entry = self._indexed_entry(repo, group_id, artifact_id)
+        if entry is not None and current_version in entry['queried']:
+            if not entry['found']:
+                return None, None, None
+            latest_version = entry['latest']
+            version_records = self._indexed_records(entry)
+        else:
+            search_data = await self._asearch(repo, f"search:{group_id}:{artifact_id}",
+                                              self._artifact_search_params(group_id, artifact_id), auth)
+            latest_version = self._searched_latest_version(search_data)
+            if latest_version is None:
+                return None, None, None
+            
+            versions_data = await self._asearch(repo, f"search-gav:{group_id}:{artifact_id}",
+                                                self._version_search_params(group_id, artifact_id), auth)
+            if versions_data is None:
+                return None, None, latest_version
+            
+            version_records = versions_data.get('response', {}).get('docs', [])
         
-        if not artifacts:
-            return None, None, None
+        current_date, latest_date = self._record_dates(version_records, current_version, latest_version)
         
-        artifact = artifacts[0]
-        latest_version = artifact.get('latestVersion', '')
+        if not current_date or not latest_date:
+            try:
+                fallback_result = await self._aget_maven_metadata_dates(
+                    group_id, artifact_id, current_version, repo, auth, latest_version
+                )
+            except Exception as e:
+                self.logger.debug(f"Metadata fallback for {group_id}:{artifact_id} in {repo.name} failed: {e}")
+                fallback_result = None, None
+            current_date = current_date or fallback_result[0]
+            latest_date = latest_date or fallback_result[1]
         
-        params = {
+        return current_date, latest_date, latest_version
+
+    def _indexed_records(self, entry: Dict[str, Any]) -> List[dict]:
+        return [{'v': v, 'timestamp': ts} for v, ts in entry['timestamps'].items()]
+
+    def _artifact_search_params(self, group_id: str, artifact_id: str) -> Dict[str, Any]:
+        return {
+            'q': f'g:"{group_id}" AND a:"{artifact_id}"',
+            'rows': 1,
+            'wt': 'json'
+        }
+
+    def _version_search_params(self, group_id: str, artifact_id: str) -> Dict[str, Any]:
+        return {
             'q': f'g:"{group_id}" AND a:"{artifact_id}"',
             'rows': 50,
             'wt': 'json',
             'core': 'gav'
         }
+
+    def _searched_latest_version(self, search_data: Optional[dict]) -> Optional[str]:
+        if search_data is None:
+            return None
         
-        versions_response = self.http_client.get(repo.search_url, params=params, auth=auth)
-        if versions_response.status_code != 200:
-            return None, None, latest_version
-        
-        versions_data = versions_response.json()
-        version_records = versions_data.get('response', {}).get('docs', [])
+        artifacts = search_data.get('response', {}).get('docs', [])
+        if not artifacts:
+            return None
         
+        return artifacts[0].get('latestVersion', '')
+
+    def _record_dates(self, version_records: List[dict], current_version: str,
+                      latest_version: str) -> Tuple[Optional[datetime], Optional[datetime]]:
         current_date = None
         latest_date = None
         
@@ -117,7 +425,7 @@ class MavenRegistry(PackageRegistry):
             timestamp = record.get('timestamp', 0)
             
             if timestamp > 0:
-                date = datetime.fromtimestamp(timestamp / 1000)
+                date = datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
                 
                 if version == current_version:
                     current_date = date
@@ -125,92 +433,73 @@ class MavenRegistry(PackageRegistry):
                 if version == latest_version:
                     latest_date = date
         
-        if not current_date or not latest_date:
-            fallback_result = self._get_maven_metadata_dates(
-                group_id, artifact_id, current_version, repo, auth, latest_version
-            )
-            if not current_date:
-                current_date = fallback_result[0]
-            if not latest_date:
-                latest_date = fallback_result[1]
-        
-        return current_date, latest_date, latest_version
+        return current_date, latest_date
 
     def _get_maven_metadata_dates(self, group_id: str, artifact_id: str,
                                   current_version: str, repo: RepositoryConfig,
                                   auth: Optional[Tuple[str, str]],
                                   latest_version: Optional[str] = None) -> Tuple[Optional[datetime], Optional[datetime]]:
-        group_path = group_id.replace('.', '/')
+        current_date = None
+        latest_date = None
+        
+        current_metadata = self._get_metadata(repo, group_id, artifact_id, auth, current_version)
+        if current_metadata:
+            current_date = self._parse_metadata_timestamp(current_metadata.timestamp)
+        
+        if latest_version:
+            latest_metadata = self._get_metadata(repo, group_id, artifact_id, auth, latest_version)
+            if latest_metadata:
+                latest_date = self._parse_metadata_timestamp(latest_metadata.timestamp)
         
+        if not latest_date:
+            metadata = self._get_metadata(repo, group_id, artifact_id, auth)
+            if metadata:
+                latest_date = self._parse_metadata_timestamp(metadata.last_updated)
+        
+        return current_date, latest_date
+
+    async def _aget_maven_metadata_dates(self, group_id: str, artifact_id: str,
+                                         current_version: str, repo: RepositoryConfig,
+                                         auth: Optional[Tuple[str, str]],
+                                         latest_version: Optional[str] = None) -> Tuple[Optional[datetime], Optional[datetime]]:
         current_date = None
         latest_date = None
         
-        current_version_url = f"{repo.url}/{group_path}/{artifact_id}/{current_version}/maven-metadata.xml"
-        try:
-            response = self.http_client.get(current_version_url, auth=auth)
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                timestamp = root.find('.//timestamp')
-                if timestamp is not None and timestamp.text:
-                    timestamp_str = timestamp.text.replace('.', '')
-                    current_date = datetime.strptime(timestamp_str[:14], '%Y%m%d%H%M%S')
-        except Exception:
-            pass
+        current_metadata = await self._aget_metadata(repo, group_id, artifact_id, auth, current_version)
+        if current_metadata:
+            current_date = self._parse_metadata_timestamp(current_metadata.timestamp)
         
         if latest_version:
-            latest_version_url = f"{repo.url}/{group_path}/{artifact_id}/{latest_version}/maven-metadata.xml"
-            try:
-                response = self.http_client.get(latest_version_url, auth=auth)
-                if response.status_code == 200:
-                    root = ET.fromstring(response.content)
-                    timestamp = root.find('.//timestamp')
-                    if timestamp is not None and timestamp.text:
-                        timestamp_str = timestamp.text.replace('.', '')
-                        latest_date = datetime.strptime(timestamp_str[:14], '%Y%m%d%H%M%S')
-            except Exception:
-                pass
+            latest_metadata = await self._aget_metadata(repo, group_id, artifact_id, auth, latest_version)
+            if latest_metadata:
+                latest_date = self._parse_metadata_timestamp(latest_metadata.timestamp)
         
         if not latest_date:
-            metadata_url = f"{repo.url}/{group_path}/{artifact_id}/maven-metadata.xml"
-            try:
-                response = self.http_client.get(metadata_url, auth=auth)
-                if response.status_code == 200:
-                    root = ET.fromstring(response.content)
-                    
-                    if not latest_date:
-                        last_updated = root.find('.//lastUpdated')
-                        if last_updated is not None and last_updated.text:
-                            timestamp_str = last_updated.text[:14]
-                            latest_date = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
-            except Exception:
-                pass
+            metadata = await self._aget_metadata(repo, group_id, artifact_id, auth)
+            if metadata:
+                latest_date = self._parse_metadata_timestamp(metadata.last_updated)
         
         return current_date, latest_date
 
     def _get_latest_version_from_metadata(self, group_id: str, artifact_id: str,
                                           repo: RepositoryConfig, auth: Optional[Tuple[str, str]]) -> Optional[str]:
-        group_path = group_id.replace('.', '/')
-        metadata_url = f"{repo.url}/{group_path}/{artifact_id}/maven-metadata.xml"
+        return self._metadata_latest_version(self._get_metadata(repo, group_id, artifact_id, auth))
+
+    async def _aget_latest_version_from_metadata(self, group_id: str, artifact_id: str,
+                                                 repo: RepositoryConfig, auth: Optional[Tuple[str, str]]) -> Optional[str]:
+        return self._metadata_latest_version(await self._aget_metadata(repo, group_id, artifact_id, auth))
+
+    def _metadata_latest_version(self, metadata: Optional[MavenMetadata]) -> Optional[str]:
+        if metadata is None:
+            return None
         
-        try:
-            response = self.http_client.get(metadata_url, auth=auth)
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                
-                release = root.find('.//release')
-                if release is not None and release.text:
-                    return release.text
-                
-                latest = root.find('.//latest')
-                if latest is not None and latest.text:
-                    return latest.text
-                
-                versions = root.findall('.//version')
-                if versions:
-                    version_list = [v.text for v in versions if v.text]
-                    if version_list:
-                        return version_list[-1]
-        except Exception:
-            pass
-        
-        return None
\ No newline at end of file
+        if metadata.release:
+            return metadata.release
+        
+        if metadata.latest:
+            return metadata.latest
+        
+        if metadata.versions:
+            return metadata.versions[-1]
+        
+        return None
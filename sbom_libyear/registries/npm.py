@@ -1,43 +1,108 @@
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..models import Component, RepositoryConfig
 from .base import PackageRegistry
 
+ABBREVIATED_ACCEPT = 'application/vnd.npm.install-v1+json; q=1.0, application/json; q=0.8, */*'
+
 
 class NpmRegistry(PackageRegistry):
+    package_type = 'npm'
+
+    def __init__(self, repositories: List[RepositoryConfig]):
+        super().__init__(repositories)
+        self._abbreviated_time: Dict[str, bool] = {}
+
     def get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
-        for repo in self.repositories:
-            try:
-                package_data = self._fetch_package_data(component, repo)
-                if package_data:
-                    return self._extract_version_info(package_data, component.version)
-            except Exception as e:
-                self.logger.debug(f"Error accessing NPM registry {repo.name}: {e}")
-                continue
+        result = self._query_repositories(component, lambda repo: self._repository_package_info(component, repo))
+        if result is not None:
+            return result
         
         self.logger.warning(f"NPM package '{component.name}' not found in any configured registry")
         return None, None, None
 
+    async def get_package_info_async(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        result = await self._aquery_repositories(component, lambda repo: self._arepository_package_info(component, repo))
+        if result is not None:
+            return result
+        
+        self.logger.warning(f"NPM package '{component.name}' not found in any configured registry")
+        return None, None, None
+
+    def namespace(self, component: Component) -> str:
+        # Scoped packages are usually all published to the same (private) registry
+        return component.name.split('/', 1)[0] if component.name.startswith('@') else component.name
+
+    def _repository_package_info(self, component: Component, repo: RepositoryConfig):
+        package_data = self._fetch_package_data(component, repo)
+        return self._extract_version_info(package_data, component.version) if package_data else None
+
+    async def _arepository_package_info(self, component: Component, repo: RepositoryConfig):
+        package_data = await self._afetch_package_data(component, repo)
+        return self._extract_version_info(package_data, component.version) if package_data else None
+
     def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
         url = f"{repository.url}/{component.name}"
+        auth_headers, auth = self._request_auth(repository)
+        
+        if self._abbreviated_has_time(repository):
+            package_data = self._fetch_conditional(
+                repository, f"abbreviated:{component.name}", url, self._condense_packument,
+                headers=dict(auth_headers, Accept=ABBREVIATED_ACCEPT), auth=auth
+            )
+            if self._complete(repository, package_data):
+                return package_data
         
-        auth_headers = {}
-        auth = None
+        return self._fetch_conditional(
+            repository, f"full:{component.name}", url, self._condense_packument,
+            headers=dict(auth_headers, Accept='application/json'), auth=auth
+        )
+
+    async def _afetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
+        url = f"{repository.url}/{component.name}"
+        auth_headers, auth = self._request_auth(repository)
         
-        if repository.auth:
-            if 'token' in repository.auth:
-                auth_headers['Authorization'] = f"Bearer {repository.auth['token']}"
-            elif 'username' in repository.auth and 'password' in repository.auth:
-                auth = (repository.auth['username'], repository.auth['password'])
+        if self._abbreviated_has_time(repository):
+            package_data = await self._afetch_conditional(
+                repository, f"abbreviated:{component.name}", url, self._condense_packument,
+                headers=dict(auth_headers, Accept=ABBREVIATED_ACCEPT), auth=auth
+            )
+            if self._complete(repository, package_data):
+                return package_data
         
-        response = self.http_client.get(url, headers=auth_headers, auth=auth)
+        return await self._afetch_conditional(
+            repository, f"full:{component.name}", url, self._condense_packument,
+            headers=dict(auth_headers, Accept='application/json'), auth=auth
+        )
+
+    def _request_auth(self, repository: RepositoryConfig) -> Tuple[Dict[str, str], Optional[Tuple[str, str]]]:
+        if repository.auth and 'token' in repository.auth:
+            return {'Authorization': f"Bearer {repository.auth['token']}"}, None
+        return {}, self._repository_auth(repository)
+
+    def _complete(self, repository: RepositoryConfig, package_data: Optional[dict]) -> bool:
+        if package_data is None or 'time' in package_data:
+            return True
         
-        if response.status_code == 200:
-            return response.json()
+        self.logger.debug(f"NPM registry {repository.name} omits publish times from abbreviated metadata")
+        self._abbreviated_time[repository.name] = False
+        self.cache.set(self.package_type, self._cache_key(repository, 'abbreviated-time'), False)
+        return False
+
+    def _abbreviated_has_time(self, repository: RepositoryConfig) -> bool:
+        if repository.name not in self._abbreviated_time:
+            cached = self.cache.get(self.package_type, self._cache_key(repository, 'abbreviated-time'))
+            self._abbreviated_time[repository.name] = cached is not False
+        return self._abbreviated_time[repository.name]
+
+    def _condense_packument(self, response) -> dict:
+        packument = response.json()
         
-        self.logger.debug(f"NPM registry {repository.name} lookup failed for '{component.name}' - HTTP {response.status_code}")
-        return None
+        condensed = {'dist-tags': packument.get('dist-tags', {})}
+        if 'time' in packument:
+            condensed['time'] = packument['time']
+        return condensed
 
     def _extract_version_info(self, package_data: dict, current_version: str) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
         time_data = package_data.get('time', {})
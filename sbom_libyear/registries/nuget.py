@@ -1,38 +1,88 @@
+import asyncio
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import Component, RepositoryConfig
-from .base import PackageRegistry
+from .base import PackageRegistry, RegistryUnavailable
+
+REGISTRATION_RESOURCE_TYPES = (
+    'RegistrationsBaseUrl/3.6.0',
+    'RegistrationsBaseUrl/3.4.0',
+    'RegistrationsBaseUrl/3.0.0-rc',
+    'RegistrationsBaseUrl',
+)
+
+_FRACTION = re.compile(r'\.(\d+)')
 
 
 class NugetRegistry(PackageRegistry):
+    package_type = 'nuget'
+    page_batch_size = 4
+    page_pool_size = 16
+
+    _page_pool: Optional[ThreadPoolExecutor] = None
+    _page_pool_lock = threading.Lock()
+
     def get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
-        for repo in self.repositories:
-            try:
-                package_data = self._fetch_package_data(component, repo)
-                if package_data:
-                    return self._extract_version_info(package_data)
-            except Exception as e:
-                self.logger.debug(f"Error accessing NuGet registry {repo.name}: {e}")
-                continue
+        result = self._query_repositories(component, lambda repo: self._repository_package_info(component, repo))
+        if result is not None:
+            return result
         
         self.logger.warning(f"NuGet package '{component.name}' not found in any configured registry")
         return None, None, None
 
-    def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
-        url = f"{repository.url}/{component.name.lower()}/index.json"
+    async def get_package_info_async(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        result = await self._aquery_repositories(component, lambda repo: self._arepository_package_info(component, repo))
+        if result is not None:
+            return result
         
-        auth = None
-        if repository.auth and 'username' in repository.auth and 'password' in repository.auth:
-            auth = (repository.auth['username'], repository.auth['password'])
+        self.logger.warning(f"NuGet package '{component.name}' not found in any configured registry")
+        return None, None, None
+
+    def package_key(self, component: Component) -> str:
+        return component.name.lower()
+
+    def namespace(self, component: Component) -> str:
+        # Package ID prefixes like "Microsoft." are reserved by their owners
+        return component.name.lower().split('.', 1)[0]
+
+    def _repository_package_info(self, component: Component, repo: RepositoryConfig):
+        base_url = self._registration_base_url(repo)
+        if base_url:
+            registration = self._get_registration(component, repo, base_url)
+            return self._extract_registration_info(component, repo, registration) if registration else None
         
-        response = self.http_client.get(url, auth=auth)
+        package_data = self._get_package_data(component, repo)
+        return self._extract_version_info(package_data) if package_data else None
+
+    async def _arepository_package_info(self, component: Component, repo: RepositoryConfig):
+        base_url = await self._aregistration_base_url(repo)
+        if base_url:
+            registration = await self._aget_registration(component, repo, base_url)
+            return await self._aextract_registration_info(component, repo, registration) if registration else None
         
+        package_data = await self._aget_package_data(component, repo)
+        return self._extract_version_info(package_data) if package_data else None
+
+    def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
+        url = f"{repository.url}/{component.name.lower()}/index.json"
+        response = self.http_client.get(url, auth=self._repository_auth(repository))
+        return self._package_data(component, repository, url, response)
+
+    async def _afetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
+        url = f"{repository.url}/{component.name.lower()}/index.json"
+        response = await self.http_client.aget(url, auth=self._repository_auth(repository))
+        return self._package_data(component, repository, url, response)
+
+    def _package_data(self, component: Component, repository: RepositoryConfig, url: str, response) -> dict:
         if response.status_code == 200:
             return response.json()
         
         self.logger.debug(f"NuGet registry {repository.name} lookup failed for '{component.name}' - HTTP {response.status_code}")
-        return None
+        return self._not_found(response, url)
 
     def _extract_version_info(self, package_data: dict) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
         available_versions = package_data.get('versions', [])
@@ -42,4 +92,260 @@ class NugetRegistry(PackageRegistry):
         
         latest_version = available_versions[-1]
         
-        return None, None, latest_version
\ No newline at end of file
+        return None, None, latest_version
+
+    def _registration_base_url(self, repository: RepositoryConfig) -> Optional[str]:
+        if not repository.service_index:
+            return None
+        
+        def fetch():
+            response = self.http_client.get(repository.service_index, auth=self._repository_auth(repository))
+            return self._registration_resource(repository, response)
+        
+        return self._fetch_cached(repository, 'service-index', fetch) or None
+
+    async def _aregistration_base_url(self, repository: RepositoryConfig) -> Optional[str]:
+        if not repository.service_index:
+            return None
+        
+        async def fetch():
+            response = await self.http_client.aget(repository.service_index, auth=self._repository_auth(repository))
+            return self._registration_resource(repository, response)
+        
+        return await self._afetch_cached(repository, 'service-index', fetch) or None
+
+    def _registration_resource(self, repository: RepositoryConfig, response) -> str:
+        if response.status_code != 200:
+            self.logger.debug(f"NuGet service index of {repository.name} unavailable - HTTP {response.status_code}")
+            return self._not_found(response, repository.service_index) or ''
+        
+        resources = {}
+        for resource in response.json().get('resources', []):
+            resource_types = resource.get('@type', [])
+            if isinstance(resource_types, str):
+                resource_types = [resource_types]
+            for resource_type in resource_types:
+                resources.setdefault(resource_type, resource.get('@id', ''))
+        
+        for resource_type in REGISTRATION_RESOURCE_TYPES:
+            if resources.get(resource_type):
+                return resources[resource_type].rstrip('/')
+        return ''
+
+    def _get_registration(self, component: Component, repository: RepositoryConfig,
+                          base_url: str) -> Optional[Dict[str, Any]]:
+        package_id = component.name.lower()
+        url = f"{base_url}/{package_id}/index.json"
+        
+        def fetch():
+            response = self.http_client.get(url, auth=self._repository_auth(repository))
+            return self._registration_pages(component, repository, url, response)
+        
+        return self._fetch_cached(repository, f"registration:{package_id}", fetch)
+
+    async def _aget_registration(self, component: Component, repository: RepositoryConfig,
+                                 base_url: str) -> Optional[Dict[str, Any]]:
+        package_id = component.name.lower()
+        url = f"{base_url}/{package_id}/index.json"
+        
+        async def fetch():
+            response = await self.http_client.aget(url, auth=self._repository_auth(repository))
+            return self._registration_pages(component, repository, url, response)
+        
+        return await self._afetch_cached(repository, f"registration:{package_id}", fetch)
+
+    def _registration_pages(self, component: Component, repository: RepositoryConfig,
+                            url: str, response) -> Optional[Dict[str, Any]]:
+        if response.status_code != 200:
+            self.logger.debug(f"NuGet registration lookup in {repository.name} failed for '{component.name}' - HTTP {response.status_code}")
+            return self._not_found(response, url)
+        
+        pages = []
+        for page in response.json().get('items', []):
+            items = page.get('items')
+            pages.append({
+                'url': page.get('@id', ''),
+                'lower': page.get('lower', ''),
+                'upper': page.get('upper', ''),
+                'items': self._condense_leaves(items) if items is not None else None
+            })
+        return {'pages': pages}
+
+    def _condense_leaves(self, leaves: List[dict]) -> List[List[Any]]:
+        condensed = []
+        for leaf in leaves:
+            entry = leaf.get('catalogEntry', {})
+            version = entry.get('version')
+            if version:
+                condensed.append([version, entry.get('published'), entry.get('listed', True)])
+        return condensed
+
+    def _load_page(self, repository: RepositoryConfig, page: Dict[str, Any]) -> List[List[Any]]:
+        if page['items'] is not None:
+            return page['items']
+        
+        def fetch():
+            return self._page_leaves(page, self.http_client.get(page['url'], auth=self._repository_auth(repository)))
+        
+        return self._fetch_cached(repository, f"page:{page['url']}", fetch)
+
+    async def _aload_page(self, repository: RepositoryConfig, page: Dict[str, Any]) -> List[List[Any]]:
+        if page['items'] is not None:
+            return page['items']
+        
+        async def fetch():
+            return self._page_leaves(page, await self.http_client.aget(page['url'], auth=self._repository_auth(repository)))
+        
+        return await self._afetch_cached(repository, f"page:{page['url']}", fetch)
+
+    def _page_leaves(self, page: Dict[str, Any], response) -> List[List[Any]]:
+        if response.status_code != 200:
+            raise RegistryUnavailable(f"HTTP {response.status_code} for registration page {page['url']}")
+        return self._condense_leaves(response.json().get('items', []))
+
+    def _load_pages(self, repository: RepositoryConfig, pages: List[Dict[str, Any]],
+                    indices: List[int], loaded: Dict[int, List[List[Any]]]) -> None:
+        remote = [index for index in indices if pages[index]['items'] is None]
+        if len(remote) <= 1:
+            for index in indices:
+                loaded[index] = self._load_page(repository, pages[index])
+            return
+        
+        pool = self._paging_pool()
+        futures = {index: pool.submit(self._load_page, repository, pages[index]) for index in indices}
+        for index, future in futures.items():
+            loaded[index] = future.result()
+
+    async def _aload_pages(self, repository: RepositoryConfig, pages: List[Dict[str, Any]],
+                           indices: List[int], loaded: Dict[int, List[List[Any]]]) -> None:
+        leaves = await asyncio.gather(*(self._aload_page(repository, pages[index]) for index in indices))
+        loaded.update(zip(indices, leaves))
+
+    def _extract_registration_info(self, component: Component, repository: RepositoryConfig,
+                                   registration: Dict[str, Any]) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        pages = registration.get('pages', [])
+        if not pages:
+            return None, None, None
+        
+        current_key = self._version_key(component.version)
+        current_index = self._current_page(pages, current_key)
+        
+        # The newest pages and the one holding the current version are fetched together in the first batch
+        loaded: Dict[int, List[List[Any]]] = {}
+        self._load_pages(repository, pages, self._page_batch(pages, len(pages) - 1, loaded, current_index), loaded)
+        
+        prerelease, unlisted = None, None
+        for index in range(len(pages) - 1, -1, -1):
+            if index not in loaded:
+                self._load_pages(repository, pages, self._page_batch(pages, index, loaded), loaded)
+            latest, prerelease, unlisted = self._scan_leaves(loaded[index], prerelease, unlisted)
+            if latest:
+                break
+        else:
+            latest = prerelease or unlisted or (None, None)
+        
+        if current_index is not None and current_index not in loaded:
+            self._load_pages(repository, pages, [current_index], loaded)
+        return self._registration_info(loaded.get(current_index, []), current_key, latest)
+
+    async def _aextract_registration_info(self, component: Component, repository: RepositoryConfig,
+                                          registration: Dict[str, Any]) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        pages = registration.get('pages', [])
+        if not pages:
+            return None, None, None
+        
+        current_key = self._version_key(component.version)
+        current_index = self._current_page(pages, current_key)
+        
+        loaded: Dict[int, List[List[Any]]] = {}
+        await self._aload_pages(repository, pages, self._page_batch(pages, len(pages) - 1, loaded, current_index), loaded)
+        
+        prerelease, unlisted = None, None
+        for index in range(len(pages) - 1, -1, -1):
+            if index not in loaded:
+                await self._aload_pages(repository, pages, self._page_batch(pages, index, loaded), loaded)
+            latest, prerelease, unlisted = self._scan_leaves(loaded[index], prerelease, unlisted)
+            if latest:
+                break
+        else:
+            latest = prerelease or unlisted or (None, None)
+        
+        if current_index is not None and current_index not in loaded:
+            await self._aload_pages(repository, pages, [current_index], loaded)
+        return self._registration_info(loaded.get(current_index, []), current_key, latest)
+
+    def _current_page(self, pages: List[Dict[str, Any]], current_key: Tuple) -> Optional[int]:
+        for index, page in enumerate(pages):
+            if self._version_key(page['lower']) <= current_key <= self._version_key(page['upper']):
+                return index
+        return None
+
+    def _page_batch(self, pages: List[Dict[str, Any]], newest: int, loaded: Dict[int, List[List[Any]]],
+                    current_index: Optional[int] = None) -> List[int]:
+        # Pages are ordered by version, older ones are only needed while the newer ones hold no listed stable release
+        batch = [index for index in range(newest, max(-1, newest - self.page_batch_size), -1) if index not in loaded]
+        if current_index is not None and current_index not in batch and current_index not in loaded:
+            batch.append(current_index)
+        return batch
+
+    def _scan_leaves(self, leaves: List[List[Any]], prerelease: Optional[Tuple[str, str]],
+                     unlisted: Optional[Tuple[str, str]]):
+        listed = [leaf for leaf in leaves if leaf[2] is not False]
+        stable = [leaf for leaf in listed if '-' not in leaf[0].split('+', 1)[0]]
+        if stable:
+            return self._latest_leaf(stable), prerelease, unlisted
+        if prerelease is None and listed:
+            prerelease = self._latest_leaf(listed)
+        if unlisted is None and leaves:
+            unlisted = self._latest_leaf(leaves)
+        return None, prerelease, unlisted
+
+    def _registration_info(self, current_leaves: List[List[Any]], current_key: Tuple,
+                           latest: Tuple[Optional[str], Optional[str]]) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        current_date = None
+        for version, published, _ in current_leaves:
+            if self._version_key(version) == current_key:
+                current_date = self._parse_published(published)
+                break
+        
+        latest_version, latest_published = latest
+        return current_date, self._parse_published(latest_published), latest_version
+
+    @classmethod
+    def _paging_pool(cls) -> ThreadPoolExecutor:
+        with NugetRegistry._page_pool_lock:
+            if NugetRegistry._page_pool is None:
+                NugetRegistry._page_pool = ThreadPoolExecutor(max_workers=cls.page_pool_size,
+                                                              thread_name_prefix='nuget-pages')
+            return NugetRegistry._page_pool
+
+    def _latest_leaf(self, leaves: List[List[Any]]) -> Tuple[str, str]:
+        version, published, _ = max(leaves, key=lambda leaf: self._version_key(leaf[0]))
+        return version, published
+
+    def _version_key(self, version: str) -> Tuple:
+        release, _, prerelease = version.split('+', 1)[0].strip().partition('-')
+        
+        numbers = [int(part) if part.isdigit() else 0 for part in release.split('.')]
+        numbers += [0] * (4 - len(numbers))
+        
+        if not prerelease:
+            return tuple(numbers), 1, ()
+        
+        labels = tuple(
+            (0, int(label), '') if label.isdigit() else (1, 0, label.lower())
+            for label in prerelease.split('.')
+        )
+        return tuple(numbers), 0, labels
+
+    def _parse_published(self, value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        
+        value = _FRACTION.sub(lambda match: '.' + match.group(1)[:6].ljust(6, '0'), value.replace('Z', '+00:00'))
+        published = datetime.fromisoformat(value)
+        
+        # Unlisted packages on nuget.org report a placeholder publish date of 1900-01-01
+        if published.year <= 1900:
+            return None
+        return published
@@ -1,38 +1,82 @@
+import re
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from packaging.version import InvalidVersion, Version
 
 from ..models import Component, RepositoryConfig
-from .base import PackageRegistry
+from .base import PackageRegistry, RegistryUnavailable
+
+SIMPLE_JSON_ACCEPT = 'application/vnd.pypi.simple.v1+json'
+
+_NAME_SEPARATORS = re.compile(r'[-_.]+')
+_SDIST_SUFFIXES = ('.tar.gz', '.tar.bz2', '.tar.xz', '.tgz', '.zip', '.tar')
 
 
 class PypiRegistry(PackageRegistry):
+    package_type = 'pypi'
+
     def get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
-        for repo in self.repositories:
-            try:
-                package_data = self._fetch_package_data(component, repo)
-                if package_data:
-                    return self._extract_version_info(package_data, component.version)
-            except Exception as e:
-                self.logger.debug(f"Error accessing PyPI registry {repo.name}: {e}")
-                continue
+        result = self._query_repositories(component, lambda repo: self._repository_package_info(component, repo))
+        if result is not None:
+            return result
         
         self.logger.warning(f"PyPI package '{component.name}' not found in any configured registry")
         return None, None, None
 
-    def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
-        url = f"{repository.url}/{component.name}/json"
+    async def get_package_info_async(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        result = await self._aquery_repositories(component, lambda repo: self._arepository_package_info(component, repo))
+        if result is not None:
+            return result
         
-        auth = None
-        if repository.auth and 'username' in repository.auth and 'password' in repository.auth:
-            auth = (repository.auth['username'], repository.auth['password'])
+        self.logger.warning(f"PyPI package '{component.name}' not found in any configured registry")
+        return None, None, None
+
+    def package_key(self, component: Component) -> str:
+        return self._normalize_name(component.name)
+
+    def _repository_package_info(self, component: Component, repo: RepositoryConfig):
+        if repo.simple_url:
+            try:
+                result = self._get_package_info_from_index(component, repo)
+            except RegistryUnavailable as e:
+                self.logger.debug(f"Simple index of {repo.name} unavailable, using the JSON API: {e}")
+                result = None
+            if result is not None:
+                return result
         
-        response = self.http_client.get(url, auth=auth)
+        package_data = self._get_package_data(component, repo)
+        return self._extract_version_info(package_data, component.version) if package_data else None
+
+    async def _arepository_package_info(self, component: Component, repo: RepositoryConfig):
+        if repo.simple_url:
+            try:
+                result = await self._aget_package_info_from_index(component, repo)
+            except RegistryUnavailable as e:
+                self.logger.debug(f"Simple index of {repo.name} unavailable, using the JSON API: {e}")
+                result = None
+            if result is not None:
+                return result
         
+        package_data = await self._aget_package_data(component, repo)
+        return self._extract_version_info(package_data, component.version) if package_data else None
+
+    def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
+        url = f"{repository.url}/{component.name}/json"
+        response = self.http_client.get(url, auth=self._repository_auth(repository))
+        return self._package_data(component, repository, url, response)
+
+    async def _afetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
+        url = f"{repository.url}/{component.name}/json"
+        response = await self.http_client.aget(url, auth=self._repository_auth(repository))
+        return self._package_data(component, repository, url, response)
+
+    def _package_data(self, component: Component, repository: RepositoryConfig, url: str, response) -> dict:
         if response.status_code == 200:
             return response.json()
         
         self.logger.debug(f"PyPI registry {repository.name} lookup failed for '{component.name}' - HTTP {response.status_code}")
-        return None
+        return self._not_found(response, url)
 
     def _extract_version_info(self, package_data: dict, current_version: str) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
         releases = package_data.get('releases', {})
@@ -69,4 +113,179 @@ class PypiRegistry(PackageRegistry):
             else:
                 return datetime.strptime(upload_time, '%Y-%m-%d %H:%M:%S')
         except ValueError:
-            return None
\ No newline at end of file
+            return None
+
+    def _normalize_name(self, name: str) -> str:
+        return _NAME_SEPARATORS.sub('-', name).lower()
+
+    def _get_package_info_from_index(self, component: Component,
+                                     repository: RepositoryConfig) -> Optional[Tuple[Optional[datetime], Optional[datetime], Optional[str]]]:
+        index = self._get_simple_index(component, repository)
+        if not index or not index['versions']:
+            return None
+        
+        current_version, latest_version = self._index_versions(component, index)
+        
+        current_date = self._index_date(index, current_version)
+        if current_version and current_date is None:
+            current_date = self._get_release_date(component, repository, current_version)
+        
+        latest_date = self._index_date(index, latest_version)
+        if latest_version and latest_date is None:
+            latest_date = self._get_release_date(component, repository, latest_version)
+        
+        return current_date, latest_date, latest_version or ''
+
+    async def _aget_package_info_from_index(self, component: Component,
+                                            repository: RepositoryConfig) -> Optional[Tuple[Optional[datetime], Optional[datetime], Optional[str]]]:
+        index = await self._aget_simple_index(component, repository)
+        if not index or not index['versions']:
+            return None
+        
+        current_version, latest_version = self._index_versions(component, index)
+        
+        current_date = self._index_date(index, current_version)
+        if current_version and current_date is None:
+            current_date = await self._aget_release_date(component, repository, current_version)
+        
+        latest_date = self._index_date(index, latest_version)
+        if latest_version and latest_date is None:
+            latest_date = await self._aget_release_date(component, repository, latest_version)
+        
+        return current_date, latest_date, latest_version or ''
+
+    def _index_versions(self, component: Component, index: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        current_version = self._find_best_version_match(component.version, index['versions'])
+        return current_version, self._latest_version(index['versions'], set(index['yanked']))
+
+    def _index_date(self, index: Dict[str, Any], version: Optional[str]) -> Optional[datetime]:
+        if not version:
+            return None
+        return self._parse_pypi_date(index['uploads'].get(self._canonical_version(version)))
+
+    def _get_simple_index(self, component: Component, repository: RepositoryConfig) -> Optional[Dict[str, Any]]:
+        name = self._normalize_name(component.name)
+        return self._fetch_conditional(
+            repository, f"simple:{name}", f"{repository.simple_url}/{name}/", self._simple_index_parser(repository, name),
+            headers={'Accept': SIMPLE_JSON_ACCEPT},
+            auth=self._repository_auth(repository)
+        )
+
+    async def _aget_simple_index(self, component: Component, repository: RepositoryConfig) -> Optional[Dict[str, Any]]:
+        name = self._normalize_name(component.name)
+        return await self._afetch_conditional(
+            repository, f"simple:{name}", f"{repository.simple_url}/{name}/", self._simple_index_parser(repository, name),
+            headers={'Accept': SIMPLE_JSON_ACCEPT},
+            auth=self._repository_auth(repository)
+        )
+
+    def _simple_index_parser(self, repository: RepositoryConfig, name: str):
+        def parse(response):
+            if not response.headers.get('Content-Type', '').startswith(SIMPLE_JSON_ACCEPT):
+                self.logger.debug(f"{repository.name} does not serve the PEP 691 JSON index, using the JSON API")
+                return None
+            return self._condense_simple_index(name, response.json())
+        return parse
+
+    def _condense_simple_index(self, name: str, index: dict) -> Dict[str, Any]:
+        uploads: Dict[str, str] = {}
+        files_per_version: Dict[str, int] = {}
+        yanked_per_version: Dict[str, int] = {}
+        
+        for file_info in index.get('files', []):
+            version = self._version_from_filename(name, file_info.get('filename', ''))
+            if not version:
+                continue
+            version = self._canonical_version(version)
+            
+            files_per_version[version] = files_per_version.get(version, 0) + 1
+            if file_info.get('yanked'):
+                yanked_per_version[version] = yanked_per_version.get(version, 0) + 1
+            
+            upload_time = file_info.get('upload-time')
+            if upload_time and (version not in uploads or upload_time < uploads[version]):
+                uploads[version] = upload_time
+        
+        yanked = {v for v, count in yanked_per_version.items() if count == files_per_version[v]}
+        versions = index.get('versions') or list(files_per_version)
+        return {
+            'versions': versions,
+            'uploads': uploads,
+            'yanked': [v for v in versions if self._canonical_version(v) in yanked]
+        }
+
+    def _version_from_filename(self, name: str, filename: str) -> Optional[str]:
+        if filename.endswith('.whl') or filename.endswith('.egg'):
+            parts = filename.split('-')
+            if len(parts) >= 3 and self._normalize_name(parts[0]) == name:
+                return parts[1]
+            return None
+        
+        for suffix in _SDIST_SUFFIXES:
+            if filename.endswith(suffix):
+                stem = filename[:-len(suffix)]
+                project, _, version = stem.rpartition('-')
+                if project and self._normalize_name(project) == name:
+                    return version
+                return None
+        
+        return None
+
+    def _canonical_version(self, version: str) -> str:
+        try:
+            return str(Version(version))
+        except InvalidVersion:
+            return version
+
+    def _latest_version(self, versions: List[str], yanked: Set[str]) -> Optional[str]:
+        candidates = []
+        for version in versions:
+            if version in yanked:
+                continue
+            try:
+                candidates.append((Version(version), version))
+            except InvalidVersion:
+                continue
+        
+        if not candidates:
+            return None
+        
+        stable = [candidate for candidate in candidates if not candidate[0].is_prerelease]
+        return max(stable or candidates)[1]
+
+    def _get_release_date(self, component: Component, repository: RepositoryConfig,
+                          version: str) -> Optional[datetime]:
+        url = f"{repository.url}/{component.name}/{version}/json"
+        
+        def fetch():
+            return self._first_upload(url, self.http_client.get(url, auth=self._repository_auth(repository)))
+        
+        try:
+            return self._parse_pypi_date(self._fetch_cached(repository, f"release:{self._normalize_name(component.name)}:{version}", fetch))
+        except RegistryUnavailable as e:
+            self.logger.debug(f"Release date of {component.name} {version} unavailable: {e}")
+            return None
+
+    async def _aget_release_date(self, component: Component, repository: RepositoryConfig,
+                                 version: str) -> Optional[datetime]:
+        url = f"{repository.url}/{component.name}/{version}/json"
+        
+        async def fetch():
+            return self._first_upload(url, await self.http_client.aget(url, auth=self._repository_auth(repository)))
+        
+        try:
+            return self._parse_pypi_date(await self._afetch_cached(repository, f"release:{self._normalize_name(component.name)}:{version}", fetch))
+        except RegistryUnavailable as e:
+            self.logger.debug(f"Release date of {component.name} {version} unavailable: {e}")
+            return None
+
+    def _first_upload(self, url: str, response) -> Optional[str]:
+        if response.status_code != 200:
+            return self._not_found(response, url)
+        urls = response.json().get('urls', [])
+        upload_times = [
+            file_info.get('upload_time_iso_8601') or file_info.get('upload_time')
+            for file_info in urls
+        ]
+        upload_times = [upload_time for upload_time in upload_times if upload_time]
+        return min(upload_times) if upload_times else None
@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import Optional, Tuple
+
+from ..models import Component, RepositoryConfig
+from ..utils.release_index import ReleaseIndex
+from .base import PackageRegistry
+
+
+class ReleaseIndexRegistry(PackageRegistry):
+    def __init__(self, package_type: str, index: ReleaseIndex,
+                 fallback: Optional[PackageRegistry] = None):
+        super().__init__([])
+        self.package_type = package_type
+        self.index = index
+        self.fallback = fallback
+
+    def get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        result = self._indexed_result(component)
+        if result is not None and result[0] is not None:
+            return result
+        
+        if self.fallback is not None:
+            return self.fallback.get_package_info(component)
+        
+        return self._unindexed(component, result)
+
+    async def get_package_info_async(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        # The index is memory mapped, so only the fallback needs to leave the event loop
+        result = self._indexed_result(component)
+        if result is not None and result[0] is not None:
+            return result
+        
+        if self.fallback is not None:
+            return await self.fallback.get_package_info_async(component)
+        
+        return self._unindexed(component, result)
+
+    def _indexed_result(self, component: Component) -> Optional[Tuple[Optional[datetime], Optional[datetime], Optional[str]]]:
+        package_key = self.package_key(component)
+        
+        for version in dict.fromkeys((component.version, self._normalize_version(component.version))):
+            result = self.index.lookup(self.package_type, package_key, version)
+            if result is None or result[0] is not None:
+                return result
+        return result
+
+    def _unindexed(self, component: Component, result) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        if result is not None:
+            return result
+        
+        self.logger.warning(f"{self.package_type} package '{component.name}' not found in release index")
+        return None, None, None
+
+    def package_key(self, component: Component) -> str:
+        if self.fallback is not None:
+            return self.fallback.package_key(component)
+        return component.name
+
+    def prefetch(self, components) -> None:
+        if self.fallback is not None:
+            self.fallback.prefetch([
+                component for component in components
+                if not self._indexed(component)
+            ])
+
+    def _indexed(self, component: Component) -> bool:
+        result = self.index.lookup(self.package_type, self.package_key(component), component.version)
+        return result is not None and result[0] is not None
+
+    def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
+        return None
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional, Tuple
+
+from ..models import Component, RepositoryConfig
+from ..utils.snapshot_store import SnapshotStore
+from .base import PackageRegistry
+
+
+class SnapshotRegistry(PackageRegistry):
+    def __init__(self, package_type: str, store: SnapshotStore,
+                 key_registry: Optional[PackageRegistry] = None):
+        super().__init__([])
+        self.package_type = package_type
+        self.store = store
+        self.key_registry = key_registry
+
+    def get_package_info(self, component: Component) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        result = self.store.lookup(self.package_type, self.package_key(component), component.version)
+        if result is None:
+            self.logger.warning(f"{self.package_type} package '{component.name}@{component.version}' not found in snapshot")
+            return None, None, None
+        
+        return result
+
+    def package_key(self, component: Component) -> str:
+        if self.key_registry is not None:
+            return self.key_registry.package_key(component)
+        return component.name
+
+    def _fetch_package_data(self, component: Component, repository: RepositoryConfig) -> dict:
+        return None
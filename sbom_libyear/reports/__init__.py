@@ -1,5 +1,8 @@
 from .base import ReportGenerator
+from .columnar_report import ColumnarReportGenerator
 from .json_report import JSONReportGenerator
+from .ndjson_report import NDJSONReportGenerator
 from .text_report import TextReportGenerator
 
-__all__ = ['ReportGenerator', 'JSONReportGenerator', 'TextReportGenerator']
\ No newline at end of file
+__all__ = ['ReportGenerator', 'ColumnarReportGenerator', 'JSONReportGenerator', 'NDJSONReportGenerator',
+           'TextReportGenerator']
\ No newline at end of file
@@ -1,22 +1,59 @@
+import io
 from abc import ABC, abstractmethod
-from dataclasses import asdict
-from typing import List
+from array import array
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO
 
 from ..models import LibyearResult, LibyearReport
+from ..utils.metrics import Metrics
+
+
+class ReportRows(Sequence):
+    # Renders report rows from the results on access instead of keeping a dict per component around
+    def __init__(self, results: Sequence, render: Callable[[LibyearResult], Dict],
+                 indices: Optional[array] = None):
+        self._results = results
+        self._render = render
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._results) if self._indices is None else len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._render(self._results[index if self._indices is None else self._indices[index]])
+
+    def __iter__(self) -> Iterator[Dict]:
+        if self._indices is None:
+            return map(self._render, self._results)
+        return (self._render(self._results[index]) for index in self._indices)
+
+    def rendered_as(self, render: Callable[[LibyearResult], Dict]) -> 'ReportRows':
+        return ReportRows(self._results, render, self._indices)
+
+    def sorted_by(self, key: Callable[[LibyearResult], Any], reverse: bool = False) -> 'ReportRows':
+        # Orders row indices by a result attribute, so sorting does not render every row up front
+        indices = range(len(self._results)) if self._indices is None else self._indices
+        ordered = sorted(indices, key=lambda index: key(self._results[index]), reverse=reverse)
+        return ReportRows(self._results, self._render, array('q', ordered))
 
 
 class ReportGenerator(ABC):
-    def generate(self, results: List[LibyearResult]) -> str:
+    def generate(self, results: Sequence[LibyearResult]) -> str:
         report = self._create_report_data(results)
         return self._format_report(report)
 
-    def _create_report_data(self, results: List[LibyearResult]) -> LibyearReport:
-        total_libyear = sum(r.years_behind for r in results if r.error is None)
-        successful_analyses = len([r for r in results if r.error is None])
-        failed_analyses = len([r for r in results if r.error is not None])
+    def _create_report_data(self, results: Sequence[LibyearResult]) -> LibyearReport:
+        with Metrics().phase('report'):
+            return self._build_report_data(results)
+
+    def _build_report_data(self, results: Sequence[LibyearResult]) -> LibyearReport:
+        total_libyear = 0.0
+        error_indices = array('q')
         
         package_manager_breakdown = {}
-        for result in results:
+        for index, result in enumerate(results):
             pkg_type = result.component.package_type
             if pkg_type not in package_manager_breakdown:
                 package_manager_breakdown[pkg_type] = {
@@ -28,46 +65,53 @@ class ReportGenerator(ABC):
             
             package_manager_breakdown[pkg_type]['component_count'] += 1
             if result.error is None:
+                total_libyear += result.years_behind
                 package_manager_breakdown[pkg_type]['total_libyear'] += result.years_behind
                 package_manager_breakdown[pkg_type]['successful_count'] += 1
             else:
+                error_indices.append(index)
                 package_manager_breakdown[pkg_type]['failed_count'] += 1
         
-        components_data = []
-        for result in results:
-            components_data.append({
-                'name': result.component.name,
-                'package_type': result.component.package_type,
-                'current_version': result.current_version,
-                'latest_version': result.latest_version,
-                'years_behind': result.years_behind,
-                'current_date': result.current_date.isoformat() if result.current_date else None,
-                'latest_date': result.latest_date.isoformat() if result.latest_date else None,
-                'purl': result.component.purl,
-                'error': result.error
-            })
-        
-        errors = []
-        for result in results:
-            if result.error:
-                errors.append({
-                    'component': result.component.name,
-                    'package_type': result.component.package_type,
-                    'version': result.current_version,
-                    'error': result.error,
-                    'purl': result.component.purl
-                })
-        
         return LibyearReport(
             total_libyear=total_libyear,
             total_components=len(results),
-            successful_analyses=successful_analyses,
-            failed_analyses=failed_analyses,
+            successful_analyses=len(results) - len(error_indices),
+            failed_analyses=len(error_indices),
             breakdown_by_package_manager=package_manager_breakdown,
-            components=components_data,
-            errors=errors
+            components=ReportRows(results, self._component_row),
+            errors=ReportRows(results, self._error_row, error_indices)
         )
 
-    @abstractmethod
+    @staticmethod
+    def _component_row(result: LibyearResult) -> Dict:
+        return {
+            'name': result.component.name,
+            'package_type': result.component.package_type,
+            'current_version': result.current_version,
+            'latest_version': result.latest_version,
+            'years_behind': result.years_behind,
+            'current_date': result.current_date.isoformat() if result.current_date else None,
+            'latest_date': result.latest_date.isoformat() if result.latest_date else None,
+            'purl': result.component.purl,
+            'error': result.error,
+            'checked_at': result.checked_at.isoformat() if result.checked_at else None
+        }
+
+    @staticmethod
+    def _error_row(result: LibyearResult) -> Dict:
+        return {
+            'component': result.component.name,
+            'package_type': result.component.package_type,
+            'version': result.current_version,
+            'error': result.error,
+            'purl': result.component.purl
+        }
+
     def _format_report(self, report: LibyearReport) -> str:
-        pass
\ No newline at end of file
+        buffer = io.StringIO()
+        self.write(report, buffer)
+        return buffer.getvalue()
+
+    @abstractmethod
+    def write(self, report: LibyearReport, stream: TextIO):
+        pass
@@ -0,0 +1,118 @@
+import csv
+import os
+import re
+import time
+import uuid
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, Optional, TextIO
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from ..models import LibyearReport, LibyearResult
+from ..models.libyear_result import from_timestamp
+from .base import ReportGenerator
+
+COLUMNS = ('sbom', 'run_at', 'name', 'package_type', 'purl', 'current_version', 'latest_version',
+           'current_date', 'latest_date', 'years_behind', 'error', 'checked_at')
+DATE_COLUMNS = ('run_at', 'current_date', 'latest_date', 'checked_at')
+DATASET_FORMATS = ('parquet', 'csv')
+
+
+def _parquet_schema():
+    timestamp = pyarrow.timestamp('s', tz='UTC')
+    return pyarrow.schema([
+        (column, timestamp if column in DATE_COLUMNS else
+         pyarrow.float64() if column == 'years_behind' else pyarrow.string())
+        for column in COLUMNS
+    ])
+
+
+class ColumnarReportGenerator(ReportGenerator):
+    batch_size = 65536
+
+    def __init__(self, sbom: str = '', dataset_format: Optional[str] = None, run_at: Optional[int] = None):
+        if dataset_format not in (None, *DATASET_FORMATS):
+            raise ValueError(f"Unsupported dataset format: {dataset_format}")
+        if dataset_format == 'parquet' and pyarrow is None:
+            raise ImportError("Parquet datasets require pyarrow: pip install 'sbom-libyear[parquet]'")
+
+        self.sbom = sbom
+        self.dataset_format = dataset_format or ('parquet' if pyarrow is not None else 'csv')
+        self.run_at = int(time.time()) if run_at is None else run_at
+
+    def write(self, report: LibyearReport, stream: TextIO):
+        writer = csv.writer(stream, lineterminator='\n')
+        writer.writerow(COLUMNS)
+        for row in self._rows(report):
+            writer.writerow([self._csv_value(column, row[column]) for column in COLUMNS])
+
+    def append(self, report: LibyearReport, dataset_dir: str) -> str:
+        # Every run adds its own part file, so readers such as pyarrow.dataset, DuckDB or Spark see one table
+        os.makedirs(dataset_dir, exist_ok=True)
+        name = f"{self._part_stem()}.{self.dataset_format}"
+        part_path = os.path.join(dataset_dir, name)
+        # Dot files are skipped by dataset readers, so a half-written part never shows up in queries
+        temp_path = os.path.join(dataset_dir, f".{name}.tmp")
+
+        try:
+            if self.dataset_format == 'parquet':
+                self._write_parquet(report, temp_path)
+            else:
+                with open(temp_path, 'w', encoding='utf-8', newline='') as part_file:
+                    self.write(report, part_file)
+            os.replace(temp_path, part_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return part_path
+
+    def _write_parquet(self, report: LibyearReport, path: str):
+        schema = _parquet_schema()
+        with pyarrow.parquet.ParquetWriter(path, schema, compression='zstd') as writer:
+            rows = self._rows(report)
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    break
+                columns = {column: [row[column] for row in batch] for column in COLUMNS}
+                writer.write_table(pyarrow.Table.from_pydict(columns, schema=schema))
+
+    def _rows(self, report: LibyearReport) -> Iterator[Dict]:
+        # Reports built by any generator can be exported, the rows are rendered again from the results
+        return iter(report.components.rendered_as(self._dataset_row))
+
+    def _dataset_row(self, result: LibyearResult) -> Dict:
+        return {
+            'sbom': self.sbom,
+            'run_at': self.run_at,
+            'name': result.component.name,
+            'package_type': result.component.package_type,
+            'purl': result.component.purl,
+            'current_version': result.current_version,
+            'latest_version': result.latest_version,
+            'current_date': result.current_timestamp,
+            'latest_date': result.latest_timestamp,
+            'years_behind': result.years_behind,
+            'error': result.error,
+            'checked_at': result.checked_timestamp
+        }
+
+    def _part_stem(self) -> str:
+        stem = re.sub(r'[^A-Za-z0-9._-]+', '_', Path(self.sbom).name) if self.sbom else 'report'
+        run = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(self.run_at))
+        return f"{stem}-{run}-{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def _csv_value(column: str, value):
+        if value is None:
+            return ''
+        if column in DATE_COLUMNS and isinstance(value, int):
+            return from_timestamp(value).isoformat()
+        return value
@@ -1,10 +1,42 @@
 import json
-from dataclasses import asdict
+from dataclasses import fields
+from typing import Iterable, TextIO
 
 from ..models import LibyearReport
+from ..utils.metrics import Metrics
 from .base import ReportGenerator
 
+ROW_FIELDS = ('components', 'errors')
+
 
 class JSONReportGenerator(ReportGenerator):
-    def _format_report(self, report: LibyearReport) -> str:
-        return json.dumps(asdict(report), indent=2, ensure_ascii=False, default=str)
\ No newline at end of file
+    def __init__(self, include_metrics: bool = True):
+        self.include_metrics = include_metrics
+
+    def write(self, report: LibyearReport, stream: TextIO):
+        report_data = {field.name: getattr(report, field.name) for field in fields(report)}
+        metrics = Metrics()
+        if self.include_metrics and metrics.enabled:
+            report_data['metrics'] = metrics.snapshot()
+
+        # Same layout as json.dumps(indent=2), but component rows are encoded and written one at a time
+        stream.write('{')
+        for position, (key, value) in enumerate(report_data.items()):
+            stream.write(f"{',' if position else ''}\n  {self._encode(key)}: ")
+            if key in ROW_FIELDS:
+                self._write_rows(value, stream)
+            else:
+                stream.write(self._encode(value).replace('\n', '\n  '))
+        stream.write('\n}')
+
+    def _write_rows(self, rows: Iterable[dict], stream: TextIO):
+        empty = True
+        for row in rows:
+            stream.write('[\n    ' if empty else ',\n    ')
+            stream.write(self._encode(row).replace('\n', '\n    '))
+            empty = False
+        stream.write('[]' if empty else '\n  ]')
+
+    @staticmethod
+    def _encode(value) -> str:
+        return json.dumps(value, indent=2, ensure_ascii=False, default=str)
@@ -0,0 +1,13 @@
+import json
+from typing import TextIO
+
+from ..models import LibyearReport
+from .base import ReportGenerator
+
+
+class NDJSONReportGenerator(ReportGenerator):
+    def write(self, report: LibyearReport, stream: TextIO):
+        # One self-contained component row per line, so huge reports can be read back line by line
+        for row in report.components:
+            stream.write(json.dumps(row, ensure_ascii=False, separators=(',', ':'), default=str))
+            stream.write('\n')
@@ -1,4 +1,21 @@
 from .http_client import HttpClient
 from .config_loader import ConfigLoader
+from .metrics import Metrics
+from .release_index import ReleaseIndex, ReleaseIndexWriter
+from .repository_health import RepositoryHealth
+from .response_cache import ResponseCache
+from .runtime import configure_cache, configure_http_client
+from .snapshot_store import SnapshotStore
 
-__all__ = ['HttpClient', 'ConfigLoader']
\ No newline at end of file
+__all__ = [
+    'HttpClient',
+    'ConfigLoader',
+    'Metrics',
+    'ReleaseIndex',
+    'ReleaseIndexWriter',
+    'RepositoryHealth',
+    'ResponseCache',
+    'SnapshotStore',
+    'configure_cache',
+    'configure_http_client'
+]
\ No newline at end of file
@@ -0,0 +1,163 @@
+import asyncio
+import atexit
+import importlib.util
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncHttpClient:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self._initialized = True
+            self.logger = logging.getLogger(self.__class__.__name__)
+            self.timeout = 10
+            self.user_agent = 'sbom-libyear-calculator/1.0'
+            self.proxies: Optional[Dict[str, str]] = None
+            self.pool_size = 100
+            self.keepalive = 30.0
+            self.http2 = True
+            self._clients: Dict[str, Any] = {}
+            self._loop: Optional[asyncio.AbstractEventLoop] = None
+            self._thread: Optional[threading.Thread] = None
+            self._lock = threading.Lock()
+
+    @staticmethod
+    def is_available() -> bool:
+        return httpx is not None
+
+    @staticmethod
+    def transport_errors() -> tuple:
+        return (httpx.TransportError,) if httpx is not None else ()
+
+    def configure(self, timeout: int, user_agent: str, proxies: Optional[Dict[str, str]] = None,
+                  pool_size: Optional[int] = None, keepalive: Optional[float] = None,
+                  http2: bool = True):
+        if httpx is None:
+            raise ImportError("The async HTTP backend requires httpx: pip install 'sbom-libyear[async]'")
+
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.proxies = proxies
+        if pool_size:
+            self.pool_size = pool_size
+        if keepalive is not None:
+            self.keepalive = keepalive
+
+        if http2 and importlib.util.find_spec('h2') is None:
+            self.logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            auth: Optional[tuple] = None):
+        return self.submit(self._request('GET', url, params=params, headers=headers, auth=auth)).result()
+
+    async def aget(self, url: str, params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None,
+                   auth: Optional[tuple] = None):
+        loop = self._ensure_loop()
+        coroutine = self._request('GET', url, params=params, headers=headers, auth=auth)
+        if asyncio.get_running_loop() is loop:
+            return await coroutine
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    def submit(self, coroutine) -> Future:
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            # Blocking on the loop from its own thread would never return
+            raise RuntimeError("Blocking HTTP call made on the event loop, await aget() instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def post(self, url: str, data: Optional[Dict[str, Any]] = None,
+             json: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             auth: Optional[tuple] = None):
+        return self.submit(
+            self._request('POST', url, data=data, json=json, headers=headers, auth=auth)
+        ).result()
+
+    def close(self):
+        with self._lock:
+            loop = self._loop
+            if loop is None:
+                return
+            self._loop = None
+
+        async def close_clients():
+            for client in self._clients.values():
+                await client.aclose()
+            self._clients.clear()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close_clients(), loop).result(timeout=5)
+        except Exception as e:
+            self.logger.debug(f"Failed to close HTTP clients cleanly: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    async def _request(self, method: str, url: str, **kwargs):
+        client = self._client_for(url)
+        return await client.request(method, url, **kwargs)
+
+    def _client_for(self, url: str):
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}"
+
+        client = self._clients.get(host_key)
+        if client is None:
+            limits = httpx.Limits(
+                max_connections=self.pool_size,
+                max_keepalive_connections=self.pool_size,
+                keepalive_expiry=self.keepalive
+            )
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=limits,
+                timeout=self.timeout,
+                headers={'User-Agent': self.user_agent},
+                proxy=self._proxy_for(parts.scheme, parts.hostname or ''),
+                follow_redirects=True
+            )
+            self._clients[host_key] = client
+        return client
+
+    def _proxy_for(self, scheme: str, hostname: str) -> Optional[str]:
+        if not self.proxies:
+            return None
+
+        no_proxy = [host.strip() for host in self.proxies.get('no_proxy', '').split(',') if host.strip()]
+        for host in no_proxy:
+            if hostname == host.lstrip('.') or hostname.endswith(host if host.startswith('.') else f".{host}"):
+                return None
+
+        return self.proxies.get(scheme)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name='sbom-libyear-http', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+            return self._loop
@@ -79,12 +79,14 @@ class ConfigLoader:
                 "pypi": [{
                     "name": "pypi",
                     "url": "https://pypi.org/pypi",
+                    "simple_url": "https://pypi.org/simple",
                     "enabled": True,
                     "priority": 1
                 }],
                 "nuget": [{
                     "name": "nuget",
                     "url": "https://api.nuget.org/v3-flatcontainer",
+                    "service_index": "https://api.nuget.org/v3/index.json",
                     "enabled": True,
                     "priority": 1
                 }]
@@ -92,7 +94,26 @@ class ConfigLoader:
             "http": {
                 "timeout": 10,
                 "retries": 3,
-                "user_agent": "sbom-libyear-calculator/1.0"
+                "backoff_factor": 0.5,
+                "max_backoff": 60,
+                "rate_limits": {
+                    "search.maven.org": 5
+                },
+                "user_agent": "sbom-libyear-calculator/1.0",
+                "backend": "requests",
+                "workers": 8,
+                "concurrency": {
+                    "maven": 4,
+                    "npm": 8,
+                    "pypi": 8,
+                    "nuget": 4
+                }
+            },
+            "cache": {
+                "enabled": True,
+                "ttl": 3600,
+                "directory": "~/.cache/sbom-libyear",
+                "max_size_mb": 512
             }
         }
 
@@ -108,4 +129,7 @@ class ConfigLoader:
         return ConfigLoader._config.get("http", {})
 
     def get_proxy_config(self) -> Optional[Dict]:
-        return ConfigLoader._config.get("proxy")
\ No newline at end of file
+        return ConfigLoader._config.get("proxy")
+
+    def get_cache_config(self) -> Dict:
+        return ConfigLoader._config.get("cache", {})
\ No newline at end of file
@@ -1,5 +1,22 @@
+import asyncio
+import functools
+import logging
+import random
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Callable, Coroutine, Optional, Dict, Any
+
+from .async_http_client import AsyncHttpClient
+from .metrics import Metrics
+from .rate_limiter import RateLimiter
+from .repository_health import RepositoryHealth
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
 
 class HttpClient:
@@ -16,30 +33,166 @@ class HttpClient:
             HttpClient._session = requests.Session()
             self.timeout = 10
             self.user_agent = 'sbom-libyear-calculator/1.0'
+            self.backend = 'requests'
+            self.retries = 0
+            self.backoff_factor = 0.5
+            self.max_backoff = 60.0
+            self.rate_limiter = RateLimiter()
+            self.metrics = Metrics()
+            self.health = RepositoryHealth()
+            self._async_client: Optional[AsyncHttpClient] = None
+            self.logger = logging.getLogger(self.__class__.__name__)
             HttpClient._session.headers.update({'User-Agent': self.user_agent})
 
-    def configure(self, timeout: int, user_agent: str, proxies: Optional[Dict[str, str]] = None):
+    def configure(self, timeout: int, user_agent: str, proxies: Optional[Dict[str, str]] = None,
+                  pool_size: Optional[int] = None, backend: str = 'requests',
+                  keepalive: Optional[float] = None, http2: bool = True,
+                  retries: int = 0, backoff_factor: float = 0.5, max_backoff: float = 60.0,
+                  rate_limits: Optional[Dict[str, float]] = None):
         self.timeout = timeout
         self.user_agent = user_agent
+        self.retries = max(0, int(retries))
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.rate_limiter.configure(rate_limits)
         HttpClient._session.headers.update({'User-Agent': user_agent})
         if proxies:
             HttpClient._session.proxies = proxies
+        if pool_size:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            HttpClient._session.mount('http://', adapter)
+            HttpClient._session.mount('https://', adapter)
 
-    def get(self, url: str, params: Optional[Dict[str, Any]] = None, 
+        self.backend = 'requests'
+        self._async_client = None
+        if backend == 'async':
+            if AsyncHttpClient.is_available():
+                self._async_client = AsyncHttpClient()
+                self._async_client.configure(
+                    timeout=timeout,
+                    user_agent=user_agent,
+                    proxies=proxies,
+                    pool_size=pool_size,
+                    keepalive=keepalive,
+                    http2=http2
+                )
+                self.backend = 'async'
+            else:
+                self.logger.warning("httpx is not installed, falling back to the requests HTTP backend")
+        elif backend != 'requests':
+            raise ValueError(f"Unknown HTTP backend: {backend}")
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
             headers: Optional[Dict[str, str]] = None,
             auth: Optional[tuple] = None) -> requests.Response:
+        return self._with_retries(url, functools.partial(self._send_get, url, params, headers, auth))
+
+    async def aget(self, url: str, params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None,
+                   auth: Optional[tuple] = None) -> requests.Response:
+        if not self._async_client:
+            raise RuntimeError("Awaitable requests need the async HTTP backend (http.backend: async)")
+
+        for attempt in range(self.retries + 1):
+            await asyncio.sleep(self.rate_limiter.reserve(url))
+            started = time.perf_counter()
+            try:
+                response = await self._async_client.aget(url, params=params, headers=headers, auth=auth)
+            except self._retryable_errors() as e:
+                self._record(url, time.perf_counter() - started)
+                if attempt >= self.retries:
+                    raise
+                delay = self._retry_delay(url, attempt, error=e)
+            else:
+                self._record(url, time.perf_counter() - started, response)
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.retries:
+                    return response
+                delay = self._retry_delay(url, attempt, response=response)
+            self.metrics.record_retry(url)
+            await asyncio.sleep(delay)
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        # Runs the coroutine on the async backend's event loop, the only place aget() may be awaited
+        if not self._async_client:
+            coroutine.close()
+            raise RuntimeError("Awaitable requests need the async HTTP backend (http.backend: async)")
+        return self._async_client.submit(coroutine)
+
+    def _send_get(self, url: str, params: Optional[Dict[str, Any]],
+                  headers: Optional[Dict[str, str]], auth: Optional[tuple]) -> requests.Response:
+        if self._async_client:
+            return self._async_client.get(url, params=params, headers=headers, auth=auth)
+
         return HttpClient._session.get(
-            url, 
-            params=params, 
+            url,
+            params=params,
             headers=headers,
             auth=auth,
             timeout=self.timeout
         )
 
+    def _with_retries(self, url: str, send: Callable[[], requests.Response]) -> requests.Response:
+        for attempt in range(self.retries + 1):
+            time.sleep(self.rate_limiter.reserve(url))
+            started = time.perf_counter()
+            try:
+                response = send()
+            except self._retryable_errors() as e:
+                self._record(url, time.perf_counter() - started)
+                if attempt >= self.retries:
+                    raise
+                delay = self._retry_delay(url, attempt, error=e)
+            else:
+                self._record(url, time.perf_counter() - started, response)
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.retries:
+                    return response
+                delay = self._retry_delay(url, attempt, response=response)
+            self.metrics.record_retry(url)
+            time.sleep(delay)
+
+    def _record(self, url: str, seconds: float, response=None):
+        self.metrics.record_request(url, seconds, response)
+        self.health.record(url, seconds, response is not None and response.status_code not in RETRY_STATUS_CODES)
+
+    def _retryable_errors(self) -> tuple:
+        return (requests.ConnectionError, requests.Timeout) + AsyncHttpClient.transport_errors()
+
+    def _retry_delay(self, url: str, attempt: int, response=None, error: Optional[Exception] = None) -> float:
+        retry_after = self._parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if retry_after is not None:
+            delay = min(retry_after, self.max_backoff)
+            self.rate_limiter.pause(url, delay)
+        else:
+            ceiling = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+            delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+
+        reason = f"HTTP {response.status_code}" if response is not None else str(error)
+        self.logger.debug(f"Retrying {url} in {delay:.2f}s (attempt {attempt + 1}/{self.retries}): {reason}")
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
     def post(self, url: str, data: Optional[Dict[str, Any]] = None,
              json: Optional[Dict[str, Any]] = None,
              headers: Optional[Dict[str, str]] = None,
              auth: Optional[tuple] = None) -> requests.Response:
+        if self._async_client:
+            return self._async_client.post(url, data=data, json=json, headers=headers, auth=auth)
+
         return HttpClient._session.post(
             url,
             data=data,
@@ -47,4 +200,4 @@ class HttpClient:
             headers=headers,
             auth=auth,
             timeout=self.timeout
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,192 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+REGISTRY_COUNTERS = ('requests', 'errors', 'bytes', 'seconds', 'retries', 'cache_hits', 'cache_misses',
+                     'fetches', 'fetch_seconds')
+
+_OPENMETRICS_FAMILIES = (
+    ('requests', 'registry_requests', 'HTTP requests sent to the registry'),
+    ('errors', 'registry_errors', 'Requests that failed or returned an HTTP error status'),
+    ('bytes', 'registry_response_bytes', 'Response body bytes received'),
+    ('seconds', 'registry_request_seconds', 'Wall time spent waiting for responses'),
+    ('retries', 'registry_retries', 'Requests repeated after a retryable failure'),
+    ('cache_hits', 'registry_cache_hits', 'Registry documents served from the memory or disk cache'),
+    ('cache_misses', 'registry_cache_misses', 'Registry documents that had to be fetched'),
+    ('fetches', 'registry_fetches', 'Registry documents fetched'),
+    ('fetch_seconds', 'registry_fetch_seconds', 'Wall time spent fetching and parsing registry documents')
+)
+
+_scope: ContextVar[Tuple[str, str]] = ContextVar('sbom_libyear_metrics_scope', default=('', ''))
+
+
+class Metrics:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self._initialized = True
+            self.enabled = False
+            self._lock = threading.Lock()
+            self._phases: Dict[str, Dict[str, float]] = {}
+            self._registries: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def configure(self, enabled: bool):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._phases = {}
+            self._registries = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_phase(name, time.perf_counter() - started)
+
+    def timed(self, name: str, iterable: Iterable) -> Iterator:
+        if not self.enabled:
+            yield from iterable
+            return
+
+        # Only the time spent producing items counts, not the consumer's work in between
+        iterator = iter(iterable)
+        elapsed = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield item
+        finally:
+            self.record_phase(name, elapsed)
+
+    def record_phase(self, name: str, seconds: float, count: int = 1):
+        with self._lock:
+            totals = self._phases.setdefault(name, {'count': 0, 'seconds': 0.0})
+            totals['count'] += count
+            totals['seconds'] += seconds
+
+    @contextmanager
+    def scope(self, registry: str, repository: str = ''):
+        token = _scope.set((registry, repository or _scope.get()[1]))
+        try:
+            yield
+        finally:
+            _scope.reset(token)
+
+    def record_request(self, url: str, seconds: float, response: Any = None):
+        if self.enabled:
+            failed = response is None or response.status_code >= 400
+            size = len(response.content or b'') if response is not None else 0
+            self._add(url, requests=1, errors=int(failed), bytes=size, seconds=seconds)
+
+    def record_retry(self, url: str):
+        if self.enabled:
+            self._add(url, retries=1)
+
+    def record_cache(self, hit: bool):
+        if self.enabled:
+            self._add(None, cache_hits=int(hit), cache_misses=int(not hit))
+
+    def record_fetch(self, seconds: float):
+        if self.enabled:
+            self._add(None, fetches=1, fetch_seconds=seconds)
+
+    def _add(self, url: Optional[str], **counters: float):
+        registry, repository = _scope.get()
+        if not repository and url:
+            repository = urlsplit(url).netloc
+        key = (registry or 'unknown', repository or 'unknown')
+
+        with self._lock:
+            totals = self._registries.get(key)
+            if totals is None:
+                totals = self._registries[key] = dict.fromkeys(REGISTRY_COUNTERS, 0)
+            for name, value in counters.items():
+                totals[name] += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            registries: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for (registry, repository), totals in sorted(self._registries.items()):
+                registries.setdefault(registry, {})[repository] = dict(totals)
+            return {
+                'phases': {name: dict(totals) for name, totals in self._phases.items()},
+                'registries': registries
+            }
+
+    @staticmethod
+    def merge(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+        merged: Dict[str, Any] = {'phases': {}, 'registries': {}}
+        for snapshot in snapshots:
+            for name, totals in snapshot.get('phases', {}).items():
+                merged_totals = merged['phases'].setdefault(name, {'count': 0, 'seconds': 0.0})
+                for counter, value in totals.items():
+                    merged_totals[counter] = merged_totals.get(counter, 0) + value
+            for registry, repositories in snapshot.get('registries', {}).items():
+                for repository, totals in repositories.items():
+                    merged_totals = merged['registries'].setdefault(registry, {}).setdefault(
+                        repository, dict.fromkeys(REGISTRY_COUNTERS, 0)
+                    )
+                    for counter, value in totals.items():
+                        merged_totals[counter] = merged_totals.get(counter, 0) + value
+        return merged
+
+    @staticmethod
+    def to_openmetrics(snapshot: Dict[str, Any], prefix: str = 'sbom_libyear') -> str:
+        lines = [
+            f"# TYPE {prefix}_phase_seconds counter",
+            f"# HELP {prefix}_phase_seconds Wall time spent per pipeline phase, summed over threads",
+            f"# UNIT {prefix}_phase_seconds seconds"
+        ]
+        lines.extend(
+            f"{prefix}_phase_seconds_total{{phase=\"{_escape(name)}\"}} {totals['seconds']:.6f}"
+            for name, totals in snapshot['phases'].items()
+        )
+        lines.extend([f"# TYPE {prefix}_phase_calls counter", f"# HELP {prefix}_phase_calls Times each phase ran"])
+        lines.extend(
+            f"{prefix}_phase_calls_total{{phase=\"{_escape(name)}\"}} {totals['count']}"
+            for name, totals in snapshot['phases'].items()
+        )
+
+        for counter, family, help_text in _OPENMETRICS_FAMILIES:
+            lines.extend([f"# TYPE {prefix}_{family} counter", f"# HELP {prefix}_{family} {help_text}"])
+            if counter.endswith('seconds'):
+                lines.append(f"# UNIT {prefix}_{family} seconds")
+            for registry, repositories in snapshot['registries'].items():
+                for repository, totals in repositories.items():
+                    value = totals.get(counter, 0)
+                    value = f"{value:.6f}" if isinstance(value, float) else str(value)
+                    lines.append(
+                        f"{prefix}_{family}_total{{registry=\"{_escape(registry)}\","
+                        f"repository=\"{_escape(repository)}\"}} {value}"
+                    )
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
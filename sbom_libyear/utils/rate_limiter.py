@@ -0,0 +1,64 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    def __init__(self, rate: Optional[float], capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity else max(rate or 0.0, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self.paused_until - now)
+            if not self.rate:
+                return delay
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens < 0:
+                delay = max(delay, -self.tokens / self.rate)
+            return delay
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    def __init__(self, rates: Optional[Dict[str, float]] = None):
+        self.rates: Dict[str, float] = {}
+        self.default_rate: Optional[float] = None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.configure(rates)
+
+    def configure(self, rates: Optional[Dict[str, float]]) -> None:
+        rates = dict(rates or {})
+        with self._lock:
+            self.default_rate = rates.pop('default', None)
+            self.rates = {host.lower(): float(rate) for host, rate in rates.items() if rate}
+            self._buckets = {}
+
+    def reserve(self, url: str) -> float:
+        return self._bucket_for(url).reserve()
+
+    def pause(self, url: str, seconds: float) -> None:
+        self._bucket_for(url).pause(seconds)
+
+    def _bucket_for(self, url: str) -> TokenBucket:
+        host = (urlsplit(url).hostname or '').lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate = self.rates.get(host, self.default_rate)
+                bucket = TokenBucket(float(rate) if rate else None)
+                self._buckets[host] = bucket
+            return bucket
@@ -0,0 +1,169 @@
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+MAGIC = b'SLYRIDX1'
+
+_HEADER = struct.Struct('<8sIQQQQ')
+_PACKAGE = struct.Struct('<QIIII')
+_VERSION = struct.Struct('<QIq')
+
+NO_LATEST = 0xFFFFFFFF
+UNKNOWN_DATE = -(2 ** 63)
+
+
+class ReleaseIndexWriter:
+    def __init__(self):
+        self._packages: Dict[bytes, Dict[str, int]] = {}
+        self._latest: Dict[bytes, str] = {}
+
+    def add(self, ecosystem: str, package_key: str, version: str, released: Optional[int]) -> None:
+        versions = self._packages.setdefault(self._key(ecosystem, package_key), {})
+        if released is None:
+            versions.setdefault(version, UNKNOWN_DATE)
+        elif versions.get(version, UNKNOWN_DATE) == UNKNOWN_DATE or released < versions[version]:
+            versions[version] = released
+
+    def set_latest(self, ecosystem: str, package_key: str, version: str) -> None:
+        self._latest[self._key(ecosystem, package_key)] = version
+
+    def packages(self):
+        for key, versions in self._packages.items():
+            ecosystem, _, package_key = key.decode('utf-8').partition('\0')
+            yield ecosystem, package_key, versions
+
+    def has_latest(self, ecosystem: str, package_key: str) -> bool:
+        return self._key(ecosystem, package_key) in self._latest
+
+    def write(self, path: str) -> Tuple[int, int]:
+        strings = bytearray()
+        package_table = bytearray()
+        version_table = bytearray()
+        version_count = 0
+
+        for key in sorted(self._packages):
+            versions = self._packages[key]
+            encoded = sorted((version.encode('utf-8'), released) for version, released in versions.items())
+            latest = self._latest.get(key)
+            latest_index = NO_LATEST
+
+            key_offset = len(strings)
+            strings += key
+            for index, (version, released) in enumerate(encoded):
+                if latest is not None and version == latest.encode('utf-8'):
+                    latest_index = index
+                version_table += _VERSION.pack(len(strings), len(version), released)
+                strings += version
+
+            package_table += _PACKAGE.pack(key_offset, len(key), version_count, len(encoded), latest_index)
+            version_count += len(encoded)
+
+        packages_offset = _HEADER.size
+        versions_offset = packages_offset + len(package_table)
+        strings_offset = versions_offset + len(version_table)
+        header = _HEADER.pack(MAGIC, len(self._packages), version_count,
+                              packages_offset, versions_offset, strings_offset)
+
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(target.parent), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as index_file:
+                index_file.write(header)
+                index_file.write(package_table)
+                index_file.write(version_table)
+                index_file.write(strings)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        return len(self._packages), version_count
+
+    @staticmethod
+    def _key(ecosystem: str, package_key: str) -> bytes:
+        return f"{ecosystem}\0{package_key}".encode('utf-8')
+
+
+class ReleaseIndex:
+    def __init__(self, path: str):
+        self.path = Path(path).expanduser()
+        with open(self.path, 'rb') as index_file:
+            self._mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"Not a release index: {self.path}")
+        (magic, self.package_count, self.version_count,
+         self._packages_offset, self._versions_offset, self._strings_offset) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a release index: {self.path}")
+
+    def lookup(self, ecosystem: str, package_key: str,
+               version: str) -> Optional[Tuple[Optional[datetime], Optional[datetime], Optional[str]]]:
+        package = self._find_package(f"{ecosystem}\0{package_key}".encode('utf-8'))
+        if package is None:
+            return None
+
+        first_version, count, latest_index = package
+        current_index = self._find_version(first_version, count, version.encode('utf-8'))
+
+        current_date = self._released(first_version + current_index) if current_index is not None else None
+        latest_version = None
+        latest_date = None
+        if latest_index != NO_LATEST:
+            latest_version = self._version_string(first_version + latest_index)
+            latest_date = self._released(first_version + latest_index)
+
+        return current_date, latest_date, latest_version
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _find_package(self, key: bytes) -> Optional[Tuple[int, int, int]]:
+        low, high = 0, self.package_count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, first_version, count, latest_index = _PACKAGE.unpack_from(
+                self._mmap, self._packages_offset + middle * _PACKAGE.size
+            )
+            start = self._strings_offset + key_offset
+            candidate = self._mmap[start:start + key_length]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return first_version, count, latest_index
+        return None
+
+    def _find_version(self, first_version: int, count: int, version: bytes) -> Optional[int]:
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self._version_bytes(first_version + middle)
+            if candidate < version:
+                low = middle + 1
+            elif candidate > version:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def _version_bytes(self, index: int) -> bytes:
+        offset, length, _ = _VERSION.unpack_from(self._mmap, self._versions_offset + index * _VERSION.size)
+        start = self._strings_offset + offset
+        return self._mmap[start:start + length]
+
+    def _version_string(self, index: int) -> str:
+        return self._version_bytes(index).decode('utf-8')
+
+    def _released(self, index: int) -> Optional[datetime]:
+        _, _, released = _VERSION.unpack_from(self._mmap, self._versions_offset + index * _VERSION.size)
+        if released == UNKNOWN_DATE:
+            return None
+        return datetime.fromtimestamp(released, tz=timezone.utc)
@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Dict, List, Optional, TypeVar
+from urllib.parse import urlsplit
+
+T = TypeVar('T')
+
+
+class HostHealth:
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.samples = 0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probing = False
+
+    def record(self, seconds: float, ok: bool, failure_threshold: int, cooldown: float) -> None:
+        self.samples += 1
+        self.error_rate += self.alpha * ((0.0 if ok else 1.0) - self.error_rate)
+        if ok:
+            self.latency = seconds if self.latency is None else self.latency + self.alpha * (seconds - self.latency)
+            self.consecutive_failures = 0
+            self.open_until = 0.0
+        else:
+            self.consecutive_failures += 1
+            if self.probing or self.consecutive_failures >= failure_threshold:
+                self.open_until = time.monotonic() + cooldown
+        self.probing = False
+
+    def is_open(self) -> bool:
+        return self.open_until > time.monotonic()
+
+
+class RepositoryHealth:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self._initialized = True
+            self.alpha = 0.3
+            self.failure_threshold = 5
+            self.cooldown = 30.0
+            self.max_error_rate = 0.5
+            self.hedge = 1
+            self.hedge_delay: Optional[float] = None
+            self._hosts: Dict[str, HostHealth] = {}
+            self._lock = threading.Lock()
+
+    def configure(self, alpha: float = 0.3, failure_threshold: int = 5, cooldown: float = 30.0,
+                  max_error_rate: float = 0.5, hedge: int = 1, hedge_delay: Optional[float] = None):
+        self.alpha = alpha
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = cooldown
+        self.max_error_rate = max_error_rate
+        self.hedge = max(1, int(hedge))
+        self.hedge_delay = hedge_delay
+        with self._lock:
+            self._hosts = {}
+
+    def record(self, url: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._host_for(url).record(seconds, ok, self.failure_threshold, self.cooldown)
+
+    def available(self, url: str) -> bool:
+        with self._lock:
+            host = self._host_for(url)
+            if not host.open_until:
+                return True
+            if host.is_open() or host.probing:
+                return False
+            # Half-open: let a single request through to find out whether the host recovered
+            host.probing = True
+            return True
+
+    def blocked(self, url: str) -> bool:
+        # Same answer as available() without claiming the half-open trial request
+        with self._lock:
+            host = self._host_for(url)
+            return host.is_open() or (bool(host.open_until) and host.probing)
+
+    def latency(self, url: str) -> Optional[float]:
+        with self._lock:
+            return self._host_for(url).latency
+
+    def order(self, repositories: List[T], preferred: Optional[str] = None) -> List[T]:
+        healthy, degraded, broken = [], [], []
+        with self._lock:
+            for position, repository in enumerate(repositories):
+                host = self._host_for(repository.url)
+                rank = (repository.name != preferred, repository.priority, host.latency or 0.0, position)
+                if host.is_open():
+                    broken.append((rank, repository))
+                elif host.samples >= self.failure_threshold and host.error_rate > self.max_error_rate:
+                    degraded.append((rank, repository))
+                else:
+                    healthy.append((rank, repository))
+
+        ordered = [repository for _, repository in sorted(healthy, key=lambda item: item[0])]
+        ordered.extend(repository for _, repository in sorted(degraded, key=lambda item: item[0]))
+        # Repositories behind an open circuit come last, lookups only try them when every circuit is open
+        ordered.extend(repository for _, repository in sorted(broken, key=lambda item: item[0]))
+        return ordered
+
+    def _host_for(self, url: str) -> HostHealth:
+        host = urlsplit(url).netloc.lower()
+        health = self._hosts.get(host)
+        if health is None:
+            health = self._hosts[host] = HostHealth(self.alpha)
+        return health
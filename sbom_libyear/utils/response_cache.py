@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class ResponseCache:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self._initialized = True
+            self.logger = logging.getLogger(self.__class__.__name__)
+            self.enabled = False
+            self.refresh = False
+            self.ttl = 3600
+            self.max_size = 512 * 1024 * 1024
+            self.directory = Path('~/.cache/sbom-libyear').expanduser()
+            self._lock = threading.Lock()
+            self._total_size: Optional[int] = None
+
+    def configure(self, enabled: bool, ttl: int, directory: str,
+                  max_size_mb: Optional[float] = None, refresh: bool = False):
+        self.enabled = enabled
+        self.refresh = refresh
+        self.ttl = ttl
+        self.directory = Path(directory).expanduser()
+        if max_size_mb is not None:
+            self.max_size = int(max_size_mb * 1024 * 1024)
+        self._total_size = None
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        entry = self._read(namespace, key)
+        if entry is None or time.time() - entry.get('stored_at', 0) > self.ttl:
+            return None
+        return entry.get('value')
+
+    def get_stale(self, namespace: str, key: str) -> Optional[Any]:
+        entry = self._read(namespace, key)
+        return entry.get('value') if entry is not None else None
+
+    def _read(self, namespace: str, key: str) -> Optional[dict]:
+        if not self.enabled or self.refresh:
+            return None
+
+        path = self._path_for(namespace, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get('key') != key:
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        if not self.enabled or value is None:
+            return
+
+        path = self._path_for(namespace, key)
+        entry = {'key': key, 'stored_at': time.time(), 'value': value}
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous_size = path.stat().st_size if path.exists() else 0
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+                json.dump(entry, tmp_file, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, path)
+            self._account(path.stat().st_size - previous_size)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Failed to write cache entry {namespace}/{key}: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._total_size = 0
+
+    def _path_for(self, namespace: str, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / namespace / digest[:2] / f"{digest}.json"
+
+    def _entries(self):
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob('*/*/*.json'))
+
+    def _account(self, size_delta: int) -> None:
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(self._safe_size(p) for p in self._entries())
+            else:
+                self._total_size += size_delta
+
+            if self._total_size > self.max_size:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_size * 0.9)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+                evicted += 1
+            except OSError:
+                continue
+
+        self._total_size = total
+        self.logger.debug(f"Evicted {evicted} cache entries, cache size now {total} bytes")
+
+    @staticmethod
+    def _safe_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
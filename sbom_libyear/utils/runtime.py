@@ -0,0 +1,45 @@
+from typing import Optional
+
+from .config_loader import ConfigLoader
+from .http_client import HttpClient
+from .repository_health import RepositoryHealth
+from .response_cache import ResponseCache
+
+
+def configure_http_client(config_loader: ConfigLoader, workers: Optional[int] = None,
+                          processes: int = 1) -> HttpClient:
+    http_config = config_loader.get_http_config()
+    proxy_config = config_loader.get_proxy_config()
+    rate_limits = http_config.get('rate_limits') or {}
+    if processes > 1:
+        # Every process has its own limiter, so each one gets an equal share of the per-host rate
+        rate_limits = {host: rate / processes if rate else rate for host, rate in rate_limits.items()}
+    http_client = HttpClient()
+    http_client.configure(
+        timeout=http_config.get('timeout', 10),
+        user_agent=http_config.get('user_agent', 'sbom-libyear-calculator/1.0'),
+        proxies=proxy_config,
+        pool_size=http_config.get('pool_size') or workers or http_config.get('workers'),
+        backend=http_config.get('backend', 'requests'),
+        keepalive=http_config.get('keepalive'),
+        http2=http_config.get('http2', True),
+        retries=http_config.get('retries', 0),
+        backoff_factor=http_config.get('backoff_factor', 0.5),
+        max_backoff=http_config.get('max_backoff', 60),
+        rate_limits=rate_limits
+    )
+    RepositoryHealth().configure(**(http_config.get('health') or {}))
+    return http_client
+
+
+def configure_cache(config_loader: ConfigLoader, no_cache: bool = False, refresh: bool = False) -> ResponseCache:
+    cache_config = config_loader.get_cache_config()
+    cache = ResponseCache()
+    cache.configure(
+        enabled=cache_config.get('enabled', False) and not no_cache,
+        ttl=cache_config.get('ttl', 3600),
+        directory=cache_config.get('directory', '~/.cache/sbom-libyear'),
+        max_size_mb=cache_config.get('max_size_mb'),
+        refresh=refresh
+    )
+    return cache
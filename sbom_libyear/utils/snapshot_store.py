@@ -0,0 +1,120 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS releases (
+    package_type TEXT NOT NULL,
+    package_key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    released_at TEXT,
+    latest_released_at TEXT,
+    latest_version TEXT,
+    PRIMARY KEY (package_type, package_key, version)
+) WITHOUT ROWID;
+"""
+
+PackageInfo = Tuple[Optional[datetime], Optional[datetime], Optional[str]]
+
+
+class SnapshotStore:
+    def __init__(self, path: str, writable: bool = False):
+        self.path = Path(path).expanduser()
+        self.writable = writable
+        self._local = threading.local()
+
+        if writable:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connection() as connection:
+                connection.executescript(_SCHEMA)
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+                )
+        elif not self.path.is_file():
+            raise FileNotFoundError(f"Snapshot not found: {self.path}")
+        else:
+            version = self.get_meta('schema_version')
+            if version != str(SCHEMA_VERSION):
+                raise ValueError(f"Unsupported snapshot schema version {version} in {self.path}")
+
+    def lookup(self, package_type: str, package_key: str, version: str) -> Optional[PackageInfo]:
+        row = self._connection().execute(
+            "SELECT released_at, latest_released_at, latest_version FROM releases "
+            "WHERE package_type = ? AND package_key = ? AND version = ?",
+            (package_type, package_key, version)
+        ).fetchone()
+        if row is None:
+            return None
+
+        current_date, latest_date, latest_version = row
+        return self._parse_date(current_date), self._parse_date(latest_date), latest_version
+
+    def store(self, rows: Iterable[Tuple[str, str, str, PackageInfo]]) -> int:
+        records = [
+            (package_type, package_key, version,
+             current_date.isoformat() if current_date else None,
+             latest_date.isoformat() if latest_date else None,
+             latest_version)
+            for package_type, package_key, version, (current_date, latest_date, latest_version) in rows
+        ]
+
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO releases "
+                "(package_type, package_key, version, released_at, latest_released_at, latest_version) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                records
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('updated_at', ?)", (str(int(time.time())),)
+            )
+        return len(records)
+
+    def merge(self, other_path: str) -> int:
+        other = SnapshotStore(other_path)
+        other.close()
+        with self._connection() as connection:
+            connection.execute("ATTACH DATABASE ? AS other", (str(other.path),))
+            try:
+                cursor = connection.execute("INSERT OR REPLACE INTO releases SELECT * FROM other.releases")
+                merged = cursor.rowcount
+            finally:
+                connection.commit()
+                connection.execute("DETACH DATABASE other")
+        return merged
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM releases").fetchone()[0]
+
+    def close(self) -> None:
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self.writable:
+                connection = sqlite3.connect(str(self.path))
+            else:
+                connection = sqlite3.connect(Path(self.path).resolve().as_uri() + '?mode=ro', uri=True)
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _parse_date(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value else None
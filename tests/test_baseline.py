@@ -0,0 +1,153 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sbom_libyear.core import Baseline
+from sbom_libyear.models import Component, LibyearResult
+
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def entry(name, version, years_behind, purl=None, package_type='npm', error=None, checked_at=NOW):
+    return {
+        'name': name,
+        'package_type': package_type,
+        'current_version': version,
+        'latest_version': '9.0.0',
+        'years_behind': years_behind,
+        'current_date': '2020-01-01T00:00:00+00:00',
+        'latest_date': '2023-01-01T00:00:00+00:00',
+        'purl': purl if purl is not None else f'pkg:{package_type}/{name}@{version}',
+        'error': error,
+        'checked_at': checked_at.isoformat() if checked_at else None
+    }
+
+
+def result(name, version, years_behind, package_type='npm', error=None, checked_at=None):
+    component = Component(name=name, version=version, package_type=package_type,
+                          purl=f'pkg:{package_type}/{name}@{version}')
+    return LibyearResult.from_dates(component, version, '9.0.0', None, None, years_behind,
+                                    error=error, checked_at=checked_at)
+
+
+@pytest.fixture
+def write_report(tmp_path):
+    def write(*entries):
+        path = tmp_path / 'previous.json'
+        path.write_text(json.dumps({'total_libyear': 0.0, 'components': list(entries)}), encoding='utf-8')
+        return str(path)
+    return write
+
+
+def test_reuse_returns_the_previous_result(write_report):
+    baseline = Baseline(write_report(entry('left-pad', '1.0.0', 3.0)))
+    component = Component(name='left-pad', version='1.0.0', package_type='npm', purl='pkg:npm/left-pad@1.0.0')
+
+    reused = baseline.reuse(component)
+
+    assert reused.component is component
+    assert reused.current_version == '1.0.0'
+    assert reused.latest_version == '9.0.0'
+    assert reused.years_behind == 3.0
+    assert reused.current_date == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert reused.latest_date == datetime(2023, 1, 1, tzinfo=timezone.utc)
+    assert reused.checked_at == NOW
+
+
+def test_reuse_matches_purls_without_version_and_qualifiers(write_report):
+    baseline = Baseline(write_report(entry('left-pad', '1.0.0', 3.0, purl='pkg:npm/left-pad@1.0.0?arch=any')))
+    component = Component(name='left-pad', version='1.0.0', package_type='npm', purl='pkg:npm/left-pad@1.0.0')
+
+    assert baseline.reuse(component) is not None
+
+
+def test_reuse_falls_back_to_type_and_name(write_report):
+    baseline = Baseline(write_report(entry('left-pad', '1.0.0', 3.0, purl='')))
+
+    assert baseline.reuse(Component(name='left-pad', version='1.0.0', package_type='npm')) is not None
+
+
+@pytest.mark.parametrize('component', [
+    Component(name='left-pad', version='1.1.0', package_type='npm', purl='pkg:npm/left-pad@1.1.0'),
+    Component(name='right-pad', version='1.0.0', package_type='npm', purl='pkg:npm/right-pad@1.0.0'),
+    Component(name='failed', version='1.0.0', package_type='npm', purl='pkg:npm/failed@1.0.0'),
+    Component(name='stale', version='1.0.0', package_type='npm', purl='pkg:npm/stale@1.0.0')
+])
+def test_reuse_skips_other_versions_errors_and_stale_entries(write_report, component):
+    baseline = Baseline(write_report(
+        entry('left-pad', '1.0.0', 3.0),
+        entry('failed', '1.0.0', 0.0, error='Package not found'),
+        entry('stale', '1.0.0', 1.0, checked_at=NOW - timedelta(days=8))
+    ))
+
+    assert baseline.reuse(component) is None
+
+
+def test_entries_without_checked_at_are_as_old_as_the_report(write_report):
+    path = write_report(entry('left-pad', '1.0.0', 3.0, checked_at=None))
+    component = Component(name='left-pad', version='1.0.0', package_type='npm', purl='pkg:npm/left-pad@1.0.0')
+
+    assert Baseline(path).reuse(component) is not None
+
+    old = (NOW - timedelta(days=30)).timestamp()
+    os.utime(path, (old, old))
+    assert Baseline(path).reuse(component) is None
+    assert Baseline(path, max_age_days=31).reuse(component) is not None
+
+
+def test_delta(write_report):
+    baseline = Baseline(write_report(
+        entry('unchanged', '1.0.0', 1.0),
+        entry('upgraded', '1.0.0', 2.0),
+        entry('drifted', '1.0.0', 0.5),
+        entry('removed', '1.0.0', 4.0),
+        entry('failed', '1.0.0', 0.0, error='Package not found')
+    ))
+    results = [
+        result('unchanged', '1.0.0', 1.0, checked_at=NOW - timedelta(days=1)),
+        result('upgraded', '2.0.0', 0.0),
+        result('drifted', '1.0.0', 1.5),
+        result('added', '3.0.0', 0.25),
+        result('failed', '1.0.0', 0.0, error='Package not found')
+    ]
+
+    delta = baseline.delta(results)
+
+    assert delta.baseline == baseline.report_path
+    assert delta.baseline_total_libyear == pytest.approx(7.5)
+    assert delta.total_libyear == pytest.approx(2.75)
+    assert delta.libyear_delta == pytest.approx(-4.75)
+    assert delta.reused_components == 1
+    assert delta.refreshed_components == 4
+    assert delta.added == [
+        {'name': 'added', 'purl': 'pkg:npm/added@3.0.0', 'versions': ['3.0.0'], 'years_behind': 0.25}
+    ]
+    assert delta.removed == [
+        {'name': 'removed', 'purl': 'pkg:npm/removed@1.0.0', 'versions': ['1.0.0'], 'years_behind': 4.0}
+    ]
+    # Largest change first
+    assert [change['name'] for change in delta.changed] == ['upgraded', 'drifted']
+    assert delta.changed[0] == {
+        'name': 'upgraded',
+        'purl': 'pkg:npm/upgraded@2.0.0',
+        'previous_versions': ['1.0.0'],
+        'versions': ['2.0.0'],
+        'previous_years_behind': 2.0,
+        'years_behind': 0.0,
+        'libyear_delta': -2.0
+    }
+    assert delta.changed[1]['libyear_delta'] == pytest.approx(1.0)
+
+
+def test_delta_groups_several_versions_of_a_package(write_report):
+    baseline = Baseline(write_report(entry('lodash', '4.17.20', 1.0), entry('lodash', '3.10.1', 5.0)))
+
+    delta = baseline.delta([result('lodash', '4.17.21', 0.5), result('lodash', '3.10.1', 5.0)])
+
+    assert delta.added == [] and delta.removed == []
+    assert delta.changed[0]['previous_versions'] == ['3.10.1', '4.17.20']
+    assert delta.changed[0]['versions'] == ['3.10.1', '4.17.21']
+    assert delta.changed[0]['libyear_delta'] == pytest.approx(-0.5)
@@ -0,0 +1,180 @@
+import csv
+import json
+
+import pytest
+
+from sbom_libyear.core import FleetAggregator
+from sbom_libyear.core import fleet_aggregate
+
+
+ROWS = {
+    'web': [
+        {'name': 'left-pad', 'package_type': 'npm', 'purl': 'pkg:npm/left-pad@1.0.0', 'years_behind': 3.0, 'error': None},
+        {'name': 'lodash', 'package_type': 'npm', 'purl': 'pkg:npm/lodash@4.17.20', 'years_behind': 1.0, 'error': None},
+        {'name': 'broken', 'package_type': 'npm', 'purl': 'pkg:npm/broken@0.1.0', 'years_behind': 0.0,
+         'error': 'Package not found'}
+    ],
+    'api': [
+        {'name': 'requests', 'package_type': 'pypi', 'purl': 'pkg:pypi/requests@2.0.0', 'years_behind': 8.0,
+         'error': None},
+        {'name': 'lodash', 'package_type': 'npm', 'purl': 'pkg:npm/lodash@4.17.21?x=1', 'years_behind': 0.0,
+         'error': None}
+    ],
+    'worker': [
+        {'name': 'requests', 'package_type': 'pypi', 'purl': 'pkg:pypi/requests@2.31.0', 'years_behind': 0.5,
+         'error': None},
+        {'name': 'local-tool', 'package_type': None, 'purl': None, 'years_behind': 2.0, 'error': None}
+    ]
+}
+
+
+@pytest.fixture
+def reports(tmp_path):
+    # The same fleet spread over every report format the aggregator reads
+    paths = []
+
+    path = tmp_path / 'web.json'
+    path.write_text(json.dumps({'total_libyear': 4.0, 'components': ROWS['web']}), encoding='utf-8')
+    paths.append(str(path))
+
+    path = tmp_path / 'api.ndjson'
+    path.write_text('\n'.join(json.dumps(row) for row in ROWS['api']) + '\n\n', encoding='utf-8')
+    paths.append(str(path))
+
+    path = tmp_path / 'worker.csv'
+    with open(path, 'w', encoding='utf-8', newline='') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=['sbom', 'name', 'package_type', 'purl', 'years_behind', 'error'])
+        writer.writeheader()
+        for row in ROWS['worker']:
+            writer.writerow({'sbom': 'worker', **{key: '' if value is None else value for key, value in row.items()}})
+    paths.append(str(path))
+
+    for ignored in ('summary.json', 'web.delta.json', '.hidden.json'):
+        (tmp_path / ignored).write_text('not a report', encoding='utf-8')
+        paths.append(str(tmp_path / ignored))
+    return paths
+
+
+@pytest.fixture(params=['vectorized', 'python'])
+def aggregator_class(request, monkeypatch):
+    if request.param == 'vectorized':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(fleet_aggregate, 'numpy', None)
+    return FleetAggregator
+
+
+def test_load_skips_summaries_deltas_and_hidden_files(reports, aggregator_class):
+    aggregator = aggregator_class()
+
+    assert aggregator.load(reports) == 7
+    assert aggregator.reports == 3
+
+
+def test_aggregate(reports, aggregator_class):
+    aggregator = aggregator_class()
+    aggregator.load(reports)
+
+    summary = aggregator.aggregate()
+
+    assert summary['reports'] == 3
+    assert summary['sboms'] == 3
+    assert summary['packages'] == 5
+    assert summary['components'] == 7
+    assert summary['failed_analyses'] == 1
+    assert summary['successful_analyses'] == 6
+    assert summary['total_libyear'] == pytest.approx(14.5)
+    assert summary['mean_libyear'] == pytest.approx(14.5 / 6)
+    assert summary['p50_libyear'] == pytest.approx(1.5)
+    assert summary['p95_libyear'] == pytest.approx(6.75)
+    assert summary['ranked_by'] == 'total_libyear'
+
+    by_sbom = {row['key']: row for row in summary['by_sbom']}
+    assert [row['key'] for row in summary['by_sbom']] == ['api', 'web', 'worker']
+    assert by_sbom['web']['components'] == 3
+    assert by_sbom['web']['failed_analyses'] == 1
+    assert by_sbom['web']['total_libyear'] == pytest.approx(4.0)
+    assert by_sbom['worker']['p50_libyear'] == pytest.approx(1.25)
+
+    by_type = {row['key']: row for row in summary['by_package_manager']}
+    assert set(by_type) == {'npm', 'pypi', 'unknown'}
+    assert by_type['npm']['components'] == 4
+    assert by_type['pypi']['total_libyear'] == pytest.approx(8.5)
+
+    # Versions and qualifiers are not part of a package's identity
+    packages = {row['key']: row for row in summary['top_packages']}
+    assert packages['pkg:npm/lodash']['components'] == 2
+    assert packages['pkg:pypi/requests']['total_libyear'] == pytest.approx(8.5)
+    assert packages['unknown:local-tool']['components'] == 1
+
+
+def test_groups_without_successful_analyses_have_no_statistics(reports, aggregator_class):
+    aggregator = aggregator_class()
+    aggregator.load(reports)
+
+    broken = next(row for row in aggregator.aggregate()['top_packages'] if row['key'] == 'pkg:npm/broken')
+
+    assert broken['successful_analyses'] == 0
+    assert broken['total_libyear'] == 0.0
+    assert broken['mean_libyear'] is None
+    assert broken['p50_libyear'] is None
+
+
+def test_top_packages_are_ranked_and_limited(reports, aggregator_class):
+    aggregator = aggregator_class(top=2, rank_by='mean_libyear')
+    aggregator.load(reports)
+
+    summary = aggregator.aggregate()
+
+    assert summary['ranked_by'] == 'mean_libyear'
+    assert [row['key'] for row in summary['top_packages']] == ['pkg:pypi/requests', 'pkg:npm/left-pad']
+
+
+def test_python_and_vectorized_aggregations_agree(reports, monkeypatch):
+    pytest.importorskip('numpy')
+    vectorized = FleetAggregator()
+    vectorized.load(reports)
+    expected = vectorized.aggregate()
+
+    monkeypatch.setattr(fleet_aggregate, 'numpy', None)
+    python = FleetAggregator()
+    python.load(reports)
+
+    assert _normalized(python.aggregate()) == _normalized(expected)
+
+
+def test_parquet_reports_match_row_reports(tmp_path, reports):
+    pyarrow = pytest.importorskip('pyarrow')
+    pytest.importorskip('numpy')
+    import pyarrow.parquet
+
+    rows = [{'sbom': sbom, **row} for sbom, sbom_rows in ROWS.items() for row in sbom_rows]
+    path = tmp_path / 'fleet.parquet'
+    pyarrow.parquet.write_table(pyarrow.Table.from_pylist(rows), str(path))
+
+    from_parquet = FleetAggregator()
+    assert from_parquet.load([str(path)]) == 7
+    from_rows = FleetAggregator()
+    from_rows.load(reports)
+
+    parquet_summary = _normalized(from_parquet.aggregate())
+    rows_summary = _normalized(from_rows.aggregate())
+    parquet_summary.pop('reports')
+    rows_summary.pop('reports')
+    assert parquet_summary == rows_summary
+
+
+def test_rejects_unknown_rankings():
+    with pytest.raises(ValueError, match='Unsupported ranking'):
+        FleetAggregator(rank_by='median')
+
+
+def _normalized(value):
+    # Rounds floats so summaries computed in different orders compare equal
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, dict):
+        return {key: _normalized(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalized(item) for item in value]
+    return value
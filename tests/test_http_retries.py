@@ -0,0 +1,193 @@
+import itertools
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from sbom_libyear.utils import HttpClient
+from sbom_libyear.utils import http_client, rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+_hosts = itertools.count()
+
+
+def response(status_code: int, retry_after=None) -> requests.Response:
+    fake = requests.Response()
+    fake.status_code = status_code
+    fake._content = b'{}'
+    if retry_after is not None:
+        fake.headers['Retry-After'] = retry_after
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(http_client, 'time', fake)
+    monkeypatch.setattr(rate_limiter, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def client(clock):
+    client = HttpClient()
+    client.configure(timeout=10, user_agent='sbom-libyear-tests', retries=3, backoff_factor=1.0, max_backoff=60.0)
+    yield client
+    client.configure(timeout=10, user_agent='sbom-libyear-calculator/1.0')
+
+
+@pytest.fixture
+def url():
+    # Every test talks to its own host, so failures never open another test's circuit
+    return f"https://registry-{next(_hosts)}.example.test/package"
+
+
+@pytest.fixture
+def send(client, monkeypatch):
+    def replay(*outcomes):
+        remaining = list(outcomes)
+        calls = []
+
+        def send_get(url, params, headers, auth):
+            calls.append(url)
+            outcome = remaining.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(client, '_send_get', send_get)
+        return calls
+    return replay
+
+
+def test_successful_response_is_not_retried(client, send, clock, url):
+    calls = send(response(200))
+
+    assert client.get(url).status_code == 200
+    assert len(calls) == 1
+    assert clock.sleeps == []
+
+
+def test_client_errors_are_not_retried(client, send, clock, url):
+    calls = send(response(404))
+
+    assert client.get(url).status_code == 404
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize('status_code', sorted(http_client.RETRY_STATUS_CODES))
+def test_retryable_status_codes_are_retried(client, send, url, status_code):
+    calls = send(response(status_code), response(200))
+
+    assert client.get(url).status_code == 200
+    assert len(calls) == 2
+
+
+def test_transport_errors_are_retried(client, send, url):
+    calls = send(requests.ConnectionError('reset'), requests.Timeout('slow'), response(200))
+
+    assert client.get(url).status_code == 200
+    assert len(calls) == 3
+
+
+def test_last_response_is_returned_when_retries_run_out(client, send, url):
+    calls = send(*[response(503)] * 4)
+
+    assert client.get(url).status_code == 503
+    assert len(calls) == 4
+
+
+def test_last_transport_error_is_raised_when_retries_run_out(client, send, url):
+    send(*[requests.ConnectionError('reset')] * 4)
+
+    with pytest.raises(requests.ConnectionError):
+        client.get(url)
+
+
+def test_retries_disabled(client, send, url):
+    client.retries = 0
+    calls = send(response(503), response(200))
+
+    assert client.get(url).status_code == 503
+    assert len(calls) == 1
+
+
+def test_backoff_is_exponential_with_jitter(client, send, clock, url, monkeypatch):
+    monkeypatch.setattr(http_client.random, 'uniform', lambda low, high: high)
+    send(response(500), response(502), response(504), response(200))
+
+    client.get(url)
+
+    # Full ceiling of backoff_factor * 2 ** attempt with the maximum jitter
+    assert clock.sleeps == [1.0, 2.0, 4.0]
+
+
+def test_backoff_jitter_stays_within_half_to_full_ceiling(client):
+    for attempt in range(8):
+        ceiling = min(client.max_backoff, client.backoff_factor * 2 ** attempt)
+        for _ in range(20):
+            assert ceiling / 2 <= client._retry_delay('https://example.test', attempt, error=OSError()) <= ceiling
+
+
+def test_backoff_is_capped(client, send, clock, url, monkeypatch):
+    monkeypatch.setattr(http_client.random, 'uniform', lambda low, high: high)
+    client.max_backoff = 3.0
+    send(response(503), response(503), response(503), response(200))
+
+    client.get(url)
+
+    assert clock.sleeps == [1.0, 2.0, 3.0]
+
+
+def test_retry_after_seconds_are_honoured(client, send, clock, url):
+    send(response(429, retry_after='7'), response(200))
+
+    assert client.get(url).status_code == 200
+    assert clock.sleeps == [7.0]
+
+
+def test_retry_after_pauses_the_host_for_other_requests(client, clock, url):
+    client._retry_delay(url, 0, response=response(429, retry_after='30'))
+
+    assert client.rate_limiter.reserve(url) == pytest.approx(30.0)
+    assert client.rate_limiter.reserve('https://elsewhere.example.test/') == 0.0
+
+
+def test_retry_after_is_capped_by_max_backoff(client, send, clock, url):
+    client.max_backoff = 5.0
+    send(response(503, retry_after='3600'), response(200))
+
+    client.get(url)
+
+    assert clock.sleeps == [5.0]
+
+
+def test_parse_retry_after():
+    parse = HttpClient._parse_retry_after
+
+    assert parse(None) is None
+    assert parse('') is None
+    assert parse('not a date') is None
+    assert parse('12') == 12.0
+    assert parse('-5') == 0.0
+    assert parse(format_datetime(datetime.now(timezone.utc) - timedelta(minutes=5), usegmt=True)) == 0.0
+    assert parse(format_datetime(datetime.now(timezone.utc) + timedelta(seconds=120), usegmt=True)) == \
+        pytest.approx(120, abs=2)
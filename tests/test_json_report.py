@@ -0,0 +1,95 @@
+import io
+import json
+from dataclasses import fields
+from datetime import datetime, timezone
+
+import pytest
+
+from sbom_libyear.models import Component, LibyearResult
+from sbom_libyear.reports import JSONReportGenerator
+from sbom_libyear.utils import Metrics
+
+
+def result(name, version, years_behind, package_type='npm', error=None):
+    component = Component(name=name, version=version, package_type=package_type,
+                          purl=f'pkg:{package_type}/{name}@{version}')
+    return LibyearResult.from_dates(
+        component, version, '9.0.0',
+        None if error else datetime(2020, 1, 1, tzinfo=timezone.utc),
+        None if error else datetime(2023, 6, 30, 12, tzinfo=timezone.utc),
+        years_behind, error=error, checked_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+
+
+RESULTS = [
+    result('left-pad', '1.0.0', 3.5),
+    result('requests', '2.0.0', 8.25, package_type='pypi'),
+    result('naïve "quoted" \\ name', '0.1', 0.0),
+    result('missing', '1.0.0', 0.0, error='Package not found:\n404'),
+    result('Newtonsoft.Json', '9.0.1', 6.0, package_type='nuget')
+]
+
+
+@pytest.fixture
+def metrics():
+    metrics = Metrics()
+    enabled = metrics.enabled
+    yield metrics
+    metrics.configure(enabled)
+
+
+def expected(generator, results, extra=None):
+    # The report json.dumps would produce if every row were rendered up front
+    report = generator._create_report_data(results)
+    report_data = {field.name: getattr(report, field.name) for field in fields(report)}
+    report_data['components'] = list(report.components)
+    report_data['errors'] = list(report.errors)
+    report_data.update(extra or {})
+    return json.dumps(report_data, indent=2, ensure_ascii=False, default=str)
+
+
+@pytest.mark.parametrize('results', [RESULTS, RESULTS[:1], [RESULTS[3]], []])
+def test_streamed_report_equals_json_dumps(metrics, results):
+    metrics.configure(False)
+    generator = JSONReportGenerator()
+
+    assert generator.generate(results) == expected(generator, results)
+
+
+def test_streamed_report_with_metrics_equals_json_dumps(metrics, monkeypatch):
+    metrics.configure(True)
+    snapshot = {'phases': {'parse': 0.25, 'lookup': 1.5}, 'hosts': {'registry.npmjs.org': {'requests': 3}}}
+    monkeypatch.setattr(Metrics, 'snapshot', lambda self: snapshot)
+    generator = JSONReportGenerator()
+
+    report = generator.generate(RESULTS)
+
+    assert report == expected(generator, RESULTS, {'metrics': snapshot})
+    assert json.loads(report)['metrics'] == snapshot
+
+
+def test_metrics_can_be_left_out(metrics):
+    metrics.configure(True)
+
+    assert 'metrics' not in json.loads(JSONReportGenerator(include_metrics=False).generate(RESULTS))
+
+
+def test_write_streams_to_the_given_file(metrics):
+    metrics.configure(False)
+    generator = JSONReportGenerator()
+    stream = io.StringIO()
+
+    generator.write(generator._create_report_data(RESULTS), stream)
+
+    report = json.loads(stream.getvalue())
+    assert report['total_components'] == 5
+    assert report['failed_analyses'] == 1
+    assert report['total_libyear'] == pytest.approx(17.75)
+    assert [row['name'] for row in report['components']] == [r.component.name for r in RESULTS]
+    assert report['errors'] == [{
+        'component': 'missing',
+        'package_type': 'npm',
+        'version': '1.0.0',
+        'error': 'Package not found:\n404',
+        'purl': 'pkg:npm/missing@1.0.0'
+    }]
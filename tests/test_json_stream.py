@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from sbom_libyear.parsers.json_stream import iter_json_array
+
+
+DOCUMENT = {
+    'bomFormat': 'CycloneDX',
+    'metadata': {'component': {'name': 'app', 'components': [{'name': 'nested'}]}},
+    'components': [
+        {'name': 'left-pad', 'version': '1.3.0', 'purl': 'pkg:npm/left-pad@1.3.0'},
+        {'name': 'quote "and" brace }]', 'version': '2.0', 'tags': ['a', '\\', 'é']},
+        {'name': 'numbers', 'values': [1, -2.5, 3e10, True, False, None]},
+        'scalar',
+        42
+    ],
+    'dependencies': []
+}
+
+
+def stream(document) -> io.StringIO:
+    return io.StringIO(json.dumps(document, indent=2, ensure_ascii=False))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 1 << 16])
+def test_yields_array_items_across_chunk_boundaries(chunk_size):
+    items = list(iter_json_array(stream(DOCUMENT), 'components', chunk_size=chunk_size))
+
+    assert items == DOCUMENT['components']
+
+
+def test_compact_document():
+    document = io.StringIO(json.dumps(DOCUMENT, separators=(',', ':')))
+
+    assert list(iter_json_array(document, 'components', chunk_size=5)) == DOCUMENT['components']
+
+
+def test_ignores_nested_keys_with_the_same_name():
+    document = {'metadata': {'components': [{'name': 'nested'}]}, 'components': [{'name': 'top'}]}
+
+    assert list(iter_json_array(stream(document), 'components', chunk_size=3)) == [{'name': 'top'}]
+
+
+def test_empty_array():
+    assert list(iter_json_array(stream(DOCUMENT), 'dependencies')) == []
+
+
+def test_missing_key_or_non_array_value_yields_nothing():
+    assert list(iter_json_array(stream(DOCUMENT), 'packages')) == []
+    assert list(iter_json_array(stream(DOCUMENT), 'bomFormat')) == []
+
+
+def test_rejects_documents_that_are_not_objects():
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('[1, 2, 3]'), 'components'))
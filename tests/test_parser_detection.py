@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from sbom_libyear.parsers import CycloneDXJSONParser, CycloneDXXMLParser, SBOMParserContext, SPDXJSONParser
+
+
+CYCLONEDX_JSON = json.dumps({
+    'bomFormat': 'CycloneDX',
+    'specVersion': '1.5',
+    'components': [
+        {'type': 'library', 'name': 'left-pad', 'version': '1.3.0', 'purl': 'pkg:npm/left-pad@1.3.0'},
+        {'type': 'library', 'name': 'requests', 'version': '2.31.0', 'purl': 'pkg:pypi/requests@2.31.0'}
+    ]
+}, indent=2)
+
+SPDX_JSON = json.dumps({
+    'spdxVersion': 'SPDX-2.3',
+    'SPDXID': 'SPDXRef-DOCUMENT',
+    'packages': [
+        {
+            'SPDXID': 'SPDXRef-Package-left-pad',
+            'name': 'left-pad',
+            'versionInfo': '1.3.0',
+            'externalRefs': [{
+                'referenceCategory': 'PACKAGE-MANAGER',
+                'referenceType': 'purl',
+                'referenceLocator': 'pkg:npm/left-pad@1.3.0'
+            }]
+        }
+    ]
+}, indent=2)
+
+CYCLONEDX_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<bom xmlns="http://cyclonedx.org/schema/bom/1.5" version="1">
+  <components>
+    <component type="library" name="commons-lang3" version="3.12.0"
+               purl="pkg:maven/org.apache.commons/commons-lang3@3.12.0"/>
+  </components>
+</bom>
+"""
+
+
+@pytest.fixture
+def context():
+    return SBOMParserContext()
+
+
+@pytest.mark.parametrize('content, parser_class', [
+    (CYCLONEDX_JSON, CycloneDXJSONParser),
+    (SPDX_JSON, SPDXJSONParser),
+    (CYCLONEDX_XML, CycloneDXXMLParser),
+    ('\n\n  ' + CYCLONEDX_JSON, CycloneDXJSONParser)
+])
+def test_detects_format_from_prefix(context, content, parser_class):
+    assert isinstance(context.detect_parser(content[:4096]), parser_class)
+
+
+def test_media_type_takes_precedence(context):
+    parser = context.detect_parser(CYCLONEDX_JSON, media_type='application/spdx+json; charset=utf-8')
+
+    assert isinstance(parser, SPDXJSONParser)
+
+
+def test_falls_back_to_filename_suffix(context):
+    assert isinstance(context.detect_parser('', filename='app.CDX.JSON'), CycloneDXJSONParser)
+    assert isinstance(context.detect_parser('', filename='app.spdx.json'), SPDXJSONParser)
+    assert isinstance(context.detect_parser('', filename='bom.xml'), CycloneDXXMLParser)
+
+
+def test_unknown_prefix_is_not_detected(context):
+    assert context.detect_parser('{"name": "not an sbom"}', filename='report.json') is None
+
+
+def test_detection_does_not_need_the_whole_document(context):
+    # The format markers must be found in the prefix; the rest of the document is never looked at
+    truncated = CYCLONEDX_JSON[:CYCLONEDX_JSON.index('"components"')]
+
+    assert isinstance(context.detect_parser(truncated), CycloneDXJSONParser)
+
+
+@pytest.mark.parametrize('content, names', [
+    (CYCLONEDX_JSON, ['left-pad', 'requests']),
+    (SPDX_JSON, ['left-pad']),
+    (CYCLONEDX_XML, ['commons-lang3'])
+])
+def test_parse_content(context, content, names):
+    assert [component.name for component in context.parse_content(content)] == names
+
+
+def test_parse_content_rejects_unknown_formats(context):
+    with pytest.raises(ValueError, match='SBOM format not recognized'):
+        context.parse_content('{"name": "not an sbom"}')
+
+
+@pytest.mark.parametrize('filename, content', [
+    ('app.cdx.json', CYCLONEDX_JSON),
+    ('app.spdx.json', SPDX_JSON),
+    ('app.cdx.xml', CYCLONEDX_XML)
+])
+def test_streamed_components_match_parsed_components(context, tmp_path, filename, content):
+    path = tmp_path / filename
+    path.write_text(content, encoding='utf-8')
+
+    assert list(context.iter_file(str(path))) == context.parse_file(str(path))
@@ -0,0 +1,61 @@
+import pytest
+
+from sbom_libyear.parsers import CycloneDXJSONParser
+
+
+@pytest.fixture
+def parser():
+    return CycloneDXJSONParser()
+
+
+@pytest.mark.parametrize('purl, expected', [
+    ('pkg:maven/org.apache.commons/commons-lang3@3.12.0', ('maven', 'org.apache.commons', 'commons-lang3')),
+    ('pkg:maven/org.apache.commons/commons-lang3', ('maven', 'org.apache.commons', 'commons-lang3')),
+    ('pkg:npm/left-pad@1.3.0', ('npm', 'left-pad', None)),
+    ('pkg:npm/%40angular/core@16.0.0', ('npm', '%40angular', 'core')),
+    ('pkg:pypi/requests@2.31.0', ('pypi', 'requests', None)),
+    ('pkg:nuget/Newtonsoft.Json@13.0.1', ('nuget', 'Newtonsoft.Json', None))
+])
+def test_splits_type_namespace_and_name(parser, purl, expected):
+    assert parser._parse_purl(purl) == expected
+
+
+@pytest.mark.parametrize('purl, expected', [
+    ('pkg:maven/org.example/lib@1.0?type=jar&classifier=sources', ('maven', 'org.example', 'lib')),
+    ('pkg:maven/org.example/lib@1.0#src/main', ('maven', 'org.example', 'lib')),
+    ('pkg:npm/left-pad@1.3.0?vcs_url=git%2Bhttps://github.com/a/b@main', ('npm', 'left-pad', None)),
+    ('pkg:maven/org.example/lib?repository_url=https://repo.example.org/maven@2', ('maven', 'org.example', 'lib'))
+])
+def test_ignores_version_qualifiers_and_subpath(parser, purl, expected):
+    assert parser._parse_purl(purl) == expected
+
+
+@pytest.mark.parametrize('purl, package_type', [
+    ('pkg:pip/requests@2.31.0', 'pypi'),
+    ('pkg:python/requests@2.31.0', 'pypi'),
+    ('pkg:node/left-pad@1.3.0', 'npm'),
+    ('pkg:javascript/left-pad@1.3.0', 'npm'),
+    ('pkg:dotnet/Newtonsoft.Json@13.0.1', 'nuget'),
+    ('pkg:java/org.example/lib@1.0', 'maven'),
+    ('pkg:java-archive/org.example/lib@1.0', 'maven'),
+    ('pkg:jenkins-plugin/org.jenkins-ci.plugins/git@5.0', 'maven'),
+    ('pkg:NPM/left-pad@1.3.0', 'npm')
+])
+def test_normalizes_type_aliases(parser, purl, package_type):
+    assert parser._parse_purl(purl)[0] == package_type
+
+
+@pytest.mark.parametrize('purl, package_type', [
+    ('pkg:generic/left-pad@1.3.0?repository_url=https://registry.npmjs.org', 'npm'),
+    ('pkg:generic/requests@2.31.0?download_url=https%3A%2F%2Ffiles.pythonhosted.org%2Fr.whl', 'pypi'),
+    ('pkg:generic/lib@1.0?download_url=https://repo.maven.apache.org/maven2/lib.jar', 'maven'),
+    ('pkg:generic/tool@1.0?download_url=https://example.org/tool.tar.gz', 'generic'),
+    ('pkg:generic/tool@1.0', 'generic')
+])
+def test_generic_purls_resolve_through_repository_qualifiers(parser, purl, package_type):
+    assert parser._parse_purl(purl)[0] == package_type
+
+
+@pytest.mark.parametrize('purl', ['', None, 'npm/left-pad@1.3.0', 'https://example.org/lib'])
+def test_rejects_strings_that_are_not_purls(parser, purl):
+    assert parser._parse_purl(purl) == ('unknown', None, None)
@@ -0,0 +1,90 @@
+import pytest
+
+from sbom_libyear.utils import rate_limiter
+from sbom_libyear.utils.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', fake)
+    return fake
+
+
+def test_unlimited_bucket_never_waits(clock):
+    bucket = TokenBucket(None)
+
+    assert [bucket.reserve() for _ in range(100)] == [0.0] * 100
+
+
+def test_bucket_spaces_requests_at_its_rate(clock):
+    bucket = TokenBucket(2.0)
+
+    delays = [bucket.reserve() for _ in range(5)]
+
+    # A full bucket lets a burst of `capacity` requests through, later ones queue behind each other
+    assert delays == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5])
+
+
+def test_bucket_refills_over_time(clock):
+    bucket = TokenBucket(1.0, capacity=3)
+    for _ in range(3):
+        assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now += 10
+    # Refills are capped at the capacity
+    assert [bucket.reserve() for _ in range(4)] == pytest.approx([0.0, 0.0, 0.0, 1.0])
+
+
+def test_pause_delays_every_reservation(clock):
+    bucket = TokenBucket(None)
+    bucket.pause(5)
+    bucket.pause(2)
+
+    assert bucket.reserve() == pytest.approx(5.0)
+    clock.now += 4
+    assert bucket.reserve() == pytest.approx(1.0)
+    clock.now += 1
+    assert bucket.reserve() == 0.0
+
+
+def test_limiter_keeps_a_bucket_per_host(clock):
+    limiter = RateLimiter({'Registry.NPMJS.org': 1, 'default': 10})
+
+    assert limiter.reserve('https://registry.npmjs.org/left-pad') == 0.0
+    assert limiter.reserve('https://REGISTRY.npmjs.org/lodash') == pytest.approx(1.0)
+    # Other hosts get the default rate and their own bucket
+    assert [limiter.reserve('https://pypi.org/pypi/requests/json') for _ in range(11)][-1] == pytest.approx(0.1)
+
+
+def test_limiter_without_rates_never_waits(clock):
+    limiter = RateLimiter()
+
+    assert [limiter.reserve('https://registry.npmjs.org/left-pad') for _ in range(50)] == [0.0] * 50
+
+
+def test_pause_only_affects_one_host(clock):
+    limiter = RateLimiter()
+    limiter.pause('https://registry.npmjs.org/left-pad', 30)
+
+    assert limiter.reserve('https://registry.npmjs.org/lodash') == pytest.approx(30.0)
+    assert limiter.reserve('https://pypi.org/pypi/requests/json') == 0.0
+
+
+def test_configure_replaces_rates_and_buckets(clock):
+    limiter = RateLimiter({'pypi.org': 1})
+    limiter.reserve('https://pypi.org/simple/requests/')
+
+    limiter.configure({'pypi.org': 0})
+
+    assert limiter.rates == {}
+    assert limiter.reserve('https://pypi.org/simple/requests/') == 0.0
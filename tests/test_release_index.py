@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from sbom_libyear.utils import ReleaseIndex, ReleaseIndexWriter
+
+
+def timestamp(*args) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp())
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    writer = ReleaseIndexWriter()
+    writer.add('npm', 'left-pad', '1.0.0', timestamp(2016, 3, 1))
+    writer.add('npm', 'left-pad', '1.3.0', timestamp(2018, 4, 9))
+    writer.set_latest('npm', 'left-pad', '1.3.0')
+    writer.add('maven', 'org.apache.commons:commons-lang3', '3.12.0', timestamp(2021, 2, 26))
+    writer.add('maven', 'org.apache.commons:commons-lang3', '3.14.0', timestamp(2023, 11, 18))
+    writer.add('maven', 'org.apache.commons:commons-lang3', '3.13.0', None)
+    writer.set_latest('maven', 'org.apache.commons:commons-lang3', '3.14.0')
+    writer.add('pypi', 'naïve-pkg', '0.1', timestamp(2020, 1, 1))
+
+    path = tmp_path / 'releases.idx'
+    assert writer.write(str(path)) == (3, 6)
+    return path
+
+
+@pytest.fixture
+def index(index_path):
+    release_index = ReleaseIndex(str(index_path))
+    yield release_index
+    release_index.close()
+
+
+def test_round_trip(index):
+    assert index.lookup('npm', 'left-pad', '1.0.0') == (
+        datetime(2016, 3, 1, tzinfo=timezone.utc),
+        datetime(2018, 4, 9, tzinfo=timezone.utc),
+        '1.3.0'
+    )
+    assert index.lookup('maven', 'org.apache.commons:commons-lang3', '3.12.0') == (
+        datetime(2021, 2, 26, tzinfo=timezone.utc),
+        datetime(2023, 11, 18, tzinfo=timezone.utc),
+        '3.14.0'
+    )
+
+
+def test_unknown_package(index):
+    assert index.lookup('npm', 'right-pad', '1.0.0') is None
+    assert index.lookup('pypi', 'left-pad', '1.0.0') is None
+
+
+def test_unknown_version_and_unknown_date(index):
+    assert index.lookup('npm', 'left-pad', '9.9.9')[0] is None
+    assert index.lookup('maven', 'org.apache.commons:commons-lang3', '3.13.0')[0] is None
+
+
+def test_package_without_latest_version(index):
+    assert index.lookup('pypi', 'naïve-pkg', '0.1') == (datetime(2020, 1, 1, tzinfo=timezone.utc), None, None)
+
+
+def test_earliest_release_date_wins(tmp_path):
+    writer = ReleaseIndexWriter()
+    writer.add('npm', 'left-pad', '1.0.0', None)
+    writer.add('npm', 'left-pad', '1.0.0', timestamp(2017, 1, 1))
+    writer.add('npm', 'left-pad', '1.0.0', timestamp(2016, 1, 1))
+    writer.add('npm', 'left-pad', '1.0.0', timestamp(2018, 1, 1))
+    writer.add('npm', 'left-pad', '1.0.0', None)
+    path = tmp_path / 'releases.idx'
+    writer.write(str(path))
+
+    index = ReleaseIndex(str(path))
+    try:
+        assert index.lookup('npm', 'left-pad', '1.0.0')[0] == datetime(2016, 1, 1, tzinfo=timezone.utc)
+    finally:
+        index.close()
+
+
+def test_many_packages_are_found_by_binary_search(tmp_path):
+    writer = ReleaseIndexWriter()
+    for number in range(500):
+        writer.add('npm', f'package-{number}', f'1.{number}.0', timestamp(2020, 1, 1) + number)
+        writer.set_latest('npm', f'package-{number}', f'1.{number}.0')
+    path = tmp_path / 'releases.idx'
+    writer.write(str(path))
+
+    index = ReleaseIndex(str(path))
+    try:
+        for number in (0, 1, 137, 250, 499):
+            current_date, _, latest_version = index.lookup('npm', f'package-{number}', f'1.{number}.0')
+            assert current_date.timestamp() == timestamp(2020, 1, 1) + number
+            assert latest_version == f'1.{number}.0'
+    finally:
+        index.close()
+
+
+def test_rejects_files_that_are_not_indexes(tmp_path):
+    path = tmp_path / 'releases.idx'
+    path.write_bytes(b'not a release index, just some bytes in a file' * 2)
+
+    with pytest.raises(ValueError, match='Not a release index'):
+        ReleaseIndex(str(path))